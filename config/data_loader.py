@@ -1,22 +1,155 @@
-"""Load static data from JSON. Used by tests and pages."""
-from pathlib import Path
+"""
+Test data from config JSON (static_data.json, register_data.json), parsed and validated once.
+Everything is turned into frozen dataclasses / read-only mappings (TEST_DATA) at import, so tests and pages
+share one object and never touch the files again. Missing keys or wrong types fail here, at load.
+"""
 import json
+from dataclasses import dataclass, fields, is_dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+_CONFIG_DIR = Path(__file__).resolve().parent
+_STATIC_DATA_PATH = _CONFIG_DIR / "static_data.json"
+_REGISTER_DATA_PATH = _CONFIG_DIR / "register_data.json"
+
+
+@dataclass(frozen=True)
+class RegisterUser:
+    first_name: str
+    last_name: str
+    email: str
+    password: str
+
+
+REGISTER_FIELDS = ("first_name", "last_name", "email", "password", "confirm_password")
+CASE_BASES = ("valid", "empty")
+GENDERS = ("male", "female")
+
+
+@dataclass(frozen=True)
+class RegisterCase:
+    """
+    One register-form validation case: start from the valid user or an empty form, override fields, optionally
+    select a gender, expect messages.
+    """
+    id: str
+    base: str
+    fields: Mapping[str, str]
+    expected: Mapping[str, str]
+    gender: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RegisterData:
+    valid: RegisterUser
+    forbidden_chars_name: str
+    validation_cases: Tuple[RegisterCase, ...]
+
+
+@dataclass(frozen=True)
+class SuiteData:
+    static: Mapping[str, Mapping[str, str]]
+    register: RegisterData
+
 
+def _build(cls, raw, where: str):
+    """Instantiate a frozen dataclass from JSON, checking that every field is present with the right type."""
+    if not isinstance(raw, dict):
+        raise ValueError(f"{where}: expected an object")
+    values = {}
+    for field in fields(cls):
+        if field.name not in raw:
+            raise ValueError(f"{where}: missing '{field.name}'")
+        value = raw[field.name]
+        if is_dataclass(field.type):
+            value = _build(field.type, value, f"{where}.{field.name}")
+        elif field.type == Tuple[RegisterCase, ...]:
+            value = _build_cases(value, f"{where}.{field.name}")
+        elif not isinstance(value, str):
+            raise ValueError(f"{where}.{field.name}: expected a string, got {type(value).__name__}")
+        values[field.name] = value
+    return cls(**values)
 
-_STATIC_DATA_PATH = Path(__file__).resolve().parent / "static_data.json"
-_cached: dict | None = None
 
+def _str_mapping(raw, where: str) -> Mapping[str, str]:
+    """{register field: string} as a read-only mapping; only the five form fields are allowed."""
+    if not isinstance(raw, dict) or not all(isinstance(v, str) for v in raw.values()):
+        raise ValueError(f"{where}: expected an object of strings")
+    unknown = set(raw) - set(REGISTER_FIELDS)
+    if unknown:
+        raise ValueError(f"{where}: unknown fields {sorted(unknown)}; expected {list(REGISTER_FIELDS)}")
+    return MappingProxyType(dict(raw))
 
-def get_static_data() -> dict:
-    """Load and cache static_data.json. Returns dict (e.g. Products.Build)."""
-    global _cached
-    if _cached is None:
-        with open(_STATIC_DATA_PATH, encoding="utf-8") as f:
-            _cached = json.load(f)
-    return _cached
+
+def _build_cases(raw, where: str) -> Tuple[RegisterCase, ...]:
+    """validation_cases list: unique ids, known base, known fields, known gender if any, at least one expected message."""
+    if not isinstance(raw, list):
+        raise ValueError(f"{where}: expected a list")
+    cases = []
+    for i, item in enumerate(raw):
+        at = f"{where}[{i}]"
+        if not isinstance(item, dict) or not isinstance(item.get("id"), str) or not item["id"]:
+            raise ValueError(f"{at}: expected an object with a non-empty 'id'")
+        if item.get("base") not in CASE_BASES:
+            raise ValueError(f"{at}: 'base' must be one of {CASE_BASES}")
+        if item.get("gender") not in (None,) + GENDERS:
+            raise ValueError(f"{at}: 'gender' must be one of {GENDERS} or left out")
+        expected = _str_mapping(item.get("expected"), f"{at}.expected")
+        if not expected:
+            raise ValueError(f"{at}: 'expected' has no messages")
+        overrides = _str_mapping(item.get("fields", {}), f"{at}.fields")
+        cases.append(RegisterCase(item["id"], item["base"], overrides, expected, item.get("gender")))
+    ids = [c.id for c in cases]
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"{where}: duplicate case ids")
+    return tuple(cases)
+
+
+def _freeze_static(raw, where: str) -> Mapping[str, Mapping[str, str]]:
+    """static_data.json: {section: {key: string}} as nested read-only mappings."""
+    if not isinstance(raw, dict):
+        raise ValueError(f"{where}: expected an object")
+    frozen = {}
+    for section, items in raw.items():
+        if section.startswith("_"):
+            continue
+        if not isinstance(items, dict) or not all(isinstance(v, str) for v in items.values()):
+            raise ValueError(f"{where}: section '{section}' must map keys to strings")
+        frozen[section] = MappingProxyType(dict(items))
+    return MappingProxyType(frozen)
+
+
+def parse_test_data(static_raw: dict, register_raw: dict) -> SuiteData:
+    """Validate raw JSON of both files. Raises ValueError on missing keys or wrong types."""
+    return SuiteData(
+        static=_freeze_static(static_raw, _STATIC_DATA_PATH.name),
+        register=_build(RegisterData, register_raw, _REGISTER_DATA_PATH.name),
+    )
+
+
+def load_test_data() -> SuiteData:
+    """Read and validate both JSON files."""
+    with open(_STATIC_DATA_PATH, encoding="utf-8") as f:
+        static_raw = json.load(f)
+    with open(_REGISTER_DATA_PATH, encoding="utf-8") as f:
+        register_raw = json.load(f)
+    return parse_test_data(static_raw, register_raw)
+
+
+TEST_DATA = load_test_data()
+
+
+def get_static_data() -> Mapping[str, Mapping[str, str]]:
+    """static_data.json as read-only mapping (e.g. Products.Build)."""
+    return TEST_DATA.static
 
 
 def get_value(section: str, key: str) -> str:
     """Get one value, e.g. get_value('Products', 'Build') -> 'Build'."""
-    data = get_static_data()
-    return data[section][key]
+    return TEST_DATA.static[section][key]
+
+
+def get_register_data() -> RegisterData:
+    """register_data.json as a frozen RegisterData (valid user, invalid inputs)."""
+    return TEST_DATA.register
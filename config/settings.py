@@ -1,8 +1,72 @@
 """Configuration for Demo Web Shop. Single source for URL and timeouts."""
+import os
+from pathlib import Path
 from typing import Final
 
-BASE_URL: Final[str] = "https://demowebshop.tricentis.com/"
+PUBLIC_BASE_URL: Final[str] = "https://demowebshop.tricentis.com/"
+# Run against the bundled stand-in shop (local_shop/, served from the test process) instead of the public site:
+# no network, deterministic data, fast page loads. Switch on with USE_LOCAL_SHOP=1.
+USE_LOCAL_SHOP: Final[bool] = os.environ.get("USE_LOCAL_SHOP", "") == "1"
+LOCAL_SHOP_HOST: Final[str] = "127.0.0.1"
+# One port per xdist worker (gw0 -> 8765, gw1 -> 8766, ...)
+LOCAL_SHOP_PORT: Final[int] = 8765 + int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:] or 0)
+# Record-and-replay HTTP cache (core/cache_proxy.py) in front of the public site. Switch on with HTTP_CACHE=1.
+# Which URLs are cached and for how long: config/http_cache_rules.json
+HTTP_CACHE: Final[bool] = os.environ.get("HTTP_CACHE", "") == "1"
+HTTP_CACHE_PORT: Final[int] = 8865 + int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:] or 0)
+# Shared by all workers and runs on this machine; least recently used entries are dropped above the size limit
+HTTP_CACHE_DIR: Final[Path] = Path.home() / ".cache" / "qa_automation" / "http_cache"
+HTTP_CACHE_MAX_BYTES: Final[int] = 200 * 1024 * 1024
+# Local shop wins over the cache proxy; without either the tests hit the public site directly
+BASE_URL: Final[str] = (
+    f"http://{LOCAL_SHOP_HOST}:{LOCAL_SHOP_PORT}/" if USE_LOCAL_SHOP
+    else f"http://{LOCAL_SHOP_HOST}:{HTTP_CACHE_PORT}/" if HTTP_CACHE
+    else PUBLIC_BASE_URL
+)
+# Default explicit wait (seconds) for BaseActions / page objects. The driver's own implicit wait is kept at 0.
 IMPLICIT_WAIT: Final[int] = 10
+# How often explicit waits re-check their condition (seconds)
+POLL_INTERVAL: Final[float] = 0.1
 PAGE_LOAD_TIMEOUT: Final[int] = 30
 # Short wait when we expect an element to be absent (e.g. "not logged in" checks)
 SHORT_WAIT: Final[int] = 2
+# Warm browsers kept for the whole session (0 = start a fresh Chrome for every test)
+DRIVER_POOL_SIZE: Final[int] = 1
+# Seconds a pooled browser may take to answer a health check / reset before it is recycled
+DRIVER_HEALTH_TIMEOUT: Final[int] = 5
+# Seconds acquire() waits for a pooled browser to be released before failing (a leaked or still-held browser)
+DRIVER_ACQUIRE_TIMEOUT: Final[int] = 120
+# Local chromedriver binary for offline runs (webdriver_manager and network are skipped). Empty = resolve automatically.
+CHROMEDRIVER_PATH: Final[str] = os.environ.get("CHROMEDRIVER_PATH", "")
+# Persistent {chrome_version: chromedriver_path} cache shared by all runs on this machine
+DRIVER_CACHE_FILE: Final[Path] = Path.home() / ".cache" / "qa_automation" / "chromedriver.json"
+# Browser launch profile: "default" (maximized, headed) or "lean" (headless, small footprint for CI)
+BROWSER_PROFILE: Final[str] = os.environ.get("BROWSER_PROFILE", "default")
+# Lean profile options
+LEAN_WINDOW_SIZE: Final[str] = "1366,768"
+LEAN_BLOCK_IMAGES: Final[bool] = True
+LEAN_BLOCK_FONTS: Final[bool] = True
+# Block static assets per test marker through Chrome DevTools (config/request_blocking.json); also --no-asset-blocking
+ASSET_BLOCKING: Final[bool] = os.environ.get("ASSET_BLOCKING", "1") == "1"
+# Read resource stats after every page load to report blocked requests and bytes saved (one extra script call per
+# load, so off by default); also --asset-stats
+ASSET_STATS: Final[bool] = os.environ.get("ASSET_STATS", "0") == "1"
+# Sizes of blockable assets learned on unblocked page loads, used to report bytes saved
+ASSET_SIZE_CACHE: Final[Path] = Path.home() / ".cache" / "qa_automation" / "asset_sizes.json"
+# Accounts created over HTTP (core.provisioning) per worker before the first login test needs one
+USER_POOL_SIZE: Final[int] = 2
+# Captured auth cookies are reused by logged_in_user tests for at most this many seconds, then captured again
+AUTH_SESSION_MAX_AGE: Final[int] = 1200
+# Full-catalog crawl (pytest --crawl): category pages fetched concurrently over HTTP, and a cap on pages per run
+CRAWL_WORKERS: Final[int] = int(os.environ.get("CRAWL_WORKERS", "4"))
+CRAWL_MAX_PAGES: Final[int] = 500
+# Number format of prices on the storefront (core.prices.FORMATS): decimal and thousands separators
+PRICE_LOCALE: Final[str] = os.environ.get("PRICE_LOCALE", "en-US")
+# Grid vs product details consistency checks: details pages fetched concurrently over HTTP
+DETAILS_FETCH_WORKERS: Final[int] = int(os.environ.get("DETAILS_FETCH_WORKERS", "8"))
+# Open reports/report.html in a browser after the run (also --open-report); never on CI / non-interactive runs
+OPEN_REPORT: Final[bool] = False
+# Logging: "console" (plain INFO), "queue" (async JSON lines per worker in reports/logs/) or
+# "quiet" (queue + per-action records kept in a ring buffer, attached to the report only on failure)
+LOG_MODE: Final[str] = os.environ.get("LOG_MODE", "console")
+LOG_RING_SIZE: Final[int] = 200
@@ -2,44 +2,173 @@
 Pytest hooks and fixtures. Driver for tests.
 """
 import logging
+import os
+import sys
 import time
+from functools import partial
 import webbrowser
 from pathlib import Path
 
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
 
-from config.settings import BASE_URL, IMPLICIT_WAIT, PAGE_LOAD_TIMEOUT
+from config.settings import (
+    ASSET_BLOCKING,
+    ASSET_STATS,
+    BASE_URL,
+    BROWSER_PROFILE,
+    CHROMEDRIVER_PATH,
+    DRIVER_POOL_SIZE,
+    HTTP_CACHE,
+    HTTP_CACHE_PORT,
+    LOCAL_SHOP_HOST,
+    LOCAL_SHOP_PORT,
+    LOG_MODE,
+    OPEN_REPORT,
+    SHORT_WAIT,
+    USE_LOCAL_SHOP,
+)
+from core import log_pipeline
+from core.auth_session import AuthSession
+from core.bug_reporter import write_bug_report
+from core.driver_factory import PROFILES, create_driver, resolve_driver_path
+from core.driver_handle import DriverHandle, load_page
+from core.driver_pool import DriverPool
+from core.provisioning import UserPool
+from core.request_blocking import BlockingRules, savings as blocking_savings, set_blocked_urls
+from core.timing import recorder as timing_recorder, write_report as write_timing_report
+from core.workers import worker_id
+from pages.catalog_crawl import crawl_catalog
+from pages.login_page import LoginPage
+from pages.register_page import RegisterPage, load_register_data
 
 _log = logging.getLogger(__name__)
 
-# Logging: show INFO in console so we see "Clicked on element ..." etc.
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    datefmt="%H:%M:%S",
-)
+
+def pytest_sessionstart(session):
+    """Remember session start so the report check can tell a fresh report from an old one."""
+    session.config._session_started_at = time.time()
+
+
+def _report_dir(config) -> Path:
+    """Folder of the HTML report (reports/ by default); JSON side reports are written next to it."""
+    htmlpath = getattr(config.option, "htmlpath", None) or "reports/report.html"
+    return (Path(config.rootpath) / htmlpath).parent
 
 
 def pytest_sessionfinish(session, exitstatus):
-    """After all tests: wait for pytest-html to write report, then open it in browser."""
-    report_path = Path(session.config.rootdir) / "reports" / "report.html"
-    time.sleep(2.5)  # Give pytest-html time to write the file
-    if report_path.is_file():
-        try:
-            webbrowser.open(report_path.as_uri())
-            _log.info("Opening HTML report in browser...")
-        except Exception as e:
-            _log.warning("Could not open report: %s. Open manually: reports/report.html", e)
-    else:
-        _log.warning("Report not found at %s. Open manually: reports/report.html", report_path)
+    """After all tests: workers dump raw timings; controller writes the bug report and reports/timings.json."""
+    report_dir = _report_dir(session.config)
+    blocking_savings.save()
+    if hasattr(session.config, "workerinput"):
+        # xdist worker: the controller process handles report and merged output
+        timing_recorder.dump_raw(report_dir / f"timings.{worker_id()}.raw.json")
+        return
+    write_bug_report()
+    path = write_timing_report(report_dir, timing_recorder.steps)
+    _log.info("Timing breakdown written to %s", path)
+
+
+def _is_interactive() -> bool:
+    """False on CI / headless runs where opening a browser window makes no sense."""
+    if os.environ.get("CI"):
+        return False
+    return sys.stdout.isatty()
+
+
+def pytest_unconfigure(config):
+    """
+    Runs after every pytest_sessionfinish hook, including pytest-html's, so the report is already written.
+    Opens it only with --open-report and only in an interactive terminal.
+    """
+    log_pipeline.shutdown_logging()
+    if hasattr(config, "workerinput") or not config.getoption("--open-report", default=False):
+        return
+    htmlpath = getattr(config.option, "htmlpath", None) or "reports/report.html"
+    report_path = Path(config.rootpath) / htmlpath
+    started = getattr(config, "_session_started_at", 0.0)
+    if not report_path.is_file() or report_path.stat().st_mtime < started:
+        _log.warning("Report not found at %s. Open manually: %s", report_path, htmlpath)
+        return
+    if not _is_interactive():
+        _log.info("Non-interactive run; not opening report. See %s", report_path)
+        return
+    try:
+        webbrowser.open(report_path.as_uri())
+        _log.info("Opening HTML report in browser...")
+    except Exception as e:
+        _log.warning("Could not open report: %s. Open manually: %s", e, htmlpath)
+
+
+def pytest_addoption(parser):
+    """Command line options for the driver fixture and report handling."""
+    parser.addoption(
+        "--pool-size",
+        type=int,
+        default=DRIVER_POOL_SIZE,
+        help="Warm browsers kept for the session (0 = fresh Chrome per test). Default from config.settings.",
+    )
+    parser.addoption(
+        "--chromedriver",
+        default=CHROMEDRIVER_PATH,
+        help="Path to a local chromedriver binary (offline mode, no webdriver_manager). Default: CHROMEDRIVER_PATH env.",
+    )
+    parser.addoption(
+        "--browser-profile",
+        choices=PROFILES,
+        default=BROWSER_PROFILE,
+        help="Chrome launch profile: default (maximized, headed) or lean (headless, eager load, images/fonts off).",
+    )
+    parser.addoption(
+        "--log-mode",
+        choices=log_pipeline.MODES,
+        default=LOG_MODE,
+        help="console: plain INFO logs; queue: async JSON logs per worker in reports/logs/; "
+        "quiet: queue + per-action logs only attached to failed tests.",
+    )
+    parser.addoption(
+        "--no-asset-blocking",
+        action="store_true",
+        default=not ASSET_BLOCKING,
+        help="Load every asset in every test (no per-marker request blocking from config/request_blocking.json).",
+    )
+    parser.addoption(
+        "--asset-stats",
+        action="store_true",
+        default=ASSET_STATS,
+        help="Report blocked requests and bytes saved by asset blocking (one extra script call per page load).",
+    )
+    parser.addoption(
+        "--crawl",
+        action="store_true",
+        default=False,
+        help="Run the full-catalog crawl tests (every category, page and sort order over HTTP; @pytest.mark.crawl).",
+    )
+    parser.addoption(
+        "--open-report",
+        action="store_true",
+        default=OPEN_REPORT,
+        help="Open the HTML report in a browser when the run ends (skipped on CI / non-interactive terminals).",
+    )
+
+
+def _enable_live_logging(config) -> None:
+    """
+    Turn on pytest's live console logging at log_cli_level from pytest.ini, unless --log-cli-level was given.
+    Same as passing --log-cli-level; must run before pytest's logging plugin is configured (trylast pytest_configure).
+    """
+    if config.option.log_cli_level is None:
+        config.option.log_cli_level = config.getini("log_cli_level") or "INFO"
 
 
 def pytest_configure(config):
-    """Register custom markers so pytest does not warn."""
+    """Set up logging (--log-mode) and asset blocking, register custom markers so pytest does not warn."""
+    log_mode = config.getoption("--log-mode")
+    log_pipeline.setup_logging(log_mode, _report_dir(config) / "logs")
+    if log_mode == "console":
+        # queue / quiet: records go to the per-worker JSON file only, no synchronous console handler on the side
+        _enable_live_logging(config)
+    if not config.getoption("--no-asset-blocking"):
+        blocking_savings.enable(BlockingRules(), measure=config.getoption("--asset-stats"))
     config.addinivalue_line("markers", "pa: run with -m pa to execute these tests.")
     config.addinivalue_line("markers", "ui: tests that use browser (driver fixture).")
     config.addinivalue_line("markers", "smoke: smoke / sanity tests.")
@@ -50,19 +179,190 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "sorting: sort options on category page.")
     config.addinivalue_line("markers", "register: user registration form tests.")
     config.addinivalue_line("markers", "login: login and logout tests.")
+    config.addinivalue_line("markers", "isolated_browser: give this test its own fresh Chrome instead of a pooled one.")
+    config.addinivalue_line("markers", "start_on_home: open the home page before the test starts (default: lazy).")
+    config.addinivalue_line("markers", "offline: no browser or network (stored page snapshots in tests/snapshots/, parsing rules).")
+    config.addinivalue_line("markers", "crawl: full-catalog crawl over HTTP; runs only with --crawl.")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Crawl tests fetch the whole catalog: skip them unless --crawl is given."""
+    if config.getoption("--crawl"):
+        return
+    skip_crawl = pytest.mark.skip(reason="full-catalog crawl runs only with --crawl")
+    for item in items:
+        if item.get_closest_marker("crawl"):
+            item.add_marker(skip_crawl)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Quiet log mode: attach the test's per-action log records to the report when it fails."""
+    outcome = yield
+    report = outcome.get_result()
+    if report.failed:
+        dump = log_pipeline.failure_dump()
+        if dump:
+            report.sections.append((f"BaseActions log ({report.when})", dump))
+
+
+@pytest.fixture(autouse=True)
+def _timing_test_id(request):
+    """Tag every timed step (core.timing) and log record with the running test id."""
+    timing_recorder.current_test = request.node.nodeid
+    log_pipeline.start_test()
+    yield
+    timing_recorder.current_test = ""
+
+
+@pytest.fixture(scope="session", autouse=True)
+def local_shop():
+    """With USE_LOCAL_SHOP=1: serve the stand-in Demo Web Shop at BASE_URL for the whole session (per worker)."""
+    if not USE_LOCAL_SHOP:
+        yield None
+        return
+    from local_shop import LocalShopServer
+    server = LocalShopServer(LOCAL_SHOP_HOST, LOCAL_SHOP_PORT).start()
+    _log.info("Local Demo Web Shop serving at %s", server.url)
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def http_cache():
+    """With HTTP_CACHE=1: record-and-replay proxy to the public site at BASE_URL for the session (per worker)."""
+    if USE_LOCAL_SHOP or not HTTP_CACHE:
+        yield None
+        return
+    from core.cache_proxy import CacheProxyServer
+    proxy = CacheProxyServer(LOCAL_SHOP_HOST, HTTP_CACHE_PORT).start()
+    _log.info("HTTP cache proxy serving at %s", proxy.url)
+    yield proxy
+    proxy.stop()
+    _log.info("HTTP cache: %s", proxy.stats)
+
+
+@pytest.fixture(scope="session")
+def driver_path(request):
+    """chromedriver path resolved once per session (local binary, persistent cache or webdriver_manager)."""
+    return resolve_driver_path(request.config.getoption("--chromedriver"))
+
+
+@pytest.fixture(scope="session")
+def driver_factory(request, driver_path):
+    """Callable that starts a Chrome with the session's driver path and launch profile."""
+    return partial(create_driver, driver_path, request.config.getoption("--browser-profile"))
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, driver_factory):
+    """Session pool of warm browsers, or None when --pool-size is 0."""
+    size = request.config.getoption("--pool-size")
+    if size <= 0:
+        yield None
+        return
+    pool = DriverPool(size, factory=driver_factory)
+    pool.warm()
+    yield pool
+    pool.close()
 
 
 @pytest.fixture(scope="function")
-def driver():
-    """Chrome WebDriver; opens BASE_URL. Quit after test."""
-    options = Options()
-    options.add_argument("--start-maximized")
-    service = Service(ChromeDriverManager().install())
-    browser = webdriver.Chrome(service=service, options=options)
-    browser.implicitly_wait(IMPLICIT_WAIT)
-    browser.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
-    _log.info("Opening URL: %s", BASE_URL)
-    browser.get(BASE_URL)
+def driver(request, driver_pool, driver_factory):
+    """
+    Chrome WebDriver, wrapped in a per-test DriverHandle. Tests marked start_on_home get BASE_URL loaded up front;
+    for the rest it is only loaded on the first use of the driver that needs a page, if the test has not navigated
+    anywhere by then (core.driver_handle). Requests matching the test's marker block list are blocked.
+    Pooled browser is reset after test, isolated one is quit.
+    """
+    isolated = driver_pool is None or request.node.get_closest_marker("isolated_browser") is not None
+    browser = driver_factory() if isolated else driver_pool.acquire()
+    start_on_home = request.node.get_closest_marker("start_on_home") is not None
+    handle = DriverHandle(browser, start_url=None if start_on_home else BASE_URL)
+    if blocking_savings.rules is not None:
+        set_blocked_urls(handle, blocking_savings.rules.patterns_for(m.name for m in request.node.iter_markers()))
+    if start_on_home:
+        _log.info("Opening URL: %s", BASE_URL)
+        load_page(handle, BASE_URL, "driver fixture")
+    yield handle
+    if isolated:
+        browser.quit()
+    else:
+        driver_pool.release(browser)
+
+
+@pytest.fixture(scope="module")
+def module_driver(driver_pool, driver_factory):
+    """One browser shared by all tests of a module (e.g. table-driven cases on one warm page). No start page."""
+    browser = driver_factory() if driver_pool is None else driver_pool.acquire()
     yield browser
-    time.sleep(2)  # Short pause to see result before closing (can be removed)
-    browser.quit()
+    if driver_pool is None:
+        browser.quit()
+    else:
+        driver_pool.release(browser)
+
+
+@pytest.fixture(scope="module")
+def register_form(module_driver):
+    """Register page opened once per module; cases reset the form in place (RegisterPage.run_validation_case)."""
+    page = RegisterPage(module_driver)
+    page.open_register()
+    return page
+
+
+def _ui_login(user_pool: UserPool, browser) -> dict:
+    """Log in through the UI with an account from the pool (held by the auth session until it drops the cookies)."""
+    creds = user_pool.checkout()
+    page = LoginPage(browser)
+    page.login_with(creds["email"], creds["password"])
+    if not page.is_logout_link_visible():
+        raise RuntimeError(f"UI login failed for {creds['email']}")
+    return creds
+
+
+def _ui_is_logged_in(browser) -> bool:
+    """Header shows Log out (loads the deferred start page if nothing was opened yet)."""
+    return LoginPage(browser).is_logout_link_visible(timeout=SHORT_WAIT)
+
+
+@pytest.fixture(scope="session")
+def user_pool():
+    """Per-process pool of accounts registered over HTTP (no browser), filled on first use."""
+    valid = load_register_data().valid
+    pool = UserPool(valid.first_name, valid.last_name, valid.password)
+    pool.fill()
+    return pool
+
+
+@pytest.fixture(scope="function")
+def provisioned_user(user_pool):
+    """An existing account (email, password) for this test only; returned to the pool afterwards."""
+    user = user_pool.checkout()
+    yield user
+    user_pool.checkin(user)
+
+
+@pytest.fixture(scope="session")
+def catalog_crawl():
+    """(CatalogIndex, CrawlStats) of one full-catalog crawl, shared by the crawl tests of this process."""
+    return crawl_catalog()
+
+
+@pytest.fixture(scope="session")
+def auth_session(user_pool):
+    """
+    Per-process cache of auth cookies (logs in through the UI once, then reuses the cookies). The account goes back
+    to the user pool when the cookies are dropped (logout, rejected, expired).
+    """
+    return AuthSession(partial(_ui_login, user_pool), _ui_is_logged_in, on_release=user_pool.checkin)
+
+
+@pytest.fixture(scope="function")
+def logged_in_user(driver, auth_session):
+    """
+    Browser of the driver fixture in a logged-in state; returns the user's credentials (email, password).
+    If the test logged out (auth cookie gone), the cached cookies are dropped so the next test logs in again, and
+    the account is checked back in to the user pool.
+    """
+    yield auth_session.apply(driver)
+    auth_session.release(driver)
@@ -0,0 +1,120 @@
+"""
+Logged-in state for tests without a UI login per test.
+The first test that needs it logs in once through the UI (login callable from conftest) and the auth cookies
+are captured; later tests in the same process get those cookies injected into their browser before the
+first page load. The first page load after injecting checks the server still accepts them (is_logged_in); if
+not, or once they expire or are older than AUTH_SESSION_MAX_AGE, they are captured again with a UI login.
+A test that logs out ends the session on the server: release() forgets the cookies after such a test.
+Whenever the cookies are dropped, the account is handed back (on_release, e.g. UserPool.checkin).
+"""
+import logging
+import threading
+import time
+from typing import Callable, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.settings import AUTH_SESSION_MAX_AGE, BASE_URL
+from core.driver_handle import DriverHandle, load_page
+
+logger = logging.getLogger(__name__)
+
+AUTH_COOKIE = "NOPCOMMERCE.AUTH"
+# Treat cookies expiring within this many seconds as already expired
+EXPIRY_MARGIN = 60
+
+
+def _to_cdp_cookie(cookie: dict) -> dict:
+    """Selenium get_cookies() entry -> Network.setCookie params."""
+    params = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "url": BASE_URL,
+        "path": cookie.get("path", "/"),
+        "secure": cookie.get("secure", False),
+        "httpOnly": cookie.get("httpOnly", False),
+    }
+    if cookie.get("domain"):
+        params["domain"] = cookie["domain"]
+    if cookie.get("expiry"):
+        params["expires"] = cookie["expiry"]
+    if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+        params["sameSite"] = cookie["sameSite"]
+    return params
+
+
+class AuthSession:
+    """Cached auth cookies for one user. apply(driver) leaves the browser logged in and returns the credentials."""
+
+    def __init__(
+        self,
+        login: Callable[[WebDriver], dict],
+        is_logged_in: Callable[[WebDriver], bool],
+        max_age: float = AUTH_SESSION_MAX_AGE,
+        on_release: Optional[Callable[[dict], None]] = None,
+    ) -> None:
+        self._login = login
+        self._is_logged_in = is_logged_in
+        self._on_release = on_release
+        self.max_age = max_age
+        self.credentials: Optional[dict] = None
+        self.cookies: List[dict] = []
+        self.captured_at = 0.0
+        self._lock = threading.RLock()
+
+    def is_valid(self) -> bool:
+        """True if cookies are cached, not older than max_age and the auth cookie does not expire soon."""
+        if not self.cookies or time.time() - self.captured_at > self.max_age:
+            return False
+        auth = next((c for c in self.cookies if c["name"] == AUTH_COOKIE), None)
+        if auth is None:
+            return False
+        expiry = auth.get("expiry")
+        return expiry is None or expiry > time.time() + EXPIRY_MARGIN
+
+    def apply(self, driver: DriverHandle) -> dict:
+        """
+        Inject cached cookies and confirm the logged-in state on the first page load; if there are no valid cookies
+        or the server no longer accepts them, log in through the UI and capture them.
+        """
+        with self._lock:
+            if self.is_valid():
+                for cookie in self.cookies:
+                    driver.execute_cdp_cmd("Network.setCookie", _to_cdp_cookie(cookie))
+                if driver.start_url is None and driver.current_url.startswith("http"):
+                    # A page was already loaded without the cookies: load it again so they are sent
+                    load_page(driver, driver.current_url, "auth_session")
+                if self._is_logged_in(driver):
+                    return self.credentials
+                logger.info("Server did not accept the cached auth cookies; logging in through the UI again")
+                self.invalidate()
+                driver.delete_all_cookies()
+            else:
+                logger.info("No valid auth cookies cached; logging in through the UI")
+                self.invalidate()
+            self.credentials = self._login(driver)
+            cookies = driver.get_cookies()
+            if not any(c["name"] == AUTH_COOKIE for c in cookies):
+                raise RuntimeError(f"Login did not set the {AUTH_COOKIE} cookie")
+            self.cookies = cookies
+            self.captured_at = time.time()
+            return self.credentials
+
+    def invalidate(self) -> None:
+        """Forget cookies (e.g. server rejected them) and hand the account back; the next apply() logs in again."""
+        with self._lock:
+            self.cookies = []
+            credentials, self.credentials = self.credentials, None
+            if credentials is not None and self._on_release is not None:
+                self._on_release(credentials)
+
+    def release(self, driver: WebDriver) -> None:
+        """After a test: forget the cookies if the browser no longer holds the cached auth cookie (test logged out)."""
+        with self._lock:
+            cached = next((c["value"] for c in self.cookies if c["name"] == AUTH_COOKIE), None)
+            if cached is None:
+                return
+            current = next((c["value"] for c in driver.get_cookies() if c["name"] == AUTH_COOKIE), None)
+            if current != cached:
+                logger.info("Auth cookie gone or replaced after the test (logged out); next test logs in again")
+                self.invalidate()
@@ -2,9 +2,9 @@
 Single file with all reusable UI methods. Used project-wide.
 All element interactions go through this class; locators come from JSON.
 """
-from pathlib import Path
-import json
+import functools
 import logging
+import time
 from typing import List, Tuple
 
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -12,133 +12,153 @@ from selenium.webdriver.remote.webdriver import WebDriver
 logger = logging.getLogger(__name__)
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from config.settings import IMPLICIT_WAIT
+from config.settings import IMPLICIT_WAIT, SHORT_WAIT
+from core.locators import BY_MAP, LOCATORS, SECTIONS
+from core.timing import recorder
+from core.waits import Timeout, wait_until
 
-# Map JSON "by" string to Selenium By
-BY_MAP = {
-    "id": By.ID,
-    "xpath": By.XPATH,
-    "css": By.CSS_SELECTOR,
-    "name": By.NAME,
-    "class": By.CLASS_NAME,
-    "tag": By.TAG_NAME,
-    "link_text": By.LINK_TEXT,
-    "partial_link_text": By.PARTIAL_LINK_TEXT,
-}
+__all__ = ["BaseActions", "BY_MAP"]
+
+
+def _timed(func):
+    """Record duration of a section/key action (wait vs interaction split) in core.timing."""
+    @functools.wraps(func)
+    def wrapper(self, section: str, key: str, *args, **kwargs):
+        with recorder.step(func.__name__, section, key, self.page):
+            return func(self, section, key, *args, **kwargs)
+    return wrapper
 
 
 class BaseActions:
     """
-    Central place for all UI actions. Loads locators from JSON.
+    Central place for all UI actions. Locators come from locators.json, compiled once (core.locators).
     Every click, type, get_text etc. is done through these methods.
     """
 
-    _locators: dict = {}
-    _locators_path: Path = Path(__file__).resolve().parent.parent / "locators" / "locators.json"
-
-    def __init__(self, driver: WebDriver) -> None:
+    def __init__(self, driver: WebDriver, page: str = "") -> None:
         self.driver = driver
-        self._load_locators()
-
-    def _load_locators(self) -> None:
-        """Load locators from JSON once."""
-        if not BaseActions._locators:
-            with open(BaseActions._locators_path, encoding="utf-8") as f:
-                BaseActions._locators = json.load(f)
+        self.page = page  # page object name, used to tag timings
 
     def _get_locator(self, section: str, key: str) -> Tuple[By, str]:
-        """Resolve section.key to (By.XXX, value)."""
-        section_data = self._locators.get(section)
-        if not section_data:
-            raise KeyError(f"Locator section '{section}' not found in locators.json")
-        item = section_data.get(key)
-        if not item:
-            raise KeyError(f"Locator key '{key}' not in section '{section}'")
-        by_str = item.get("by", "id").lower()
-        value = item.get("value", "")
-        by = BY_MAP.get(by_str, By.ID)
-        return by, value
-
-    def click(self, section: str, key: str, timeout: int = IMPLICIT_WAIT) -> None:
+        """Resolve section.key to (By.XXX, value) from the compiled table (core.locators)."""
+        try:
+            return LOCATORS[(section, key)]
+        except KeyError:
+            if section not in SECTIONS:
+                raise KeyError(f"Locator section '{section}' not found in locators.json") from None
+            raise KeyError(f"Locator key '{key}' not in section '{section}'") from None
+
+    def _wait(self, condition, timeout: Timeout):
+        """Explicit wait for condition (fast path + polling, see core.waits). Time spent counts as wait time."""
+        start = time.perf_counter()
+        try:
+            return wait_until(self.driver, condition, timeout)
+        finally:
+            recorder.add_wait(time.perf_counter() - start)
+
+    def locator(self, section: str, key: str) -> Tuple[By, str]:
+        """Public (By, value) lookup for code that needs the raw selector (e.g. one-call DOM snapshots)."""
+        return self._get_locator(section, key)
+
+    @_timed
+    def click(self, section: str, key: str, timeout: Timeout = IMPLICIT_WAIT) -> None:
         """Click element identified by section and key in locators.json."""
         by, value = self._get_locator(section, key)
-        element = WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable((by, value))
-        )
+        element = self._wait(EC.element_to_be_clickable((by, value)), timeout)
         logger.info("Clicked on element: section=%s, key=%s (by=%s, value=%s)", section, key, by, value)
         element.click()
 
-    def send_keys(self, section: str, key: str, text: str, clear_first: bool = True) -> None:
+    @_timed
+    def send_keys(self, section: str, key: str, text: str, clear_first: bool = True, timeout: Timeout = IMPLICIT_WAIT) -> None:
         """Type text into element. Optionally clear before typing."""
         by, value = self._get_locator(section, key)
-        element = WebDriverWait(self.driver, IMPLICIT_WAIT).until(
-            EC.visibility_of_element_located((by, value))
-        )
+        element = self._wait(EC.visibility_of_element_located((by, value)), timeout)
         if clear_first:
             element.clear()
         logger.info("Sent keys to element: section=%s, key=%s (length=%s)", section, key, len(text or ""))
         element.send_keys(text)
 
-    def get_text(self, section: str, key: str, timeout: int = IMPLICIT_WAIT) -> str:
+    @_timed
+    def get_text(self, section: str, key: str, timeout: Timeout = IMPLICIT_WAIT) -> str:
         """Get visible text of element."""
         by, value = self._get_locator(section, key)
-        element = WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located((by, value))
-        )
+        element = self._wait(EC.visibility_of_element_located((by, value)), timeout)
         return element.text.strip()
 
-    def get_attribute(self, section: str, key: str, attribute: str) -> str:
+    @_timed
+    def get_attribute(self, section: str, key: str, attribute: str, timeout: Timeout = IMPLICIT_WAIT) -> str:
         """Get attribute value of element."""
         by, value = self._get_locator(section, key)
-        element = WebDriverWait(self.driver, IMPLICIT_WAIT).until(
-            EC.presence_of_element_located((by, value))
-        )
+        element = self._wait(EC.presence_of_element_located((by, value)), timeout)
         return element.get_attribute(attribute) or ""
 
-    def is_displayed(self, section: str, key: str, timeout: int = IMPLICIT_WAIT) -> bool:
-        """Check if element is displayed. When timeout is short, set implicit_wait to 0 so polls don't wait 10s each."""
+    @_timed
+    def is_displayed(self, section: str, key: str, timeout: Timeout = IMPLICIT_WAIT) -> bool:
+        """Check if element is displayed within timeout. Returns False instead of raising."""
         by, value = self._get_locator(section, key)
-        if timeout < IMPLICIT_WAIT:
-            self.driver.implicitly_wait(0)
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located((by, value))
-            )
+            element = self._wait(EC.visibility_of_element_located((by, value)), timeout)
             return element.is_displayed()
         except Exception:
             return False
-        finally:
-            if timeout < IMPLICIT_WAIT:
-                self.driver.implicitly_wait(IMPLICIT_WAIT)
 
-    def wait_visible(self, section: str, key: str, timeout: int = IMPLICIT_WAIT) -> WebElement:
+    @_timed
+    def is_not_displayed_within(self, section: str, key: str, timeout: Timeout = SHORT_WAIT) -> bool:
+        """True if element does not become visible within timeout (waits the full timeout when it never shows up)."""
+        by, value = self._get_locator(section, key)
+        try:
+            self._wait(EC.visibility_of_element_located((by, value)), timeout)
+            return False
+        except Exception:
+            return True
+
+    @_timed
+    def is_absent(self, section: str, key: str, timeout: Timeout = SHORT_WAIT) -> bool:
+        """True as soon as element is missing or hidden; waits up to timeout for a visible one to go away."""
+        by, value = self._get_locator(section, key)
+        try:
+            return bool(self._wait(EC.invisibility_of_element_located((by, value)), timeout))
+        except Exception:
+            return False
+
+    @_timed
+    def wait_visible(self, section: str, key: str, timeout: Timeout = IMPLICIT_WAIT) -> WebElement:
         """Wait until element is visible; return the element."""
         by, value = self._get_locator(section, key)
-        return WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located((by, value))
-        )
+        return self._wait(EC.visibility_of_element_located((by, value)), timeout)
 
-    def find_element(self, section: str, key: str, timeout: int = IMPLICIT_WAIT) -> WebElement:
+    @_timed
+    def find_element(self, section: str, key: str, timeout: Timeout = IMPLICIT_WAIT) -> WebElement:
         """Find single element by locator from JSON."""
         by, value = self._get_locator(section, key)
-        return WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((by, value))
-        )
+        return self._wait(EC.presence_of_element_located((by, value)), timeout)
 
-    def find_elements(self, section: str, key: str, timeout: int = IMPLICIT_WAIT) -> List[WebElement]:
-        """Find all elements matching locator from JSON."""
+    @_timed
+    def find_elements(self, section: str, key: str, timeout: Timeout = IMPLICIT_WAIT) -> List[WebElement]:
+        """Find all elements matching locator from JSON. Returns at once if they are already present."""
         by, value = self._get_locator(section, key)
-        WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((by, value))
-        )
+        elements = self.driver.find_elements(by, value)
+        if elements:
+            return elements
+        self._wait(EC.presence_of_element_located((by, value)), timeout)
         return self.driver.find_elements(by, value)
 
+    @_timed
     def select_by_value(self, section: str, key: str, value: str) -> None:
         """Select option by value in a dropdown (e.g. sort)."""
         from selenium.webdriver.support.ui import Select
         element = self.find_element(section, key)
         select = Select(element)
         select.select_by_value(value)
+
+    def page_source(self) -> str:
+        """Current DOM serialized as HTML (one round trip); parse it offline with core.html_snapshot."""
+        with recorder.step("page_source", page=self.page):
+            return self.driver.page_source
+
+    def execute_script(self, script: str, *args):
+        """Run JavaScript in the page and return its result. One WebDriver round trip however much DOM it reads."""
+        with recorder.step("execute_script", page=self.page):
+            return self.driver.execute_script(script, *args)
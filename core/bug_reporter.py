@@ -1,36 +1,172 @@
 """
-Record detected bugs to a file when tests catch application errors.
-Bugs are appended to output/bugs_detected.md for documentation.
+Record detected bugs when tests catch application errors.
+record_bug() appends one JSON line to this process's own file (bugs.pending.jsonl in worker_output_dir()),
+so parallel workers never share a file handle and nothing is read back during the run.
+At the end of the session write_bug_report() (controller only) folds the pending records into
+output/bugs.jsonl, de-duplicated by signature across runs (count, first/last seen), and renders
+output/bugs_detected.md from it once.
 """
+import hashlib
+import json
+import os
+import re
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List
+from urllib.parse import urlsplit
 
-OUTPUT_DIR = Path(__file__).resolve().parent.parent / "output"
-BUGS_FILE = OUTPUT_DIR / "bugs_detected.md"
+from core.workers import OUTPUT_DIR, WORKERS_DIR, worker_id, worker_output_dir
+
+BUGS_FILENAME = "bugs_detected.md"
+BUGS_FILE = OUTPUT_DIR / BUGS_FILENAME
+STORE_FILE = OUTPUT_DIR / "bugs.jsonl"
+PENDING_FILENAME = "bugs.pending.jsonl"
+_HEADER = "# Detected bugs (automated tests)\n\n*Bugs recorded when tests catch application errors.*\n"
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _stable_value(value) -> str:
+    """Detail value with the origin of a URL dropped: the same page on another host:port (xdist worker's local
+    shop or cache proxy, live site) is the same bug."""
+    text = str(value)
+    parts = urlsplit(text)
+    if parts.scheme in ("http", "https") and parts.netloc:
+        return parts.path + (f"?{parts.query}" if parts.query else "")
+    return text
+
+
+def bug_signature(test_id: str, summary: str, details: dict | None = None) -> str:
+    """Stable id of a bug: same test, summary and details (URLs compared by path and query) -> same signature."""
+    stable = sorted((key, _stable_value(value)) for key, value in (details or {}).items())
+    payload = json.dumps([test_id, summary, stable], default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
 
 
 def record_bug(test_id: str, summary: str, details: dict | None = None) -> None:
     """
-    Append a detected bug to output/bugs_detected.md.
+    Record a detected bug (one JSON line, single O_APPEND write to this process's pending file).
     Call this when a test fails due to an application bug (e.g. internal error page).
     """
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    block = [
-        "",
-        "---",
-        f"## Bug – {timestamp}",
-        f"- **Test:** `{test_id}`",
-        f"- **Summary:** {summary}",
-    ]
-    if details:
-        for key, value in details.items():
-            if value is not None and str(value).strip():
-                block.append(f"- **{key}:** {value}")
-    block.append("")
-    text = "\n".join(block)
-    write_header = not BUGS_FILE.exists() or BUGS_FILE.stat().st_size == 0
-    with open(BUGS_FILE, "a", encoding="utf-8") as f:
-        if write_header:
-            f.write("# Detected bugs (automated tests)\n\n*Bugs recorded when tests catch application errors.*\n")
-        f.write(text)
+    details = {k: str(v) for k, v in (details or {}).items() if v is not None and str(v).strip()}
+    record = {
+        "signature": bug_signature(test_id, summary, details),
+        "test": test_id,
+        "summary": summary,
+        "details": details,
+        "seen": datetime.now().strftime(_TIME_FORMAT),
+        "worker": worker_id(),
+    }
+    line = (json.dumps(record) + "\n").encode("utf-8")
+    fd = os.open(worker_output_dir() / PENDING_FILENAME, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+def _read_jsonl(path: Path) -> List[dict]:
+    """Records of a JSON lines file; a torn last line (crashed worker) is skipped."""
+    records = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue
+    return records
+
+
+def _seed_from_markdown(path: Path) -> Dict[str, dict]:
+    """Bugs from an existing bugs_detected.md (before the JSON store existed), de-duplicated by signature."""
+    store: Dict[str, dict] = {}
+    if not path.is_file():
+        return store
+    for block in path.read_text(encoding="utf-8").split("\n---\n")[1:]:
+        heading = re.search(r"^## Bug – (.+)$", block, re.MULTILINE)
+        fields = dict(re.findall(r"^- \*\*(.+?):\*\* (.*)$", block, re.MULTILINE))
+        if not heading or "Summary" not in fields:
+            continue
+        test_id = fields.pop("Test", "").strip("`")
+        summary = fields.pop("Summary")
+        seen_line = fields.pop("Seen", "")
+        fields.pop("Signature", None)
+        record = {"test": test_id, "summary": summary, "details": fields, "seen": heading.group(1).strip()}
+        count = re.match(r"(\d+) times? \(first (.+?), last (.+?)\)", seen_line)
+        _fold(store, record, count=int(count.group(1)) if count else 1, first=count.group(2) if count else None)
+    return store
+
+
+def _fold(store: Dict[str, dict], record: dict, count: int = 1, first: str | None = None) -> None:
+    """Add one occurrence (or `count` of them) of a bug to the store."""
+    # Recomputed, not taken from the record: entries stored under an older signature rule merge with new ones
+    signature = bug_signature(record["test"], record["summary"], record["details"])
+    entry = store.get(signature)
+    if entry is None:
+        store[signature] = {
+            "signature": signature,
+            "test": record["test"],
+            "summary": record["summary"],
+            "details": record["details"],
+            "count": count,
+            "first_seen": first or record["seen"],
+            "last_seen": record["seen"],
+        }
+        return
+    entry["count"] += count
+    entry["first_seen"] = min(entry["first_seen"], first or record["seen"])
+    entry["last_seen"] = max(entry["last_seen"], record["seen"])
+
+
+def _load_store() -> Dict[str, dict]:
+    if not STORE_FILE.is_file():
+        return _seed_from_markdown(BUGS_FILE)
+    store: Dict[str, dict] = {}
+    for entry in _read_jsonl(STORE_FILE):
+        _fold(store, {**entry, "seen": entry["last_seen"]}, count=entry["count"], first=entry["first_seen"])
+    return store
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def render_markdown(store: Dict[str, dict]) -> str:
+    """bugs_detected.md content: one block per distinct bug, most recently seen first."""
+    parts = [_HEADER]
+    for entry in sorted(store.values(), key=lambda e: e["last_seen"], reverse=True):
+        block = [
+            "",
+            "---",
+            f"## Bug – {entry['last_seen']}",
+            f"- **Test:** `{entry['test']}`",
+            f"- **Summary:** {entry['summary']}",
+        ]
+        block.extend(f"- **{key}:** {value}" for key, value in entry["details"].items())
+        times = "time" if entry["count"] == 1 else "times"
+        block.append(f"- **Seen:** {entry['count']} {times} (first {entry['first_seen']}, last {entry['last_seen']})")
+        block.append(f"- **Signature:** `{entry['signature']}`")
+        block.append("")
+        parts.append("\n".join(block))
+    return "".join(parts)
+
+
+def write_bug_report() -> int:
+    """
+    Fold pending records of this run (controller and all workers) into output/bugs.jsonl and render
+    output/bugs_detected.md. Call once, from the controller, at session end. Returns number of new records.
+    """
+    pending_files = [OUTPUT_DIR / PENDING_FILENAME, *sorted(WORKERS_DIR.glob(f"*/{PENDING_FILENAME}"))]
+    pending = [r for path in pending_files if path.is_file() for r in _read_jsonl(path)]
+    if not pending:
+        return 0
+    store = _load_store()
+    for record in pending:
+        _fold(store, record)
+    _write_atomic(STORE_FILE, "".join(json.dumps(e) + "\n" for e in store.values()))
+    _write_atomic(BUGS_FILE, render_markdown(store))
+    for path in pending_files:
+        if path.is_file():
+            path.unlink()
+    return len(pending)
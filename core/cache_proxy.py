@@ -0,0 +1,274 @@
+"""
+Record-and-replay HTTP cache in front of the public Demo Web Shop.
+Runs as a local reverse proxy (HTTP_CACHE=1 points BASE_URL to it): the browser talks plain HTTP to
+127.0.0.1, the proxy forwards to the HTTPS site. First run records cacheable responses to disk, later
+runs replay them. What is cacheable is decided per URL pattern (config/http_cache_rules.json): static
+assets and catalog pages are cached, register/login/logout always go to the live site. Entries expire by
+TTL and the store is kept under HTTP_CACHE_MAX_BYTES by evicting least recently used entries.
+
+A reverse proxy (not a forward proxy set via --proxy-server) is used because the site is HTTPS only; a
+forward proxy would only see CONNECT tunnels and could not cache without intercepting TLS.
+"""
+import hashlib
+import http.client
+import json
+import logging
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from config.settings import HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES, PUBLIC_BASE_URL
+
+logger = logging.getLogger(__name__)
+
+RULES_PATH = Path(__file__).resolve().parent.parent / "config" / "http_cache_rules.json"
+AUTH_COOKIE = "NOPCOMMERCE.AUTH"
+# Entries hold the raw upstream response; entries written in an older layout (already rewritten to one
+# proxy's origin) are ignored
+ENTRY_FORMAT = 2
+_HOP_BY_HOP = {"connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailers",
+               "transfer-encoding", "upgrade", "content-length", "content-encoding"}
+# Safe to send twice: retried once if the upstream connection fails
+_IDEMPOTENT = frozenset({"GET", "HEAD"})
+
+
+class CacheRules:
+    """Ordered (regex, cache, ttl) rules; first match wins."""
+
+    def __init__(self, path: Path = RULES_PATH) -> None:
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f)
+        self.default: Tuple[bool, int] = (bool(raw["default"].get("cache")), int(raw["default"].get("ttl", 0)))
+        self.rules: List[Tuple[re.Pattern, bool, int]] = [
+            (re.compile(r["pattern"]), bool(r["cache"]), int(r.get("ttl", 0))) for r in raw["rules"]
+        ]
+
+    def lookup(self, path_and_query: str) -> Tuple[bool, int]:
+        """(cacheable, ttl_seconds) for a request path (with query string)."""
+        for pattern, cache, ttl in self.rules:
+            if pattern.search(path_and_query):
+                return cache, ttl
+        return self.default
+
+
+class DiskCache:
+    """
+    One meta JSON + one body file per entry, named by sha1 of the URL. Meta file mtime is the LRU clock.
+    Writes are atomic (tmp + os.replace), so several workers can share one cache directory.
+    """
+
+    def __init__(self, directory: Path = HTTP_CACHE_DIR, max_bytes: int = HTTP_CACHE_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[Tuple[int, List[Tuple[str, str]], bytes]]:
+        """(status, headers, body) if a fresh entry exists; expired entries are deleted."""
+        key = self._key(url)
+        meta_path, body_path = self.directory / f"{key}.json", self.directory / f"{key}.body"
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("format") != ENTRY_FORMAT or time.time() - meta["stored_at"] > meta["ttl"]:
+                self._remove(key)
+                return None
+            body = body_path.read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+        os.utime(meta_path)  # touch: most recently used
+        return meta["status"], [tuple(h) for h in meta["headers"]], body
+
+    def put(self, url: str, status: int, headers: List[Tuple[str, str]], body: bytes, ttl: int) -> None:
+        key = self._key(url)
+        meta = {"format": ENTRY_FORMAT, "url": url, "status": status, "headers": headers, "stored_at": time.time(), "ttl": ttl, "size": len(body)}
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        body_tmp = self.directory / f"{key}.body{suffix}"
+        meta_tmp = self.directory / f"{key}.json{suffix}"
+        body_tmp.write_bytes(body)
+        meta_tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(body_tmp, self.directory / f"{key}.body")
+        os.replace(meta_tmp, self.directory / f"{key}.json")
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the store fits in max_bytes."""
+        with self._lock:
+            entries = []
+            total = 0
+            for meta_path in self.directory.glob("*.json"):
+                try:
+                    stat = meta_path.stat()
+                    body_size = (meta_path.with_suffix(".body")).stat().st_size
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, meta_path.stem, body_size + stat.st_size))
+                total += body_size + stat.st_size
+            if total <= self.max_bytes:
+                return
+            for _, key, size in sorted(entries):
+                self._remove(key)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+    def _remove(self, key: str) -> None:
+        for suffix in (".json", ".body"):
+            try:
+                (self.directory / f"{key}{suffix}").unlink()
+            except OSError:
+                pass
+
+
+class CacheProxyServer:
+    """Threaded reverse proxy with record-and-replay cache. start() returns once the socket is listening."""
+
+    def __init__(self, host: str, port: int, upstream: str = PUBLIC_BASE_URL,
+                 cache: Optional[DiskCache] = None, rules: Optional[CacheRules] = None) -> None:
+        self.upstream = urlsplit(upstream)
+        self.cache = cache or DiskCache()
+        self.rules = rules or CacheRules()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "stored": 0, "live": 0, "bytes_replayed": 0}
+        self._stats_lock = threading.Lock()
+        self._local = threading.local()
+        handler = type("BoundCacheProxyHandler", (_ProxyHandler,), {"proxy": self})
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "CacheProxyServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="cache-proxy", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[name] += amount
+
+    def forward(self, method: str, path: str, headers: List[Tuple[str, str]], body: Optional[bytes]):
+        """
+        Send request upstream on a per-thread keep-alive connection; returns http.client response (read).
+        GET/HEAD are retried once on a fresh connection (the kept-alive one may have been closed by the server).
+        Other methods (form POSTs) are never retried, since upstream may already have acted on them: they get a fresh
+        connection up front so a stale one cannot fail them.
+        """
+        retry = method in _IDEMPOTENT
+        if not retry:
+            self._drop_connection()
+        for attempt in (1, 2):
+            conn = getattr(self._local, "conn", None)
+            if conn is None:
+                conn_cls = http.client.HTTPSConnection if self.upstream.scheme == "https" else http.client.HTTPConnection
+                conn = self._local.conn = conn_cls(self.upstream.netloc, timeout=30)
+            try:
+                conn.request(method, path, body=body, headers=dict(headers))
+                response = conn.getresponse()
+                return response, response.read()
+            except (http.client.HTTPException, OSError):
+                self._drop_connection()
+                if not retry or attempt == 2:
+                    raise
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    proxy: CacheProxyServer  # set on the bound subclass
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # keep test output clean
+        pass
+
+    def _rewrite_out(self, headers: List[Tuple[str, str]], body: bytes) -> Tuple[List[Tuple[str, str]], bytes]:
+        """Make upstream response usable on http://127.0.0.1: absolute URLs, cookie Domain/Secure."""
+        upstream_origin = f"{self.proxy.upstream.scheme}://{self.proxy.upstream.netloc}"
+        local_origin = self.proxy.url.rstrip("/")
+        out = []
+        for name, value in headers:
+            lname = name.lower()
+            if lname in _HOP_BY_HOP:
+                continue
+            if lname == "location":
+                value = value.replace(upstream_origin, local_origin)
+            elif lname == "set-cookie":
+                value = re.sub(r";\s*(domain=[^;]*|secure)", "", value, flags=re.IGNORECASE)
+            out.append((name, value))
+        content_type = next((v for n, v in headers if n.lower() == "content-type"), "")
+        if "text/html" in content_type:
+            body = body.replace(upstream_origin.encode(), local_origin.encode())
+        return out, body
+
+    def _reply(self, status: int, headers: List[Tuple[str, str]], body: bytes) -> None:
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _handle(self) -> None:
+        proxy = self.proxy
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        cacheable, ttl = proxy.rules.lookup(self.path)
+        authenticated = AUTH_COOKIE in (self.headers.get("Cookie") or "")
+        use_cache = self.command == "GET" and cacheable and not authenticated
+        url = f"{proxy.upstream.scheme}://{proxy.upstream.netloc}{self.path}"
+
+        if use_cache:
+            cached = proxy.cache.get(url)
+            if cached is not None:
+                status, headers, payload = cached
+                proxy.count("hits")
+                proxy.count("bytes_replayed", len(payload))
+                self._reply(status, *self._rewrite_out(headers, payload))
+                return
+            proxy.count("misses")
+        else:
+            proxy.count("live")
+
+        request_headers = [(k, v) for k, v in self.headers.items() if k.lower() not in _HOP_BY_HOP | {"host", "accept-encoding"}]
+        request_headers.append(("Host", proxy.upstream.netloc))
+        request_headers.append(("Accept-Encoding", "identity"))
+        try:
+            response, payload = proxy.forward(self.command, self.path, request_headers, body)
+        except Exception as e:
+            logger.warning("Upstream request failed for %s: %s", url, e)
+            self._reply(502, [("Content-Type", "text/plain")], f"Upstream error: {e}".encode())
+            return
+        headers = response.getheaders()
+        if use_cache and response.status == 200 and not any(n.lower() == "set-cookie" for n, _ in headers):
+            # Store the upstream response as received: the cache directory is shared by every worker's proxy
+            # (each on its own port), so origins are rewritten per reply, never in the stored entry
+            proxy.cache.put(url, response.status, headers, payload, ttl)
+            proxy.count("stored")
+        self._reply(response.status, *self._rewrite_out(headers, payload))
+
+    do_GET = _handle
+    do_POST = _handle
+    do_HEAD = _handle
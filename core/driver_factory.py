@@ -0,0 +1,136 @@
+"""
+Create Chrome WebDriver instances. Single place for driver options and timeouts.
+Used by the driver fixture (isolated mode) and by DriverPool (pooled mode).
+
+The chromedriver binary is resolved once per process (resolve_driver_path) and remembered across
+runs in a small JSON cache keyed by the installed Chrome version, so webdriver_manager (version
+check, possible network lookup) only runs when Chrome was updated. Set CHROMEDRIVER_PATH (or
+--chromedriver) to use a local binary and never touch the network.
+
+Launch profiles (BROWSER_PROFILE / --browser-profile):
+- default: maximized, headed Chrome with default options.
+- lean: headless, fixed window size, no GPU/extensions, eager page load, images and web fonts
+  optionally blocked. Meant for CI and for packing many workers on one runner.
+"""
+import json
+import logging
+import os
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.settings import (
+    BROWSER_PROFILE,
+    CHROMEDRIVER_PATH,
+    DRIVER_CACHE_FILE,
+    LEAN_BLOCK_FONTS,
+    LEAN_BLOCK_IMAGES,
+    LEAN_WINDOW_SIZE,
+    PAGE_LOAD_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+_resolved_path: str | None = None
+
+
+def _chrome_version() -> str | None:
+    """Installed Chrome version read from the OS (no network), or None if it cannot be detected."""
+    try:
+        from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception as e:
+        logger.debug("Could not detect Chrome version: %s", e)
+        return None
+
+
+def _read_cache(cache_file: Path) -> dict:
+    """Load {chrome_version: driver_path} cache; empty dict if missing or unreadable."""
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(cache_file: Path, cache: dict) -> None:
+    """Write cache atomically so parallel workers never read a half-written file."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    os.replace(tmp, cache_file)
+
+
+def resolve_driver_path(offline_path: str = CHROMEDRIVER_PATH, cache_file: Path = DRIVER_CACHE_FILE) -> str:
+    """
+    Return path to chromedriver. Order: offline_path (local binary, no network) ->
+    persistent cache for the installed Chrome version -> webdriver_manager install (then cached).
+    Result is kept for the rest of the process.
+    """
+    global _resolved_path
+    if _resolved_path:
+        return _resolved_path
+    if offline_path:
+        if not Path(offline_path).is_file():
+            raise FileNotFoundError(f"chromedriver not found at configured path: {offline_path}")
+        _resolved_path = offline_path
+        logger.info("Using local chromedriver: %s", offline_path)
+        return _resolved_path
+
+    version = _chrome_version()
+    if version:
+        cached = _read_cache(cache_file).get(version)
+        if cached and Path(cached).is_file():
+            _resolved_path = cached
+            logger.info("Using cached chromedriver for Chrome %s: %s", version, cached)
+            return _resolved_path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    _resolved_path = ChromeDriverManager().install()
+    logger.info("Resolved chromedriver via webdriver_manager: %s", _resolved_path)
+    if version:
+        cache = _read_cache(cache_file)
+        cache[version] = _resolved_path
+        _write_cache(cache_file, cache)
+    return _resolved_path
+
+
+PROFILES = ("default", "lean")
+
+
+def build_options(profile: str = BROWSER_PROFILE) -> Options:
+    """Chrome options for a launch profile ('default' or 'lean')."""
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown browser profile {profile!r}; expected one of {PROFILES}")
+    options = Options()
+    if profile == "default":
+        options.add_argument("--start-maximized")
+        return options
+    options.add_argument("--headless=new")
+    options.add_argument(f"--window-size={LEAN_WINDOW_SIZE}")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--mute-audio")
+    options.page_load_strategy = "eager"
+    if LEAN_BLOCK_IMAGES:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    if LEAN_BLOCK_FONTS:
+        options.add_argument("--disable-remote-fonts")
+    return options
+
+
+def create_driver(driver_path: str | None = None, profile: str = BROWSER_PROFILE) -> WebDriver:
+    """Start a new Chrome with project options and timeouts. Caller is responsible for quit()."""
+    options = build_options(profile)
+    service = Service(driver_path or resolve_driver_path())
+    browser = webdriver.Chrome(service=service, options=options)
+    browser.implicitly_wait(0)  # all waiting is explicit (core.waits); implicit wait would compound with it
+    browser.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    logger.info("Started Chrome (profile=%s, session=%s)", profile, browser.session_id)
+    return browser
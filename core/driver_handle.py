@@ -0,0 +1,65 @@
+"""
+The driver a test gets from the `driver` fixture: a thin wrapper around a (possibly pooled) WebDriver that holds
+the test's own state, so nothing is set on the WebDriver itself and nothing stays on a pooled browser after release.
+That is the test's request block list (core.request_blocking.set_blocked_urls) and the deferred start URL: the
+first use of the driver that needs a page (find_element, current_url, execute_script, ...) opens it, whether it
+goes through BaseActions or uses the driver directly.
+"""
+import logging
+import re
+from typing import Optional, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from core.request_blocking import savings
+from core.timing import recorder
+
+logger = logging.getLogger(__name__)
+
+# WebDriver members that do not depend on the loaded page; using them does not open the deferred start URL
+_PAGE_INDEPENDENT = frozenset({
+    "add_cookie", "capabilities", "delete_all_cookies", "execute_cdp_cmd", "get_cookies", "quit", "service",
+    "session_id",
+})
+
+
+def load_page(driver: WebDriver, url: str, page: str = "") -> None:
+    """driver.get(url), timed as a page load (core.timing, core.request_blocking). Cancels a deferred start URL."""
+    with recorder.step("page_load", key=url, page=page) as step:
+        driver.get(url)
+    savings.observe(driver, step)
+
+
+class DriverHandle:
+    """
+    Forwards everything to the wrapped WebDriver. With a start_url, the page is opened on first page access
+    unless the test navigates (get) before that.
+    """
+
+    def __init__(self, browser: WebDriver, start_url: Optional[str] = None) -> None:
+        self.browser = browser
+        self.start_url = start_url
+        self.blocked_regexes: Tuple[re.Pattern, ...] = ()
+
+    def get(self, url: str) -> None:
+        """Navigate to url; cancels the deferred start URL."""
+        self.start_url = None
+        self.browser.get(url)
+
+    def ensure_started(self) -> None:
+        """Load the deferred start URL if nothing was opened yet."""
+        url, self.start_url = self.start_url, None
+        if url:
+            logger.info("Opening deferred start URL: %s", url)
+            load_page(self, url, "deferred start")
+
+    def __getattr__(self, name: str):
+        # Only called for names not set on the handle itself, i.e. everything of the WebDriver
+        if name in ("browser", "start_url", "blocked_regexes"):
+            raise AttributeError(name)  # not initialised yet (e.g. copy); do not recurse
+        if name not in _PAGE_INDEPENDENT:
+            self.ensure_started()
+        return getattr(self.browser, name)
+
+    def __repr__(self) -> str:
+        return f"DriverHandle(session={self.browser.session_id}, start_url={self.start_url!r})"
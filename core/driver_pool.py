@@ -0,0 +1,178 @@
+"""
+Session-wide pool of warm Chrome browsers.
+Tests borrow a browser with acquire() and give it back with release(); between tests the
+browser is reset (cookies, storage, extra tabs) instead of being quit and started again.
+A browser that crashed or stopped responding is quit and replaced by a fresh one.
+"""
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Callable, List
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.settings import DRIVER_ACQUIRE_TIMEOUT, DRIVER_HEALTH_TIMEOUT
+from core.driver_factory import create_driver
+
+logger = logging.getLogger(__name__)
+
+# Page every pooled browser is parked on between tests
+BLANK_PAGE = "about:blank"
+
+
+def _call_with_timeout(func: Callable, timeout: float):
+    """Run func in a helper thread; raise TimeoutError if it does not return in time (hung browser)."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        return executor.submit(func).result(timeout=timeout)
+    except FutureTimeout as e:
+        raise TimeoutError(f"Browser did not respond within {timeout}s") from e
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _kill(browser: WebDriver) -> None:
+    """Quit browser; if quit hangs or fails, kill the chromedriver process."""
+    try:
+        _call_with_timeout(browser.quit, DRIVER_HEALTH_TIMEOUT)
+    except Exception as e:
+        logger.warning("Could not quit browser cleanly (%s); killing chromedriver process.", e)
+        process = getattr(getattr(browser, "service", None), "process", None)
+        if process is not None:
+            try:
+                process.kill()
+            except Exception:
+                pass
+
+
+class DriverPool:
+    """
+    Keeps up to `size` browsers alive for the whole session and hands them out per test.
+    Thread-safe; acquire() blocks when all browsers are in use, for at most acquire_timeout seconds.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        factory: Callable[[], WebDriver] = create_driver,
+        acquire_timeout: float = DRIVER_ACQUIRE_TIMEOUT,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self._factory = factory
+        self._idle: "queue.LifoQueue[WebDriver]" = queue.LifoQueue()
+        self._all: List[WebDriver] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def warm(self) -> None:
+        """Start all browsers up front, in parallel, so the first tests do not pay the launch cost."""
+        with self._lock:
+            missing = self.size - len(self._all)
+        if missing <= 0:
+            return
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            for browser in executor.map(lambda _: self._factory(), range(missing)):
+                with self._lock:
+                    self._all.append(browser)
+                self._idle.put(browser)
+        logger.info("Driver pool warmed: %s browser(s)", self.size)
+
+    def acquire(self) -> WebDriver:
+        """
+        Borrow a healthy browser parked on a blank page. Starts one if the pool is not full yet.
+        Raises RuntimeError if none is released within acquire_timeout.
+        """
+        if self._closed:
+            raise RuntimeError("Driver pool is closed")
+        try:
+            browser = self._idle.get_nowait()
+        except queue.Empty:
+            browser = None
+            with self._lock:
+                if len(self._all) < self.size:
+                    browser = self._factory()
+                    self._all.append(browser)
+            if browser is None:
+                try:
+                    browser = self._idle.get(timeout=self.acquire_timeout)
+                except queue.Empty:
+                    raise RuntimeError(
+                        f"All {self.size} pooled browser(s) (pool size {self.size}) still in use after "
+                        f"{self.acquire_timeout}s. A fixture still holds one (e.g. module_driver while the same module "
+                        f"requests driver) or a browser leaked; raise --pool-size or mark the test isolated_browser."
+                    ) from None
+        if not self._is_healthy(browser):
+            browser = self._replace(browser)
+        return browser
+
+    def release(self, browser: WebDriver) -> None:
+        """Reset the browser state and return it to the pool. Crashed or hung browsers are replaced."""
+        if self._closed:
+            _kill(browser)
+            return
+        try:
+            _call_with_timeout(lambda: self.reset(browser), DRIVER_HEALTH_TIMEOUT)
+        except Exception as e:
+            logger.warning("Browser reset failed (%s); recycling it.", e)
+            browser = self._replace(browser)
+        self._idle.put(browser)
+
+    @staticmethod
+    def reset(browser: WebDriver) -> None:
+        """
+        Close extra tabs, clear cookies, web storage and the request block list, park on a blank page.
+        The HTTP cache is kept: warm CSS/JS/images are what reusing the browser is for.
+        """
+        handles = browser.window_handles
+        for handle in handles[1:]:
+            browser.switch_to.window(handle)
+            browser.close()
+        browser.switch_to.window(handles[0])
+        try:
+            browser.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            pass  # about:blank / data: pages have no storage
+        try:
+            browser.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception:
+            browser.delete_all_cookies()
+        try:
+            browser.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})  # drop the last test's block list
+        except Exception:
+            pass  # Network domain never enabled: nothing was blocked
+        browser.get(BLANK_PAGE)
+
+    def close(self) -> None:
+        """Quit every browser owned by the pool."""
+        self._closed = True
+        with self._lock:
+            browsers, self._all = self._all, []
+        for browser in browsers:
+            _kill(browser)
+
+    @staticmethod
+    def _is_healthy(browser: WebDriver) -> bool:
+        """True if chromedriver is alive and the browser answers a trivial script in time."""
+        process = getattr(getattr(browser, "service", None), "process", None)
+        if process is not None and process.poll() is not None:
+            return False
+        try:
+            return _call_with_timeout(lambda: browser.execute_script("return 1"), DRIVER_HEALTH_TIMEOUT) == 1
+        except Exception:
+            return False
+
+    def _replace(self, browser: WebDriver) -> WebDriver:
+        """Quit a broken browser and start a new one in its slot."""
+        logger.warning("Recycling unhealthy browser (session=%s)", browser.session_id)
+        _kill(browser)
+        fresh = self._factory()
+        with self._lock:
+            if browser in self._all:
+                self._all[self._all.index(browser)] = fresh
+            else:
+                self._all.append(fresh)
+        return fresh
@@ -0,0 +1,308 @@
+"""
+Parse a captured page (driver.page_source or a stored .html file) and query it with CSS selectors,
+without a browser. Used by the grid verifiers: one page_source call per check on a live page, and no
+WebDriver at all for stored snapshots (tests/snapshots/) or pages fetched over HTTP (fetch_page).
+
+Selector support (what the locators and verifiers use): type, #id, .class, [attr], [attr=v], [attr~=v],
+[attr^=v], [attr$=v], [attr*=v], descendant (space) and child (>) combinators, and comma-separated groups
+(commas inside quoted attribute values do not split). The tree builder applies the HTML end tags that may be left
+out: a block start tag closes an open p, and li, dt/dd, option/optgroup and table rows/cells close the previous
+sibling of their kind; other unclosed elements stay open until an end tag closes them.
+Text is approximated like innerText: whitespace collapsed, script/style skipped. There is no layout, so
+"visible" only means no hidden attribute and no inline display:none on the element or an ancestor.
+"""
+import re
+import urllib.request
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from config.settings import PAGE_LOAD_TIMEOUT
+
+VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr",
+})
+_SKIP_TEXT = frozenset({"script", "style", "template"})
+# Start tags that close an open <p> (HTML "close a p element"); it is searched for up to the nearest _P_SCOPE element
+_CLOSES_P = frozenset({
+    "address", "article", "aside", "blockquote", "dd", "details", "div", "dl", "dt", "fieldset", "figcaption", "figure",
+    "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "menu", "nav", "ol", "p", "pre",
+    "section", "table", "ul",
+})
+_JUST_P = frozenset({"p"})
+_P_SCOPE = frozenset({"button", "caption", "html", "marquee", "object", "table", "td", "template", "th"})
+# Start tag -> (open elements it ends, elements that bound the search): e.g. <li> ends the open li of the same list
+_IMPLIED_END: Dict[str, Tuple[frozenset, frozenset]] = {
+    "li": (frozenset({"li"}), frozenset({"ol", "ul", "menu"})),
+    "dt": (frozenset({"dt", "dd"}), frozenset({"dl"})),
+    "dd": (frozenset({"dt", "dd"}), frozenset({"dl"})),
+    "option": (frozenset({"option"}), frozenset({"select", "datalist", "optgroup"})),
+    "optgroup": (frozenset({"option", "optgroup"}), frozenset({"select"})),
+    "tr": (frozenset({"tr", "td", "th"}), frozenset({"table", "thead", "tbody", "tfoot"})),
+    "td": (frozenset({"td", "th"}), frozenset({"tr", "table"})),
+    "th": (frozenset({"td", "th"}), frozenset({"tr", "table"})),
+    "thead": (frozenset({"thead", "tbody", "tfoot", "tr", "td", "th"}), frozenset({"table"})),
+    "tbody": (frozenset({"thead", "tbody", "tfoot", "tr", "td", "th"}), frozenset({"table"})),
+    "tfoot": (frozenset({"thead", "tbody", "tfoot", "tr", "td", "th"}), frozenset({"table"})),
+}
+
+
+class Node:
+    """Element of a parsed snapshot."""
+
+    __slots__ = ("tag", "attrs", "children", "parent", "classes")
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: Optional["Node"]) -> None:
+        self.tag = tag
+        self.attrs = attrs
+        self.children: List[Union["Node", str]] = []
+        self.parent = parent
+        self.classes = frozenset(attrs.get("class", "").split())
+
+    def get(self, name: str, default: str = "") -> str:
+        """Attribute value (as written in the HTML; not resolved like element.href)."""
+        return self.attrs.get(name, default)
+
+    def iter(self) -> Iterator["Node"]:
+        """All descendant elements, document order."""
+        for child in self.children:
+            if isinstance(child, Node):
+                yield child
+                yield from child.iter()
+
+    @property
+    def text(self) -> str:
+        """Text content with whitespace collapsed (script/style excluded), like Selenium's element.text."""
+        parts: List[str] = []
+        self._collect_text(parts)
+        return " ".join(" ".join(parts).split())
+
+    def _collect_text(self, parts: List[str]) -> None:
+        if self.tag in _SKIP_TEXT:
+            return
+        for child in self.children:
+            if isinstance(child, Node):
+                child._collect_text(parts)
+            else:
+                parts.append(child)
+
+    @property
+    def is_visible(self) -> bool:
+        """No hidden attribute / inline display:none / type=hidden on this element or its ancestors."""
+        node: Optional[Node] = self
+        while node is not None:
+            style = node.attrs.get("style", "").replace(" ", "").lower()
+            if "hidden" in node.attrs or "display:none" in style or (node.tag == "input" and node.attrs.get("type") == "hidden"):
+                return False
+            node = node.parent
+        return True
+
+    def select(self, selector: str) -> List["Node"]:
+        """Descendants matching a CSS selector, document order."""
+        matchers = compile_selector(selector)
+        return [node for node in self.iter() if any(m(node, self) for m in matchers)]
+
+    def select_one(self, selector: str) -> Optional["Node"]:
+        """First descendant matching a CSS selector, or None."""
+        matchers = compile_selector(selector)
+        return next((node for node in self.iter() if any(m(node, self) for m in matchers)), None)
+
+    def __repr__(self) -> str:
+        return f"<Node {self.tag} {self.attrs}>"
+
+
+class _TreeBuilder(HTMLParser):
+    """
+    Builds a Node tree; tolerant of unclosed tags (an end tag closes up to the nearest open match) and of end tags
+    left out by design (_CLOSES_P, _IMPLIED_END).
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document", {}, None)
+        self._stack = [self.root]
+
+    def _close_open(self, ends: frozenset, bounds: frozenset) -> None:
+        """Pop the outermost open element in ends (and everything inside it), searching down to the first of bounds."""
+        cut = None
+        for i in range(len(self._stack) - 1, 0, -1):
+            tag = self._stack[i].tag
+            if tag in bounds:
+                break
+            if tag in ends:
+                cut = i
+        if cut is not None:
+            del self._stack[cut:]
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag in _CLOSES_P:
+            self._close_open(_JUST_P, _P_SCOPE)
+        if tag in _IMPLIED_END:
+            self._close_open(*_IMPLIED_END[tag])
+        parent = self._stack[-1]
+        node = Node(tag, {name: (value if value is not None else "") for name, value in attrs}, parent)
+        parent.children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag: str, attrs) -> None:
+        parent = self._stack[-1]
+        parent.children.append(Node(tag, {name: (value if value is not None else "") for name, value in attrs}, parent))
+
+    def handle_endtag(self, tag: str) -> None:
+        for i in range(len(self._stack) - 1, 0, -1):
+            if self._stack[i].tag == tag:
+                del self._stack[i:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        self._stack[-1].children.append(data)
+
+
+def fetch_page(url: str) -> str:
+    """GET a page as text over plain HTTP (no cookies, no browser), for parsing without WebDriver."""
+    request = urllib.request.Request(url, headers={"User-Agent": "qa-automation"})
+    with urllib.request.urlopen(request, timeout=PAGE_LOAD_TIMEOUT) as response:
+        return response.read().decode("utf-8", "replace")
+
+
+def parse_html(html: str) -> Node:
+    """Parse an HTML document into a Node tree (root tag '#document')."""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+# --- CSS selectors -------------------------------------------------------------------------------------------------
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<comb>>)
+      | (?P<tag>[a-zA-Z][\w-]*|\*)
+      | \#(?P<id>[\w-]+)
+      | \.(?P<cls>[\w-]+)
+      | \[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[~^$*]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+))\s*)?\]
+    )""",
+    re.VERBOSE,
+)
+_ATTR_OPS: Dict[str, Callable[[str, str], bool]] = {
+    "=": lambda actual, v: actual == v,
+    "~=": lambda actual, v: v in actual.split(),
+    "^=": lambda actual, v: bool(v) and actual.startswith(v),
+    "$=": lambda actual, v: bool(v) and actual.endswith(v),
+    "*=": lambda actual, v: bool(v) and v in actual,
+}
+
+Compound = Callable[[Node], bool]
+Matcher = Callable[[Node, Node], bool]
+_cache: Dict[str, Tuple[Matcher, ...]] = {}
+
+
+def _compound(tag: Optional[str], ids: List[str], classes: List[str], attrs: List[Tuple[str, Optional[str], str]]) -> Compound:
+    def match(node: Node) -> bool:
+        if tag and tag != "*" and node.tag != tag:
+            return False
+        if ids and node.attrs.get("id") not in ids:
+            return False
+        if classes and not node.classes.issuperset(classes):
+            return False
+        for name, op, value in attrs:
+            if name not in node.attrs:
+                return False
+            if op is not None and not _ATTR_OPS[op](node.attrs[name], value):
+                return False
+        return True
+    return match
+
+
+def _parse_group(group: str) -> List[Tuple[str, Compound]]:
+    """'div.a > span b' -> [(' ', div.a), ('>', span), (' ', b)] (combinator before each compound)."""
+    steps: List[Tuple[str, Compound]] = []
+    pos, combinator = 0, " "
+    tag, ids, classes, attrs = None, [], [], []
+    pending = False
+
+    def flush() -> None:
+        nonlocal tag, ids, classes, attrs, pending
+        if pending:
+            steps.append((combinator, _compound(tag, ids, classes, attrs)))
+        tag, ids, classes, attrs, pending = None, [], [], [], False
+
+    group = group.strip()
+    while pos < len(group):
+        space_before = group[pos].isspace()
+        m = _TOKEN.match(group, pos)
+        if not m or m.end() == pos:
+            raise ValueError(f"Unsupported CSS selector: {group!r} (at {group[pos:]!r})")
+        if m.group("comb"):
+            flush()
+            combinator = ">"
+        else:
+            if space_before and pending:
+                flush()
+                combinator = " "
+            if m.group("tag"):
+                if pending:
+                    raise ValueError(f"Unsupported CSS selector: {group!r}")
+                tag = m.group("tag").lower()
+            elif m.group("id"):
+                ids.append(m.group("id"))
+            elif m.group("cls"):
+                classes.append(m.group("cls"))
+            else:
+                value = next((v for v in (m.group("dq"), m.group("sq"), m.group("bare")) if v is not None), "")
+                attrs.append((m.group("attr").lower(), m.group("op"), value))
+            pending = True
+        pos = m.end()
+    flush()
+    if not steps:
+        raise ValueError(f"Empty CSS selector: {group!r}")
+    return steps
+
+
+def _matcher(steps: List[Tuple[str, Compound]]) -> Matcher:
+    """Right-to-left match of a compound chain; ancestors are limited to the scope node's subtree."""
+    def match_from(node: Optional[Node], i: int, scope: Node) -> bool:
+        combinator, compound = steps[i]
+        if node is None or node is scope or not compound(node):
+            return False
+        if i == 0:
+            return True
+        parent = node.parent
+        if combinator == ">":
+            return match_from(parent, i - 1, scope)
+        while parent is not None and parent is not scope:
+            if match_from(parent, i - 1, scope):
+                return True
+            parent = parent.parent
+        return False
+
+    return lambda node, scope: match_from(node, len(steps) - 1, scope)
+
+
+def _split_groups(selector: str) -> List[str]:
+    """Split a selector list on commas outside quotes and [...] ('a[title="x, y"], b' -> two groups)."""
+    groups, start, quote, depth = [], 0, None, 0
+    for i, char in enumerate(selector):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth = max(0, depth - 1)
+        elif char == "," and depth == 0:
+            groups.append(selector[start:i])
+            start = i + 1
+    groups.append(selector[start:])
+    return groups
+
+
+def compile_selector(selector: str) -> Tuple[Matcher, ...]:
+    """Compiled matchers for a (comma separated) selector; cached per selector string."""
+    compiled = _cache.get(selector)
+    if compiled is None:
+        compiled = _cache[selector] = tuple(_matcher(_parse_group(g)) for g in _split_groups(selector))
+    return compiled
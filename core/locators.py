@@ -0,0 +1,58 @@
+"""
+Locators from locators/locators.json, compiled once at import.
+Every entry is validated and pre-resolved to a (By, value) tuple in an immutable table keyed by
+(section, key), so a lookup is a single dict access. An unknown "by" fails here, at load, instead
+of silently falling back to By.ID on first use.
+"""
+import json
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+from selenium.webdriver.common.by import By
+
+LOCATORS_PATH = Path(__file__).resolve().parent.parent / "locators" / "locators.json"
+
+# Map JSON "by" string to Selenium By
+BY_MAP = {
+    "id": By.ID,
+    "xpath": By.XPATH,
+    "css": By.CSS_SELECTOR,
+    "name": By.NAME,
+    "class": By.CLASS_NAME,
+    "tag": By.TAG_NAME,
+    "link_text": By.LINK_TEXT,
+    "partial_link_text": By.PARTIAL_LINK_TEXT,
+}
+
+Locator = Tuple[str, str]
+
+
+def compile_locators(raw: dict, source: str = "locators.json") -> dict[Tuple[str, str], Locator]:
+    """Validate raw JSON and resolve every entry to (By, value). Raises ValueError on bad entries."""
+    table: dict[Tuple[str, str], Locator] = {}
+    for section, items in raw.items():
+        if not isinstance(items, dict):
+            raise ValueError(f"{source}: section '{section}' must be an object")
+        for key, item in items.items():
+            if not isinstance(item, dict):
+                raise ValueError(f"{source}: '{section}.{key}' must be an object with 'by' and 'value'")
+            by_str = str(item.get("by", "id")).lower()
+            by = BY_MAP.get(by_str)
+            if by is None:
+                raise ValueError(f"{source}: '{section}.{key}' has unknown by={by_str!r}; expected one of {sorted(BY_MAP)}")
+            value = item.get("value")
+            if not isinstance(value, str) or not value:
+                raise ValueError(f"{source}: '{section}.{key}' has empty or missing 'value'")
+            table[(section, key)] = (by, value)
+    return table
+
+
+def load_locators(path: Path = LOCATORS_PATH) -> Mapping[Tuple[str, str], Locator]:
+    """Compiled, read-only locator table."""
+    with open(path, encoding="utf-8") as f:
+        return MappingProxyType(compile_locators(json.load(f), source=path.name))
+
+
+LOCATORS = load_locators()
+SECTIONS = frozenset(section for section, _ in LOCATORS)
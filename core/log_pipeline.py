@@ -0,0 +1,134 @@
+"""
+Logging setup for the test run (LOG_MODE / --log-mode):
+- console: plain INFO logging as before (pytest log_cli shows "Clicked on element ..." etc.).
+- queue: records go through a QueueHandler; a background QueueListener writes them as JSON lines,
+  buffered, to one file per worker (reports/logs/<worker_id>.jsonl). Tests never block on file I/O.
+- quiet: like queue, but per-action records from core.base_actions are only kept in a ring buffer
+  (last LOG_RING_SIZE per test) and are attached to the report only when a test fails.
+"""
+import json
+import logging
+import logging.handlers
+import queue
+from collections import deque
+from pathlib import Path
+from typing import Optional
+
+from config.settings import LOG_RING_SIZE
+from core.timing import recorder
+from core.workers import worker_id
+
+MODES = ("console", "queue", "quiet")
+ACTIONS_LOGGER = "core.base_actions"
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+DATE_FORMAT = "%H:%M:%S"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_file_handler: Optional[logging.Handler] = None
+_queue_handler: Optional[logging.Handler] = None
+_ring: Optional["ActionRingBuffer"] = None
+
+
+class _TestIdFilter(logging.Filter):
+    """Adds the running test id and worker id to each record. Runs in the caller's thread, before queueing."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.test_id = recorder.current_test
+        record.worker = worker_id()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message, test, worker."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps({
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "test": getattr(record, "test_id", ""),
+            "worker": getattr(record, "worker", ""),
+        })
+
+
+class ActionRingBuffer(logging.Handler):
+    """Keeps the last N records of the current test; formatted only if dumped."""
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__()
+        self.records: deque = deque(maxlen=capacity)
+        self.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+    def clear(self) -> None:
+        self.records.clear()
+
+    def dump(self) -> str:
+        return "\n".join(self.format(r) for r in self.records)
+
+
+def setup_logging(mode: str, log_dir: Path) -> None:
+    """Configure root logging for the given mode. Call once per process (pytest_configure)."""
+    global _listener, _file_handler, _queue_handler, _ring
+    if mode not in MODES:
+        raise ValueError(f"Unknown log mode {mode!r}; expected one of {MODES}")
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    if mode == "console":
+        logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, datefmt=DATE_FORMAT)
+        return
+
+    log_dir.mkdir(parents=True, exist_ok=True)
+    _file_handler = logging.FileHandler(log_dir / f"{worker_id()}.jsonl", mode="w", encoding="utf-8")
+    _file_handler.setFormatter(JsonFormatter())
+    # Flush to disk every 1000 records or on ERROR, not on every record
+    buffered = logging.handlers.MemoryHandler(1000, flushLevel=logging.ERROR, target=_file_handler)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _queue_handler.addFilter(_TestIdFilter())
+    root.addHandler(_queue_handler)
+    _listener = logging.handlers.QueueListener(log_queue, buffered, respect_handler_level=True)
+    _listener.start()
+
+    if mode == "quiet":
+        _ring = ActionRingBuffer(LOG_RING_SIZE)
+        actions_logger = logging.getLogger(ACTIONS_LOGGER)
+        actions_logger.addHandler(_ring)
+        actions_logger.propagate = False  # no console / queue cost per action
+
+
+def start_test() -> None:
+    """Forget per-action records of the previous test (quiet mode)."""
+    if _ring is not None:
+        _ring.clear()
+
+
+def failure_dump() -> Optional[str]:
+    """Per-action records of the current test (quiet mode), or None if there is nothing to attach."""
+    if _ring is None or not _ring.records:
+        return None
+    return _ring.dump()
+
+
+def shutdown_logging() -> None:
+    """Stop the listener and flush buffered records to the worker file."""
+    global _listener, _file_handler, _queue_handler, _ring
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()  # MemoryHandler: flushes into the file handler
+        _listener = None
+    if _file_handler is not None:
+        _file_handler.close()
+        _file_handler = None
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _ring is not None:
+        actions_logger = logging.getLogger(ACTIONS_LOGGER)
+        actions_logger.removeHandler(_ring)
+        actions_logger.propagate = True
+        _ring = None
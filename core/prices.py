@@ -0,0 +1,115 @@
+"""
+Price text -> Decimal, shared by the grid rules (pages.product_grid) and the product details page.
+Accepts what storefronts print: a currency symbol or ISO code before or after the amount, thousands separators
+and the decimal separator of the store's locale ("$1,299.00", "1.299,00 €", "CHF 1'299.00", "1 299,00 kr").
+The pattern for each format is compiled once. parse_many() reads a whole list in one call and returns the
+unparsable entries with the reason, so callers report them instead of skipping them.
+"""
+import re
+from decimal import Decimal
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from config.settings import PRICE_LOCALE
+
+CURRENCY_SYMBOLS = "$€£¥₹₽₺₩"
+_SPACES = "\u00a0\u202f\u2009"  # no-break, narrow no-break and thin space (group separators, padding)
+
+
+class PriceFormat(NamedTuple):
+    """Decimal separator and the thousands separators a locale prints."""
+
+    decimal: str
+    groups: str
+
+
+FORMATS: Dict[str, PriceFormat] = {
+    "en-US": PriceFormat(".", ","),
+    "en-GB": PriceFormat(".", ","),
+    "de-DE": PriceFormat(",", "."),
+    "nl-NL": PriceFormat(",", "."),
+    "fr-FR": PriceFormat(",", " " + _SPACES),
+    "sv-SE": PriceFormat(",", " " + _SPACES),
+    "de-CH": PriceFormat(".", "'’"),
+}
+
+
+class PriceError(ValueError):
+    """Text is not a price in the expected format."""
+
+
+class PriceBatch(NamedTuple):
+    """Result of parse_many: one value per input (None where unparsable) and (index, text, reason) per failure."""
+
+    values: List[Optional[Decimal]]
+    errors: List[Tuple[int, str, str]]
+
+
+class PriceParser:
+    """Parses prices of one locale format. Thread-safe; build once and reuse."""
+
+    def __init__(self, fmt: PriceFormat) -> None:
+        if fmt.decimal in fmt.groups:
+            raise ValueError(f"Decimal separator {fmt.decimal!r} is also a group separator in {fmt}")
+        self.format = fmt
+        group = f"[{re.escape(fmt.groups)}]"
+        currency = rf"(?:[{re.escape(CURRENCY_SYMBOLS)}]|[A-Z]{{3}}|kr)"
+        self._pattern = re.compile(
+            rf"""^(?:(?P<before>{currency})\s*)?
+                (?P<amount>\d{{1,3}}(?:{group}\d{{3}})+|\d+)
+                (?:{re.escape(fmt.decimal)}(?P<fraction>\d+))?
+                (?:\s*(?P<after>{currency}))?$""",
+            re.VERBOSE,
+        )
+        self._group_chars = re.compile(group)
+
+    def parse(self, text: str) -> Decimal:
+        """Price text -> Decimal. Raises PriceError with the reason if it is not a price."""
+        s = (text or "").strip(" \t\r\n" + _SPACES)
+        if not s:
+            raise PriceError("empty")
+        m = self._pattern.match(s)
+        if m is None:
+            raise PriceError(f"not a price in {self.format.decimal!r}-decimal format: {text!r}")
+        if m.group("before") and m.group("after"):
+            raise PriceError(f"currency on both sides: {text!r}")
+        digits = self._group_chars.sub("", m.group("amount"))
+        if m.group("fraction"):
+            digits = f"{digits}.{m.group('fraction')}"
+        return Decimal(digits)
+
+    def try_parse(self, text: str) -> Optional[Decimal]:
+        """Decimal, or None if text is not a price."""
+        try:
+            return self.parse(text)
+        except PriceError:
+            return None
+
+    def parse_many(self, texts: Iterable[str]) -> PriceBatch:
+        """Parse a whole list (e.g. every price on a grid) in one call; failures are returned, not dropped."""
+        values: List[Optional[Decimal]] = []
+        errors: List[Tuple[int, str, str]] = []
+        for i, text in enumerate(texts):
+            try:
+                values.append(self.parse(text))
+            except PriceError as e:
+                values.append(None)
+                errors.append((i, text, str(e)))
+        return PriceBatch(values, errors)
+
+
+_parsers: Dict[str, PriceParser] = {}
+
+
+def price_parser(locale: str = PRICE_LOCALE) -> PriceParser:
+    """Shared parser for a locale in FORMATS (default PRICE_LOCALE from config.settings)."""
+    parser = _parsers.get(locale)
+    if parser is None:
+        if locale not in FORMATS:
+            raise ValueError(f"Unknown price locale {locale!r}; expected one of {list(FORMATS)}")
+        parser = _parsers[locale] = PriceParser(FORMATS[locale])
+    return parser
+
+
+def parse_price(text: str, locale: str = PRICE_LOCALE) -> Decimal:
+    """Price text -> Decimal with the locale's parser. Raises PriceError if it is not a price."""
+    return price_parser(locale).parse(text)
@@ -0,0 +1,97 @@
+"""
+Create shop accounts over plain HTTP (no browser): GET /register for the antiforgery token and cookies,
+then POST the same form fields the register page sends. UserPool keeps a few such accounts per process
+so login tests check one out instead of depending on test_register_success having run first.
+test_register_success stays the UI coverage of the form itself.
+"""
+import http.cookiejar
+import logging
+import re
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
+from typing import Dict, List
+from urllib.parse import urlencode
+
+from config.settings import BASE_URL, PAGE_LOAD_TIMEOUT, USER_POOL_SIZE
+
+logger = logging.getLogger(__name__)
+
+TOKEN_FIELD = "__RequestVerificationToken"
+_TOKEN_RE = re.compile(rf'name="{TOKEN_FIELD}"[^>]*value="([^"]*)"')
+SUCCESS_TEXT = "Your registration completed"
+
+
+class ProvisioningError(RuntimeError):
+    """Account could not be created over HTTP."""
+
+
+def register_user_http(
+    email: str, password: str, first_name: str, last_name: str, base_url: str = BASE_URL
+) -> Dict[str, str]:
+    """Register one account with form posts (own cookie jar per call). Returns {'email', 'password'}."""
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+    register_url = f"{base_url.rstrip('/')}/register"
+    with opener.open(register_url, timeout=PAGE_LOAD_TIMEOUT) as response:
+        page = response.read().decode("utf-8", "replace")
+    form = {
+        "Gender": "F",
+        "FirstName": first_name,
+        "LastName": last_name,
+        "Email": email,
+        "Password": password,
+        "ConfirmPassword": password,
+        "register-button": "Register",
+    }
+    token = _TOKEN_RE.search(page)
+    if token:
+        form[TOKEN_FIELD] = unescape(token.group(1))
+    data = urlencode(form).encode("utf-8")
+    # Redirect to /registerresult is followed by the opener
+    with opener.open(register_url, data=data, timeout=PAGE_LOAD_TIMEOUT) as response:
+        final_url = response.geturl()
+        body = response.read().decode("utf-8", "replace")
+    if "registerresult" not in final_url and SUCCESS_TEXT not in body:
+        raise ProvisioningError(f"Registration of {email} failed (ended on {final_url})")
+    return {"email": email, "password": password}
+
+
+class UserPool:
+    """Accounts created over HTTP, checked out by one test at a time. Empty pool creates a user on demand."""
+
+    def __init__(self, first_name: str, last_name: str, password: str, size: int = USER_POOL_SIZE) -> None:
+        self.first_name = first_name
+        self.last_name = last_name
+        self.password = password
+        self.size = size
+        self._free: List[Dict[str, str]] = []
+        self._lock = threading.Lock()
+
+    def _create(self) -> Dict[str, str]:
+        email = f"pool.{time.time_ns()}.{threading.get_ident()}@example.com"
+        return register_user_http(email, self.password, self.first_name, self.last_name)
+
+    def fill(self) -> None:
+        """Create accounts concurrently until the pool holds `size` free ones."""
+        missing = self.size - len(self._free)
+        if missing <= 0:
+            return
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            users = list(executor.map(lambda _: self._create(), range(missing)))
+        with self._lock:
+            self._free.extend(users)
+        logger.info("Provisioned %d users over HTTP", len(users))
+
+    def checkout(self) -> Dict[str, str]:
+        """Take a free account (or create one now if none is free)."""
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+        return self._create()
+
+    def checkin(self, user: Dict[str, str]) -> None:
+        """Give an account back for later tests (only if the test left it usable: same password, not deleted)."""
+        with self._lock:
+            self._free.append(user)
@@ -0,0 +1,148 @@
+"""
+Per-test request blocking through Chrome DevTools (Network.setBlockedURLs).
+Grid tests that only read text (sorting, pagination) do not need product images or third-party scripts;
+config/request_blocking.json maps test markers to URL-pattern block lists. category_verification keeps
+images because it checks the .picture blocks.
+
+Every timed page load is tagged as blocked or not (observe()), which costs no WebDriver call; core.timing.summarize()
+turns that into page-load time saved (blocked load vs the median unblocked load of the same page) in
+reports/timings.json. Request counts and bytes saved need the page's resource list, one extra script call per load,
+so they are only collected with --asset-stats: blocked loads record how many requests were blocked and their size,
+taken from sizes learned on unblocked loads (kept across runs in ASSET_SIZE_CACHE).
+"""
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from config.settings import ASSET_SIZE_CACHE
+
+logger = logging.getLogger(__name__)
+
+RULES_PATH = Path(__file__).resolve().parent.parent / "config" / "request_blocking.json"
+
+# URLs of sub-resources the page asked for, and sizes of the ones that did load (resource timing)
+_RESOURCES_JS = """
+const requested = [];
+document.querySelectorAll('img[src], script[src], link[rel~="stylesheet"][href], link[rel~="icon"][href]')
+    .forEach(el => requested.push(el.src || el.href));
+const loaded = performance.getEntriesByType('resource')
+    .map(e => [e.name, e.encodedBodySize || e.transferSize || 0]);
+return {requested: requested, loaded: loaded};
+"""
+
+
+def _wildcard_to_regex(pattern: str) -> re.Pattern:
+    """Same matching as Network.setBlockedURLs: '*' matches anything, the rest is literal."""
+    return re.compile("^" + ".*".join(re.escape(part) for part in pattern.split("*")) + "$")
+
+
+class BlockingRules:
+    """Marker -> block list from config/request_blocking.json. First configured marker the test has wins."""
+
+    def __init__(self, path: Path = RULES_PATH) -> None:
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f)
+        groups: Dict[str, List[str]] = raw["groups"]
+        self.by_marker: List[Tuple[str, Tuple[str, ...]]] = [
+            (entry["marker"], tuple(p for group in entry["block"] for p in groups[group])) for entry in raw["markers"]
+        ]
+        # Everything that could ever be blocked; sizes are only learned for these URLs
+        self.all_patterns: Tuple[re.Pattern, ...] = tuple(
+            _wildcard_to_regex(p) for patterns in groups.values() for p in patterns
+        )
+
+    def patterns_for(self, marker_names: Iterable[str]) -> Tuple[str, ...]:
+        """Block list for a test with these markers (empty tuple = block nothing)."""
+        names = set(marker_names)
+        for marker, patterns in self.by_marker:
+            if marker in names:
+                return patterns
+        return ()
+
+    def is_blockable(self, url: str) -> bool:
+        return any(p.match(url) for p in self.all_patterns)
+
+
+def set_blocked_urls(driver: WebDriver, patterns: Tuple[str, ...]) -> None:
+    """
+    Apply a test's block list to its browser and keep the matching regexes on its DriverHandle for observe().
+    Pooled browsers come back from DriverPool.reset with an empty list, so nothing is sent when there is nothing to block.
+    """
+    if not patterns:
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+    driver.blocked_regexes = tuple(_wildcard_to_regex(p) for p in patterns)
+
+
+class SavingsTracker:
+    """Learns asset sizes from unblocked page loads and annotates page_load steps with what was blocked."""
+
+    def __init__(self, size_cache: Path = ASSET_SIZE_CACHE) -> None:
+        self.size_cache = size_cache
+        self.rules: BlockingRules | None = None
+        self.measure = False
+        self.sizes: Dict[str, int] = {}
+
+    def enable(self, rules: BlockingRules, measure: bool = False) -> None:
+        """Turn on observation for this process; with measure, also read resource stats and load learned sizes."""
+        self.rules = rules
+        self.measure = measure
+        if not measure:
+            return
+        try:
+            self.sizes = json.loads(self.size_cache.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.sizes = {}
+
+    def observe(self, driver: WebDriver, step: dict) -> None:
+        """
+        After a page load: tag the step as blocked or not. With measure, also learn sizes (unblocked) or record
+        blocked requests and bytes saved (blocked).
+        """
+        if self.rules is None or not step:  # off, or a page load nested in another timed step
+            return
+        blocked_regexes = getattr(driver, "blocked_regexes", ())  # a plain WebDriver blocks nothing
+        step["path"] = urlsplit(step["key"]).path or "/"
+        step["blocking"] = bool(blocked_regexes)
+        if not self.measure:
+            return
+        try:
+            resources = driver.execute_script(_RESOURCES_JS)
+        except WebDriverException as e:
+            logger.debug("Could not read page resources: %s", e)
+            return
+        if not blocked_regexes:
+            for url, size in resources["loaded"]:
+                if size and self.rules.is_blockable(url):
+                    self.sizes[url] = size
+            return
+        blocked = {url for url in resources["requested"] if any(p.match(url) for p in blocked_regexes)}
+        known = [self.sizes[url] for url in blocked if url in self.sizes]
+        step["blocked_requests"] = len(blocked)
+        step["bytes_saved"] = sum(known)
+        step["blocked_unknown_size"] = len(blocked) - len(known)
+
+    def save(self) -> None:
+        """Merge learned sizes into the shared cache file (atomic; parallel workers may write too)."""
+        if not self.measure or not self.sizes:
+            return
+        try:
+            merged = json.loads(self.size_cache.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            merged = {}
+        merged.update(self.sizes)
+        self.size_cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.size_cache.with_name(f"{self.size_cache.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(merged), encoding="utf-8")
+        os.replace(tmp, self.size_cache)
+
+
+savings = SavingsTracker()
@@ -0,0 +1,70 @@
+"""
+Streaming sort-order check: values are fed page by page and compared with the previous one only (O(n), one
+carried key, no sorted copy). The last key of a page is carried into the next, so the boundary between
+page N and page N+1 is checked like any other pair. Equal keys (ties) are always in order.
+"""
+import unicodedata
+from typing import Any, Callable, Iterable, NamedTuple, Optional
+
+
+def name_collation_key(text: str) -> str:
+    """
+    Key for comparing product names the way the shop's database orders them (case- and accent-insensitive):
+    'Écharpe' sorts with 'echarpe', 'blue' with 'Blue'. Whitespace is collapsed.
+    """
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+class SortViolation(NamedTuple):
+    """First pair out of order: where the offending value is and the value before it (possibly on an earlier page)."""
+
+    page: int
+    position: int
+    value: Any
+    previous_page: int
+    previous_position: int
+    previous_value: Any
+
+
+class SortValidator:
+    """
+    Checks that values arrive in ascending (or descending) order across feed() calls. None values (e.g. an
+    item without a price) are skipped but still count for positions. Only the first violation is kept.
+    """
+
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None, descending: bool = False, label: str = "") -> None:
+        self.key = key
+        self.descending = descending
+        self.label = label or ("descending" if descending else "ascending")
+        self.last_page = 0
+        self.count = 0
+        self.violation: Optional[SortViolation] = None
+        self._previous: Optional[tuple] = None  # (key, page, position, value)
+
+    def feed(self, page: int, values: Iterable[Any]) -> Optional[SortViolation]:
+        """Check one page (positions are 1-based on the page). Returns the first violation seen so far, or None."""
+        self.last_page = page
+        if self.violation is not None:
+            return self.violation
+        for position, value in enumerate(values, start=1):
+            if value is None:
+                continue
+            key = self.key(value) if self.key else value
+            self.count += 1
+            if self._previous is not None:
+                prev_key, prev_page, prev_position, prev_value = self._previous
+                if (key > prev_key) if self.descending else (key < prev_key):
+                    self.violation = SortViolation(page, position, value, prev_page, prev_position, prev_value)
+                    return self.violation
+            self._previous = (key, page, position, value)
+        return None
+
+    def error(self) -> Optional[str]:
+        """Message for the first violation, or None if everything fed so far is in order."""
+        v = self.violation
+        if v is None:
+            return None
+        return (f"Not {self.label}: page {v.page} position {v.position} ({v.value!r}) comes after "
+                f"page {v.previous_page} position {v.previous_position} ({v.previous_value!r})")
@@ -0,0 +1,146 @@
+"""
+Timing of BaseActions calls and page loads.
+Each step is tagged with test id, page object, action and section/key, and split into wait time
+(explicit waits) and interaction time (the rest). summarize() turns the raw steps into a per-test and
+per-session breakdown; conftest writes it as JSON next to the HTML report (reports/timings.json).
+In parallel runs each worker dumps its raw steps and the controller merges them.
+"""
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List
+
+RAW_GLOB = "timings.*.raw.json"
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0.0 for an empty list)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class TimingRecorder:
+    """Collects timed steps for the current process. Nested steps are folded into the outermost one."""
+
+    def __init__(self) -> None:
+        self.current_test = ""
+        self.steps: List[dict] = []
+        self._local = threading.local()
+
+    @contextmanager
+    def step(self, action: str, section: str = "", key: str = "", page: str = "") -> Iterator[dict]:
+        """
+        Time one action. Waits reported through add_wait() inside it count as wait time.
+        Yields the step record so callers can attach extra fields (e.g. core.request_blocking on page loads).
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        if stack:  # nested call (e.g. select_by_value -> find_element): fold into the outer step
+            yield {}
+            return
+        record = {"test": self.current_test, "page": page, "action": action, "section": section, "key": key, "wait_s": 0.0}
+        stack.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            stack.pop()
+            record["total_s"] = time.perf_counter() - start
+            record["interaction_s"] = max(0.0, record["total_s"] - record["wait_s"])
+            self.steps.append(record)
+
+    def add_wait(self, seconds: float) -> None:
+        """Attribute seconds of explicit waiting to the step in progress (no-op outside a step)."""
+        stack = getattr(self._local, "stack", None)
+        if stack:
+            stack[-1]["wait_s"] += seconds
+
+    def dump_raw(self, path: Path) -> None:
+        """Write raw steps (used by xdist workers so the controller can merge)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.steps), encoding="utf-8")
+
+
+recorder = TimingRecorder()
+
+
+def summarize(steps: Iterable[dict], top: int = 10) -> dict:
+    """Per-test and per-session breakdown: wait vs interaction time, slowest locators, page load percentiles."""
+    steps = list(steps)
+    per_test: Dict[str, dict] = {}
+    per_locator: Dict[str, dict] = {}
+    page_loads: List[float] = []
+    for s in steps:
+        t = per_test.setdefault(s["test"] or "<session>", {"steps": 0, "total_s": 0.0, "wait_s": 0.0, "interaction_s": 0.0, "page_load_s": 0.0})
+        t["steps"] += 1
+        t["total_s"] += s["total_s"]
+        if s["action"] == "page_load":
+            t["page_load_s"] += s["total_s"]
+            page_loads.append(s["total_s"])
+            continue
+        t["wait_s"] += s["wait_s"]
+        t["interaction_s"] += s["interaction_s"]
+        name = f"{s['section']}.{s['key']}" if s["section"] else s["action"]
+        loc = per_locator.setdefault(name, {"locator": name, "calls": 0, "total_s": 0.0, "wait_s": 0.0, "max_s": 0.0})
+        loc["calls"] += 1
+        loc["total_s"] += s["total_s"]
+        loc["wait_s"] += s["wait_s"]
+        loc["max_s"] = max(loc["max_s"], s["total_s"])
+    page_loads.sort()
+    session = {
+        "steps": len(steps),
+        "total_s": sum(s["total_s"] for s in steps),
+        "wait_s": sum(s["wait_s"] for s in steps if s["action"] != "page_load"),
+        "interaction_s": sum(s["interaction_s"] for s in steps if s["action"] != "page_load"),
+        "page_load_s": sum(page_loads),
+        "page_load_count": len(page_loads),
+        "page_load_percentiles": {
+            "p50": _percentile(page_loads, 50),
+            "p90": _percentile(page_loads, 90),
+            "p95": _percentile(page_loads, 95),
+            "max": page_loads[-1] if page_loads else 0.0,
+        },
+    }
+    slow = sorted(per_locator.values(), key=lambda x: x["total_s"], reverse=True)[:top]
+    return {"session": session, "slow_locators": slow, "tests": per_test, "asset_blocking": _blocking_savings(steps)}
+
+
+def _blocking_savings(steps: List[dict]) -> dict:
+    """
+    Bytes and page-load time saved by core.request_blocking. Time saved per blocked load is the median
+    unblocked load of the same path minus the blocked load; paths never loaded unblocked are not estimated.
+    """
+    loads = [s for s in steps if s["action"] == "page_load" and "blocking" in s]
+    baseline: Dict[str, List[float]] = {}
+    for s in loads:
+        if not s["blocking"]:
+            baseline.setdefault(s["path"], []).append(s["total_s"])
+    medians = {path: _percentile(sorted(times), 50) for path, times in baseline.items()}
+    blocked = [s for s in loads if s["blocking"]]
+    compared = [s for s in blocked if s["path"] in medians]
+    return {
+        "blocked_page_loads": len(blocked),
+        "unblocked_page_loads": len(loads) - len(blocked),
+        "blocked_requests": sum(s.get("blocked_requests", 0) for s in blocked),
+        "bytes_saved": sum(s.get("bytes_saved", 0) for s in blocked),
+        "blocked_requests_unknown_size": sum(s.get("blocked_unknown_size", 0) for s in blocked),
+        "page_load_time_saved_s": sum(medians[s["path"]] - s["total_s"] for s in compared),
+        "page_loads_compared": len(compared),
+    }
+
+
+def write_report(report_dir: Path, own_steps: List[dict], filename: str = "timings.json") -> Path:
+    """Merge own steps with raw worker dumps in report_dir, write the summary JSON, delete the dumps."""
+    steps = list(own_steps)
+    for raw in sorted(report_dir.glob(RAW_GLOB)):
+        steps.extend(json.loads(raw.read_text(encoding="utf-8")))
+        raw.unlink()
+    report_dir.mkdir(parents=True, exist_ok=True)
+    path = report_dir / filename
+    path.write_text(json.dumps(summarize(steps), indent=2), encoding="utf-8")
+    return path
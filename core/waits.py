@@ -0,0 +1,61 @@
+"""
+Explicit, condition-based waiting. The driver runs with implicit wait 0 (see core.driver_factory),
+so every wait is a WebDriverWait polling at POLL_INTERVAL and nothing compounds with an implicit wait.
+A timeout can be a number of seconds or a Deadline shared by several calls (one budget for a whole check).
+"""
+import time
+from typing import Callable, TypeVar
+
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config.settings import POLL_INTERVAL
+
+T = TypeVar("T")
+
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+
+class Deadline:
+    """Time budget shared by several waits, e.g. `d = Deadline(5); actions.click(..., timeout=d); actions.get_text(..., timeout=d)`."""
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self._end = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left (never negative)."""
+        return max(0.0, self._end - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() == 0.0
+
+    def __repr__(self) -> str:
+        return f"Deadline({self.seconds}s, remaining={self.remaining():.2f}s)"
+
+
+Timeout = float | Deadline
+
+
+def seconds_left(timeout: Timeout) -> float:
+    """Seconds available for one wait: the number itself or what is left of the Deadline."""
+    return timeout.remaining() if isinstance(timeout, Deadline) else float(timeout)
+
+
+def wait_until(driver: WebDriver, condition: Callable[[WebDriver], T], timeout: Timeout, poll: float = POLL_INTERVAL, message: str = "") -> T:
+    """
+    Return the first truthy value of condition(driver).
+    Fast path: the condition is checked once right away; polling (and WebDriverWait) only starts if it is not met yet.
+    Raises TimeoutException when the budget runs out.
+    """
+    try:
+        result = condition(driver)
+        if result:
+            return result
+    except IGNORED_EXCEPTIONS:
+        pass
+    return WebDriverWait(driver, seconds_left(timeout), poll_frequency=poll, ignored_exceptions=IGNORED_EXCEPTIONS).until(
+        condition, message
+    )
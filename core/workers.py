@@ -0,0 +1,26 @@
+"""
+Worker identity for parallel runs (pytest -n N, pytest-xdist).
+Every worker process gets its own output folder so files written by tests do not collide.
+"""
+import os
+from pathlib import Path
+
+OUTPUT_DIR = Path(__file__).resolve().parent.parent / "output"
+WORKERS_DIR = OUTPUT_DIR / "workers"
+
+
+def worker_id() -> str:
+    """xdist worker id (gw0, gw1, ...) or 'master' for a serial run / the controller process."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def is_worker() -> bool:
+    """True when running inside an xdist worker process."""
+    return worker_id() != "master"
+
+
+def worker_output_dir() -> Path:
+    """output/ for serial runs; output/workers/<worker_id>/ inside an xdist worker. Created if missing."""
+    path = WORKERS_DIR / worker_id() if is_worker() else OUTPUT_DIR
+    path.mkdir(parents=True, exist_ok=True)
+    return path
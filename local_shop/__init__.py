@@ -0,0 +1,4 @@
+# Local stand-in for Demo Web Shop (offline runs)
+from local_shop.server import LocalShopServer
+
+__all__ = ["LocalShopServer"]
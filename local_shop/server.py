@@ -0,0 +1,462 @@
+"""
+Local stand-in for Demo Web Shop (https://demowebshop.tricentis.com/).
+Serves templated versions of the pages the suite touches, with the same markup, ids and classes the
+locators use: home + search, category pages with pager and orderby, product details, register (with
+client- and server-side validation), login, logout and the error page. Catalog data: catalog.json.
+Runs in a background thread of the test process (see conftest.local_shop) or standalone:
+    python -m local_shop.server [port]
+"""
+import html
+import json
+import re
+import secrets
+import sys
+import threading
+from decimal import Decimal
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+CATALOG_PATH = Path(__file__).resolve().parent / "catalog.json"
+AUTH_COOKIE = "NOPCOMMERCE.AUTH"
+TOKEN_FIELD = "__RequestVerificationToken"
+
+# orderby value -> (visible text, sort key, reverse)
+SORT_OPTIONS = {
+    0: ("Position", lambda p: p["id"], False),
+    5: ("Name: A to Z", lambda p: p["name"].lower(), False),
+    6: ("Name: Z to A", lambda p: p["name"].lower(), True),
+    10: ("Price: Low to High", lambda p: Decimal(p["price"]), False),
+    11: ("Price: High to Low", lambda p: Decimal(p["price"]), True),
+    15: ("Created on", lambda p: p["created"], True),
+}
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+# 1x1 transparent PNG served for every product picture
+_PIXEL_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d4944415478da63f8ffff3f0005fe02fea7d6a4f10000000049454e44ae426082"
+)
+
+_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Demo Web Shop. {title}</title>
+<style>.field-validation-valid{{display:none}} .field-validation-error{{color:#e4434b}}</style>
+<script>function setLocation(url) {{ window.location.href = url; }}</script>
+</head><body>
+<div class="master-wrapper-page"><div class="master-wrapper-content">
+<div class="header">
+  <div class="header-logo"><a href="/"><img alt="Tricentis Demo Web Shop" src="/images/logo.png"></a></div>
+  <div class="header-links-wrapper"><div class="header-links"><ul>{header_links}</ul></div></div>
+  <div class="search-box"><form action="/search" method="get">
+    <input type="text" class="search-box-text" id="small-searchterms" name="q" value="">
+    <input type="submit" class="button-1 search-box-button" value="Search">
+  </form></div>
+</div>
+<div class="header-menu"><ul class="top-menu">{top_menu}</ul></div>
+<div class="master-wrapper-main"><div class="center-2">{content}</div></div>
+</div></div>
+</body></html>
+"""
+
+_REGISTER_JS = """<script>
+(function () {
+  var form = document.getElementById('register-form');
+  var emailRe = /^[^@\\s]+@[^@\\s]+\\.[^@\\s]+$/;
+  var fields = ['FirstName', 'LastName', 'Email', 'Password', 'ConfirmPassword'];
+  function show(name, text) {
+    var span = form.querySelector("span[data-valmsg-for='" + name + "']");
+    span.textContent = text;
+    span.className = text ? 'field-validation-error' : 'field-validation-valid';
+  }
+  form.addEventListener('submit', function (e) {
+    var v = function (n) { return form.elements[n].value; };
+    var errors = {
+      FirstName: v('FirstName').trim() ? '' : 'First name is required.',
+      LastName: v('LastName').trim() ? '' : 'Last name is required.',
+      Email: !v('Email').trim() ? 'Email is required.' : (emailRe.test(v('Email').trim()) ? '' : 'Wrong email'),
+      Password: !v('Password').trim() ? 'Password is required.'
+        : (v('Password').length < 6 ? 'The password should have at least 6 characters.' : ''),
+      ConfirmPassword: !v('ConfirmPassword').trim() ? 'Password is required.'
+        : (v('ConfirmPassword') !== v('Password') ? 'The password and confirmation password do not match.' : '')
+    };
+    var ok = true;
+    fields.forEach(function (n) { show(n, errors[n]); if (errors[n]) { ok = false; } });
+    if (!ok) { e.preventDefault(); }
+  });
+  form.addEventListener('reset', function () { fields.forEach(function (n) { show(n, ''); }); });
+})();
+</script>"""
+
+
+def validate_registration(form: Dict[str, str]) -> Dict[str, str]:
+    """Server-side copy of the register form rules. Returns {field: message} for invalid fields."""
+    errors = {}
+    if not form.get("FirstName", "").strip():
+        errors["FirstName"] = "First name is required."
+    if not form.get("LastName", "").strip():
+        errors["LastName"] = "Last name is required."
+    email = form.get("Email", "").strip()
+    if not email:
+        errors["Email"] = "Email is required."
+    elif not _EMAIL_RE.match(email):
+        errors["Email"] = "Wrong email"
+    password = form.get("Password", "")
+    if not password.strip():
+        errors["Password"] = "Password is required."
+    elif len(password) < 6:
+        errors["Password"] = "The password should have at least 6 characters."
+    confirm = form.get("ConfirmPassword", "")
+    if not confirm.strip():
+        errors["ConfirmPassword"] = "Password is required."
+    elif confirm != password:
+        errors["ConfirmPassword"] = "The password and confirmation password do not match."
+    return errors
+
+
+class ShopState:
+    """Catalog plus mutable state (users, sessions, antiforgery tokens). Shared by all request threads."""
+
+    def __init__(self, catalog_path: Path = CATALOG_PATH) -> None:
+        with open(catalog_path, encoding="utf-8") as f:
+            catalog = json.load(f)
+        self.categories: List[dict] = catalog["categories"]
+        self.page_size: int = catalog["page_size"]
+        self.products: List[dict] = catalog["products"]
+        self.by_slug = {p["slug"]: p for p in self.products}
+        self.category_slugs = {c["slug"]: c for c in self.categories}
+        self.users: Dict[str, str] = {}
+        self.sessions: Dict[str, str] = {}
+        self.tokens: set = set()
+        self.lock = threading.Lock()
+
+    def new_token(self) -> str:
+        token = secrets.token_urlsafe(24)
+        with self.lock:
+            self.tokens.add(token)
+        return token
+
+    def use_token(self, token: str) -> bool:
+        with self.lock:
+            if token in self.tokens:
+                self.tokens.discard(token)
+                return True
+        return False
+
+    def login(self, email: str) -> str:
+        session = secrets.token_hex(16)
+        with self.lock:
+            self.sessions[session] = email
+        return session
+
+
+class ShopHandler(BaseHTTPRequestHandler):
+    """Routes GET/POST requests to page renderers."""
+
+    server_version = "LocalDemoWebShop/1.0"
+    state: ShopState  # set on the server class by LocalShopServer
+
+    def log_message(self, format, *args):  # keep test output clean
+        pass
+
+    # ---- helpers -------------------------------------------------------------------------------
+
+    def _user(self) -> Optional[str]:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get(AUTH_COOKIE)
+        return self.state.sessions.get(morsel.value) if morsel else None
+
+    def _form(self) -> Dict[str, str]:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8") if length else ""
+        return {k: v[0] for k, v in parse_qs(body, keep_blank_values=True).items()}
+
+    def _send(self, body: str | bytes, status: int = 200, content_type: str = "text/html; charset=utf-8", headers: Optional[Dict[str, str]] = None) -> None:
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _redirect(self, location: str, cookie: Optional[str] = None) -> None:
+        headers = {"Location": location}
+        if cookie is not None:
+            headers["Set-Cookie"] = cookie
+        self._send("", status=302, headers=headers)
+
+    def _page(self, title: str, content: str, status: int = 200) -> None:
+        user = self._user()
+        if user:
+            links = (f'<li><a href="/customer/info" class="ico-account">{html.escape(user)}</a></li>'
+                     '<li><a href="/logout" class="ico-logout">Log out</a></li>')
+        else:
+            links = ('<li><a href="/register" class="ico-register">Register</a></li>'
+                     '<li><a href="/login" class="ico-login">Log in</a></li>')
+        menu = "".join(f'<li><a href="/{c["slug"]}">{html.escape(c["name"])}</a></li>' for c in self.state.categories)
+        self._send(_PAGE.format(title=html.escape(title), header_links=links, top_menu=menu, content=content), status=status)
+
+    @staticmethod
+    def _product_box(p: dict) -> str:
+        name = html.escape(p["name"])
+        return (
+            '<div class="item-box"><div class="product-item" data-productid="{id}">'
+            '<div class="picture"><a href="/{slug}" title="Show details for {name}">'
+            '<img alt="Picture of {name}" src="/images/{slug}.png"></a></div>'
+            '<div class="details"><h2 class="product-title"><a href="/{slug}">{name}</a></h2>'
+            '<div class="add-info"><div class="prices"><span class="price actual-price">{price}</span></div>'
+            '<div class="buttons"><input type="button" value="Add to cart" class="button-2 product-box-add-to-cart-button"></div>'
+            "</div></div></div></div>"
+        ).format(id=p["id"], slug=p["slug"], name=name, price=p["price"])
+
+    def _grid(self, products: List[dict]) -> str:
+        return '<div class="product-grid">' + "".join(self._product_box(p) for p in products) + "</div>"
+
+    # ---- pages ---------------------------------------------------------------------------------
+
+    def _home(self) -> None:
+        featured = self._grid(self.state.products[:6])
+        self._page("Home", f'<div class="page home-page"><div class="product-grid home-page-product-grid">'
+                           f'<div class="title"><strong>Featured products</strong></div></div>{featured}</div>')
+
+    def _search(self, query: Dict[str, List[str]]) -> None:
+        q = (query.get("q") or [""])[0].strip()
+        found = [p for p in self.state.products if q and q.lower() in p["name"].lower()]
+        results = self._grid(found) if found else '<strong class="result">No products were found that matched your criteria.</strong>'
+        self._page("Search", f'<div class="page search-page"><div class="page-title"><h1>Search</h1></div>'
+                             f'<div class="search-results">{results}</div></div>')
+
+    def _category(self, slug: str, query: Dict[str, List[str]]) -> None:
+        state = self.state
+        orderby_raw = (query.get("orderby") or [None])[0]
+        orderby = int(orderby_raw) if orderby_raw and orderby_raw.isdigit() and int(orderby_raw) in SORT_OPTIONS else None
+        pagesize_raw = (query.get("pagesize") or [None])[0]
+        pagesize = int(pagesize_raw) if pagesize_raw and pagesize_raw.isdigit() and int(pagesize_raw) > 0 else None
+        page_raw = (query.get("pagenumber") or ["1"])[0]
+        page = int(page_raw) if page_raw.isdigit() and int(page_raw) > 0 else 1
+
+        _, key, reverse = SORT_OPTIONS[orderby or 0]
+        products = sorted((p for p in state.products if p["category"] == slug), key=key, reverse=reverse)
+        size = pagesize or state.page_size
+        pages = max(1, -(-len(products) // size))
+        page = min(page, pages)
+        shown = products[(page - 1) * size: page * size]
+
+        def url(n: int, with_order: Optional[int] = orderby) -> str:
+            params = {}
+            if with_order is not None:
+                params["orderby"] = with_order
+            if pagesize:
+                params["pagesize"] = pagesize
+            if n > 1:
+                params["pagenumber"] = n
+            return f"/{slug}" + (f"?{urlencode(params)}" if params else "")
+
+        host = f"http://{self.headers.get('Host', 'localhost')}"
+        options = "".join(
+            f'<option {"selected=selected " if (orderby or 0) == value else ""}value="{host}{html.escape(url(1, value))}">{text}</option>'
+            for value, (text, _, _) in SORT_OPTIONS.items()
+        )
+        pager_items = []
+        if page > 1:
+            pager_items.append(f'<li class="previous-page"><a href="{html.escape(url(page - 1))}">Previous</a></li>')
+        for n in range(1, pages + 1):
+            if n == page:
+                pager_items.append(f'<li class="current-page"><span>{n}</span></li>')
+            else:
+                pager_items.append(f'<li class="individual-page"><a href="{html.escape(url(n))}">{n}</a></li>')
+        if page < pages:
+            pager_items.append(f'<li class="next-page"><a href="{html.escape(url(page + 1))}">Next</a></li>')
+        pager = f'<div class="pager"><ul>{"".join(pager_items)}</ul></div>' if pages > 1 else ""
+        name = html.escape(state.category_slugs[slug]["name"])
+        self._page(state.category_slugs[slug]["name"], (
+            f'<div class="page category-page"><div class="page-title"><h1>{name}</h1></div>'
+            '<div class="product-selectors"><div class="product-sorting"><span>Sort by</span>'
+            f'<select id="products-orderby" name="products-orderby" onchange="setLocation(this.value);">{options}</select>'
+            f'</div></div>{self._grid(shown)}{pager}</div>'
+        ))
+
+    def _product(self, p: dict) -> None:
+        name = html.escape(p["name"])
+        self._page(p["name"], (
+            '<div class="page product-details-page"><div class="product-essential">'
+            f'<div class="picture"><img alt="Picture of {name}" src="/images/{p["slug"]}.png"></div>'
+            f'<div class="overview"><div class="product-name"><h1 itemprop="name">{name}</h1></div>'
+            f'<div class="product-price"><span itemprop="price">{p["price"]}</span></div>'
+            f'<div class="add-to-cart"><input type="button" class="button-1 add-to-cart-button" value="Add to cart"></div>'
+            "</div></div></div>"
+        ))
+
+    def _register_form(self, form: Optional[Dict[str, str]] = None, errors: Optional[Dict[str, str]] = None, summary: str = "") -> None:
+        form = form or {}
+        errors = errors or {}
+
+        def field(name: str, label: str, kind: str = "text") -> str:
+            value = "" if kind == "password" else html.escape(form.get(name, ""), quote=True)
+            message = errors.get(name, "")
+            css = "field-validation-error" if message else "field-validation-valid"
+            return (f'<div class="inputs"><label for="{name}">{label}:</label>'
+                    f'<input class="text-box single-line" id="{name}" name="{name}" type="{kind}" value="{value}">'
+                    f'<span class="{css}" data-valmsg-for="{name}" data-valmsg-replace="true">{html.escape(message)}</span></div>')
+
+        summary_html = f'<div class="validation-summary-errors"><ul><li>{html.escape(summary)}</li></ul></div>' if summary else ""
+        self._page("Register", (
+            '<div class="page registration-page"><div class="page-title"><h1>Register</h1></div>'
+            f'<form action="/register" method="post" id="register-form">{summary_html}'
+            f'<input name="{TOKEN_FIELD}" type="hidden" value="{self.state.new_token()}">'
+            '<div class="inputs"><label>Gender:</label>'
+            '<input id="gender-male" name="Gender" type="radio" value="M"><label for="gender-male">Male</label>'
+            '<input id="gender-female" name="Gender" type="radio" value="F"><label for="gender-female">Female</label></div>'
+            + field("FirstName", "First name") + field("LastName", "Last name") + field("Email", "Email")
+            + field("Password", "Password", "password") + field("ConfirmPassword", "Confirm password", "password")
+            + '<div class="buttons"><input type="submit" id="register-button" class="button-1 register-next-step-button" '
+              'value="Register" name="register-button"></div></form></div>'
+            + _REGISTER_JS
+        ))
+
+    def _register_post(self) -> None:
+        form = self._form()
+        if any(c in value for value in form.values() for c in "<>"):
+            # Same as the public site: request validation rejects markup with an internal error page
+            self._redirect("/errorpage.htm?aspxerrorpath=/register")
+            return
+        if not self.state.use_token(form.get(TOKEN_FIELD, "")):
+            self._redirect("/errorpage.htm?aspxerrorpath=/register")
+            return
+        errors = validate_registration(form)
+        if errors:
+            self._register_form(form, errors)
+            return
+        email = form["Email"].strip()
+        with self.state.lock:
+            exists = email.lower() in self.state.users
+            if not exists:
+                self.state.users[email.lower()] = form["Password"]
+        if exists:
+            self._register_form(form, summary="The specified email already exists")
+            return
+        session = self.state.login(email)
+        self._redirect("/registerresult/1", cookie=f"{AUTH_COOKIE}={session}; Path=/; HttpOnly")
+
+    def _login_form(self, email: str = "", failed: bool = False) -> None:
+        summary = ('<div class="message-error"><div class="validation-summary-errors"><span>Login was unsuccessful. '
+                   'Please correct the errors and try again.</span><ul><li>No customer account found</li></ul></div></div>') if failed else ""
+        self._page("Login", (
+            '<div class="page login-page"><div class="page-title"><h1>Welcome, Please Sign In!</h1></div>'
+            f'<div class="returning-wrapper"><form action="/login" method="post">{summary}'
+            f'<input name="{TOKEN_FIELD}" type="hidden" value="{self.state.new_token()}">'
+            f'<div class="inputs"><label for="Email">Email:</label><input autofocus="autofocus" class="email" id="Email" name="Email" type="text" value="{html.escape(email, quote=True)}"></div>'
+            '<div class="inputs"><label for="Password">Password:</label><input class="password" id="Password" name="Password" type="password"></div>'
+            '<div class="inputs reversed"><input id="RememberMe" name="RememberMe" type="checkbox" value="true"><label for="RememberMe">Remember me?</label></div>'
+            '<div class="buttons"><input class="button-1 login-button" type="submit" value="Log in"></div>'
+            "</form></div></div>"
+        ))
+
+    def _login_post(self) -> None:
+        form = self._form()
+        if not self.state.use_token(form.get(TOKEN_FIELD, "")):
+            self._redirect("/errorpage.htm?aspxerrorpath=/login")
+            return
+        email = form.get("Email", "").strip()
+        password = self.state.users.get(email.lower())
+        if not email or password is None or password != form.get("Password", ""):
+            self._login_form(email, failed=True)
+            return
+        session = self.state.login(email)
+        self._redirect("/", cookie=f"{AUTH_COOKIE}={session}; Path=/; HttpOnly")
+
+    def _logout(self) -> None:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get(AUTH_COOKIE)
+        if morsel:
+            with self.state.lock:
+                self.state.sessions.pop(morsel.value, None)
+        self._redirect("/", cookie=f"{AUTH_COOKIE}=; Path=/; Max-Age=0")
+
+    def _error_page(self) -> None:
+        self._page("Error", '<div class="page error-page"><div class="page-body">'
+                            "<p>We're sorry, an internal error occurred.</p>"
+                            "<p>Our supporting staff has been notified of this error and will address the issue shortly.</p>"
+                            "</div></div>")
+
+    def _not_found(self) -> None:
+        self._page("Page not found", '<div class="page not-found-page"><div class="page-body">'
+                                     "<p>The page you requested was not found.</p></div></div>", status=404)
+
+    # ---- routing -------------------------------------------------------------------------------
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip("/") or "/"
+        query = parse_qs(parts.query)
+        slug = path.lstrip("/")
+        if path == "/":
+            self._home()
+        elif path == "/search":
+            self._search(query)
+        elif path == "/register":
+            self._register_form()
+        elif path.startswith("/registerresult"):
+            self._page("Register", '<div class="page registration-result-page"><div class="page-title"><h1>Register</h1></div>'
+                                   '<div class="page-body"><div class="result">Your registration completed</div></div></div>')
+        elif path == "/login":
+            self._login_form()
+        elif path == "/logout":
+            self._logout()
+        elif path == "/errorpage.htm":
+            self._error_page()
+        elif path.startswith("/images/"):
+            self._send(_PIXEL_PNG, content_type="image/png", headers={"Cache-Control": "max-age=3600"})
+        elif slug in self.state.category_slugs:
+            self._category(slug, query)
+        elif slug in self.state.by_slug:
+            self._product(self.state.by_slug[slug])
+        else:
+            self._not_found()
+
+    def do_POST(self) -> None:
+        path = urlsplit(self.path).path.rstrip("/")
+        if path == "/register":
+            self._register_post()
+        elif path == "/login":
+            self._login_post()
+        else:
+            self._not_found()
+
+
+class LocalShopServer:
+    """Threaded HTTP server for the stand-in shop. start() returns once the socket is listening."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, catalog_path: Path = CATALOG_PATH) -> None:
+        handler = type("BoundShopHandler", (ShopHandler,), {"state": ShopState(catalog_path)})
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "LocalShopServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="local-shop", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+if __name__ == "__main__":
+    server = LocalShopServer(port=int(sys.argv[1]) if len(sys.argv) > 1 else 8765)
+    print(f"Local Demo Web Shop on {server.url} (Ctrl+C to stop)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,94 @@
+"""
+Render stored page snapshots for the offline grid tests (tests/test_grid_snapshots.py).
+Fetches category pages in every sort order / page and a search results page from the stand-in shop and
+writes them, with a manifest of the grid rules each page must pass, to tests/snapshots/.
+With --site, SITE_PAGES are captured from the real shop (BASE_URL) instead and added to the manifest, so the
+rules are also checked against markup this repo did not generate.
+The origin of the server the page came from is stripped, so stored links are base-relative ("/apparel-shoes?...").
+
+    python -m local_shop.snapshots
+    python -m local_shop.snapshots --site
+"""
+import json
+import sys
+import urllib.request
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from config.settings import BASE_URL
+from local_shop.server import LocalShopServer
+
+SNAPSHOT_DIR = Path(__file__).resolve().parent.parent / "tests" / "snapshots"
+
+# orderby value -> grid rules that page must pass (besides products_displayed)
+_SORT_CHECKS = {
+    5: ["sorted_names_asc"],
+    6: ["sorted_names_desc"],
+    10: ["sorted_prices_asc"],
+    11: ["sorted_prices_desc"],
+    15: [],
+}
+PAGES = [
+    (f"apparel-shoes_orderby-{orderby}_page-{page}.html",
+     f"apparel-shoes?orderby={orderby}" + (f"&pagenumber={page}" if page > 1 else ""),
+     ["products_displayed", *checks])
+    for orderby, checks in _SORT_CHECKS.items()
+    for page in (1, 2)
+] + [
+    ("search_build.html", "search?q=Build", ["keyword:Build", "names_and_prices"]),
+]
+# Captured from the real shop with --site (file names start with "site_")
+SITE_PAGES = [
+    ("site_search_build.html", "search?q=Build", ["keyword:Build", "names_and_prices"]),
+    ("site_apparel-shoes_orderby-5_page-1.html", "apparel-shoes?orderby=5", ["products_displayed", "sorted_names_asc"]),
+    ("site_apparel-shoes_orderby-10_page-1.html", "apparel-shoes?orderby=10",
+     ["products_displayed", "sorted_prices_asc"]),
+]
+
+
+def _fetch(base_url: str, path: str) -> bytes:
+    """Page at base_url + path with the origin stripped from its links (base-relative)."""
+    request = urllib.request.Request(base_url + path, headers={"User-Agent": "qa-automation"})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        html = response.read().decode("utf-8")
+    return html.replace(base_url.rstrip("/"), "").encode("utf-8")
+
+
+def _write(out_dir: Path, base_url: str, pages: List[Tuple[str, str, List[str]]], source: str) -> List[dict]:
+    entries = []
+    for filename, path, checks in pages:
+        (out_dir / filename).write_bytes(_fetch(base_url, path))
+        entries.append({"file": filename, "path": "/" + path, "source": source, "checks": checks})
+    return entries
+
+
+def render_snapshots(out_dir: Path = SNAPSHOT_DIR, site_url: Optional[str] = None) -> Path:
+    """
+    Write every page in PAGES from the stand-in shop, or with site_url every page in SITE_PAGES from that shop,
+    and update manifest.json (entries of the other source are kept). Returns the manifest path.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / "manifest.json"
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        manifest = []
+    if site_url is not None:
+        source = "site"
+        written = _write(out_dir, site_url.rstrip("/") + "/", SITE_PAGES, source)
+    else:
+        source = "local_shop"
+        server = LocalShopServer("127.0.0.1", 0).start()
+        try:
+            written = _write(out_dir, server.url, PAGES, source)
+        finally:
+            server.stop()
+    kept = [e for e in manifest if e.get("source", "local_shop") != source]
+    manifest = sorted(kept + written, key=lambda e: e["source"] != "local_shop")  # stand-in shop pages first
+    manifest_path.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return manifest_path
+
+
+if __name__ == "__main__":
+    site = BASE_URL if "--site" in sys.argv[1:] else None
+    print(f"Snapshots written: {render_snapshots(site_url=site)}")
@@ -3,6 +3,7 @@ from selenium.webdriver.remote.webdriver import WebDriver
 
 from config.settings import BASE_URL
 from core.base_actions import BaseActions
+from core.driver_handle import load_page
 
 
 class BasePage:
@@ -10,14 +11,18 @@ class BasePage:
 
     def __init__(self, driver: WebDriver, path: str = "") -> None:
         self.driver = driver
-        self.actions = BaseActions(driver)
+        self.actions = BaseActions(driver, page=type(self).__name__)
         self._base_url = BASE_URL
         self._path = path.strip("/")
         self._url = f"{self._base_url.rstrip('/')}/{self._path}" if self._path else self._base_url
 
     def open(self) -> None:
         """Navigate to this page URL."""
-        self.driver.get(self._url)
+        self.navigate(self._url)
+
+    def navigate(self, url: str) -> None:
+        """driver.get(url), timed as a page load (core.timing). Page objects navigate only through this."""
+        load_page(self.driver, url, type(self).__name__)
 
     @property
     def current_url(self) -> str:
@@ -0,0 +1,264 @@
+"""
+Full-catalog crawl over plain HTTP (no browser): every category in the top menu (and its sub-categories),
+every page, under each orderby. Pages are fetched by a bounded thread pool; as each page arrives its grid is
+parsed (pages.product_grid) and the product records are added to a CatalogIndex. Pages 2..N of a listing are
+queued as soon as page 1 shows the pager, so listings are crawled in parallel, not one after another.
+The index then checks the listings as a whole: sort order across page boundaries, duplicates, and items that
+appear under one sort order but are missing under another. A listing with a page that failed or was skipped
+(CRAWL_MAX_PAGES) is marked incomplete; the sort and missing-item checks skip it (logged) instead of reporting
+the gap as a catalog defect.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from decimal import Decimal
+from itertools import groupby
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+from urllib.parse import parse_qs, urljoin, urlparse
+
+from config.settings import BASE_URL, CRAWL_MAX_PAGES, CRAWL_WORKERS
+from core.html_snapshot import Node, fetch_page, parse_html
+from pages.category_page import SORT_ORDERBY, category_url
+from pages.product_grid import grid_from_html, grid_prices, name_sort_validator, price_sort_validator
+
+logger = logging.getLogger(__name__)
+
+TOP_MENU_LINKS = "ul.top-menu > li > a"
+SUB_CATEGORY_LINKS = "div.sub-category-item h2 a"
+PAGER_LINKS = "div.pager a"
+GRID_CSS = "div.product-grid div.item-box"
+
+# orderby value -> (record field, descending) for the sort orders the index can verify
+SORT_KEYS: Dict[int, Tuple[str, bool]] = {
+    SORT_ORDERBY["Name: A to Z"]: ("name", False),
+    SORT_ORDERBY["Name: Z to A"]: ("name", True),
+    SORT_ORDERBY["Price: Low to High"]: ("price", False),
+    SORT_ORDERBY["Price: High to Low"]: ("price", True),
+}
+
+
+class ProductRecord(NamedTuple):
+    """One item-box seen while crawling: where it was (category, orderby, page, position) and what it showed."""
+
+    category: str
+    orderby: int
+    page: int
+    position: int
+    name: Optional[str]
+    price: Optional[Decimal]
+    href: str
+
+
+class CrawlStats(NamedTuple):
+    pages: int
+    products: int
+    seconds: float
+    errors: Tuple[str, ...]
+    skipped: Tuple[str, ...] = ()  # pages not fetched because CRAWL_MAX_PAGES was reached
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (f"{self.pages} pages, {self.products} products in {self.seconds:.1f}s "
+                f"({self.pages_per_second:.1f} pages/s, {len(self.errors)} errors, {len(self.skipped)} skipped)")
+
+
+class CatalogIndex:
+    """
+    Product records per (category, orderby) listing; add() and mark_incomplete() are thread-safe, checks run
+    after the crawl.
+    """
+
+    def __init__(self) -> None:
+        self._listings: Dict[Tuple[str, int], List[ProductRecord]] = {}
+        self.incomplete: Dict[Tuple[str, int], str] = {}  # listing -> why some of its pages are missing
+        self._lock = threading.Lock()
+
+    def add(self, records: Iterable[ProductRecord]) -> None:
+        with self._lock:
+            for record in records:
+                self._listings.setdefault((record.category, record.orderby), []).append(record)
+
+    def mark_incomplete(self, category: str, orderby: int, reason: str) -> None:
+        """A page of this listing failed or was skipped: its records are a partial view of the listing."""
+        with self._lock:
+            self.incomplete.setdefault((category, orderby), reason)
+
+    def _complete_listings(self, check: str) -> List[Tuple[str, int]]:
+        """Listing keys in order, without incomplete ones (logged: a crawl gap is not a catalog defect)."""
+        for (category, orderby), reason in sorted(self.incomplete.items()):
+            logger.warning("%s: skipping incomplete listing %s orderby=%s (%s)", check, category, orderby, reason)
+        return [key for key in sorted(self._listings) if key not in self.incomplete]
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self._listings.values())
+
+    def categories(self) -> List[str]:
+        return sorted({category for category, _ in self._listings})
+
+    def listing(self, category: str, orderby: int) -> List[ProductRecord]:
+        """Records of one listing in display order (page, then position on the page)."""
+        return sorted(self._listings.get((category, orderby), ()), key=lambda r: (r.page, r.position))
+
+    def check_sort_order(self) -> Optional[str]:
+        """
+        Every complete name/price listing is sorted across all its pages (page N's last item vs page N+1's first
+        too). Incomplete listings are skipped: a missing page would put two non-adjacent pages side by side.
+        """
+        for (category, orderby) in self._complete_listings("check_sort_order"):
+            if orderby not in SORT_KEYS:
+                continue
+            field, descending = SORT_KEYS[orderby]
+            validator = name_sort_validator(descending) if field == "name" else price_sort_validator(descending)
+            for page, records in groupby(self.listing(category, orderby), key=lambda r: r.page):
+                if validator.feed(page, (getattr(r, field) for r in records)):
+                    return f"{category} orderby={orderby}: {validator.error()}"
+        return None
+
+    def check_duplicates(self) -> Optional[str]:
+        """No product (by link) appears twice in one listing, on the same page or on different pages."""
+        for (category, orderby) in sorted(self._listings):
+            seen: Dict[str, ProductRecord] = {}
+            for record in self.listing(category, orderby):
+                first = seen.setdefault(record.href, record)
+                if first is not record:
+                    return (f"{category} orderby={orderby}: {record.name!r} on page {first.page} position "
+                            f"{first.position} and again on page {record.page} position {record.position}")
+        return None
+
+    def check_missing(self) -> Optional[str]:
+        """
+        Every sort order of a category lists the same products: none is missing from any one complete listing.
+        Products of incomplete listings still count as listed; incomplete listings are not checked for gaps.
+        """
+        complete = set(self._complete_listings("check_missing"))
+        for category in self.categories():
+            orders = sorted(orderby for cat, orderby in self._listings if cat == category)
+            hrefs = {orderby: {r.href for r in self._listings[(category, orderby)]} for orderby in orders}
+            everything: Set[str] = set().union(*hrefs.values())
+            for orderby in orders:
+                if (category, orderby) not in complete:
+                    continue
+                missing = everything - hrefs[orderby]
+                if missing:
+                    return (f"{category} orderby={orderby}: {len(missing)} product(s) listed under other sort "
+                            f"orders are missing, e.g. {sorted(missing)[:3]}")
+        return None
+
+
+def _slug(href: str) -> str:
+    return urlparse(href).path.strip("/")
+
+
+def top_menu_categories(base_url: str = BASE_URL) -> List[str]:
+    """Category slugs linked from the top menu of the home page, menu order."""
+    root = parse_html(fetch_page(base_url))
+    slugs = [_slug(link.get("href")) for link in root.select(TOP_MENU_LINKS) if link.get("href")]
+    return list(dict.fromkeys(s for s in slugs if s))
+
+
+def _page_count(root: Node) -> int:
+    """Highest pagenumber linked from the pager (the site shows a window of pages plus 'Last'); 1 without pager."""
+    pages = [1]
+    for link in root.select(PAGER_LINKS):
+        number = parse_qs(urlparse(link.get("href")).query).get("pagenumber", [""])[0]
+        if number.isdigit():
+            pages.append(int(number))
+    return max(pages)
+
+
+class _PageResult(NamedTuple):
+    category: str
+    orderby: int
+    page: int
+    records: List[ProductRecord]
+    page_count: int
+    sub_categories: List[str]
+    price_errors: List[str]
+
+
+def _crawl_page(category: str, orderby: int, page: int, page_size: Optional[int]) -> _PageResult:
+    url = category_url(category, orderby, page, page_size)
+    html = fetch_page(url)
+    root = parse_html(html)
+    grid = grid_from_html(html, GRID_CSS, url)
+    prices = grid_prices(grid)
+    records = [
+        ProductRecord(category, orderby, page, item.index + 1, item.name, price, item.href)
+        for item, price in zip(grid, prices.values)
+    ]
+    subs = [_slug(urljoin(url, a.get("href"))) for a in root.select(SUB_CATEGORY_LINKS) if a.get("href")]
+    price_errors = [f"{category} orderby={orderby} page {page} item-box[{idx}]: {reason}" for idx, reason in prices.errors]
+    return _PageResult(category, orderby, page, records, _page_count(root), subs, price_errors)
+
+
+def crawl_catalog(
+    categories: Optional[Sequence[str]] = None,
+    sorts: Sequence[int] = tuple(SORT_ORDERBY.values()),
+    workers: int = CRAWL_WORKERS,
+    page_size: Optional[int] = None,
+    max_pages: int = CRAWL_MAX_PAGES,
+) -> Tuple[CatalogIndex, CrawlStats]:
+    """
+    Crawl every page of each category (default: top menu, plus sub-categories found on the way) under each orderby,
+    with at most `workers` requests in flight. Failed pages (logged) and item-boxes without a
+    parsable price are listed in CrawlStats.errors; pages over max_pages in CrawlStats.skipped. Listings with a
+    failed or skipped page are marked incomplete in the index.
+    """
+    index = CatalogIndex()
+    errors: List[str] = []
+    skipped: List[str] = []
+    queued: Set[Tuple[str, int, int]] = set()
+    known_categories: Set[str] = set()
+    pages_done = 0
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crawl") as pool:
+        pending: Dict[Future, Tuple[str, int, int]] = {}
+
+        def submit(category: str, orderby: int, page: int) -> None:
+            key = (category, orderby, page)
+            if key in queued:
+                return
+            if len(queued) >= max_pages:
+                skipped.append(f"{category} orderby={orderby} page {page}")
+                index.mark_incomplete(category, orderby, f"page limit {max_pages} reached")
+                return
+            queued.add(key)
+            pending[pool.submit(_crawl_page, category, orderby, page, page_size)] = key
+
+        def add_category(category: str) -> None:
+            if category not in known_categories:
+                known_categories.add(category)
+                for orderby in sorts:
+                    submit(category, orderby, 1)
+
+        for category in (categories if categories is not None else top_menu_categories()):
+            add_category(category)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                category, orderby, page = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors.append(f"{category} orderby={orderby} page {page}: {e}")
+                    index.mark_incomplete(category, orderby, f"page {page} failed")
+                    logger.warning("Crawl failed for %s orderby=%s page %s: %s", category, orderby, page, e)
+                    continue
+                pages_done += 1
+                index.add(result.records)
+                errors.extend(result.price_errors)
+                if page == 1:
+                    for n in range(2, result.page_count + 1):
+                        submit(category, orderby, n)
+                    for sub in result.sub_categories:
+                        add_category(sub)
+
+    stats = CrawlStats(pages_done, len(index), time.perf_counter() - start, tuple(errors), tuple(skipped))
+    logger.info("Catalog crawl: %s", stats.summary())
+    return index, stats
@@ -1,14 +1,66 @@
 """Category page (e.g. Apparel & Shoes). Navigation, product grid, pagination, sorting."""
-from typing import List, Optional
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlencode, urlparse
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import Select
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from config.settings import BASE_URL, IMPLICIT_WAIT
+from core.sort_order import SortValidator
+from core.waits import wait_until
 from pages.base_page import BasePage
+from pages.product_consistency import check_grid_against_details
+from pages.product_grid import (
+    GridItem,
+    check_products_displayed,
+    check_sorted_names,
+    check_sorted_prices,
+    name_sort_validator,
+    price_sort_validator,
+    product_names,
+    product_prices,
+    snapshot_grid,
+)
+
+
+APPAREL_SHOES = "apparel-shoes"
+# Sort dropdown (id=products-orderby) visible text -> orderby query value
+SORT_ORDERBY: Dict[str, int] = {
+    "Position": 0,
+    "Name: A to Z": 5,
+    "Name: Z to A": 6,
+    "Price: Low to High": 10,
+    "Price: High to Low": 11,
+    "Created on": 15,
+}
+
+
+def category_url(
+    category: str = APPAREL_SHOES,
+    sort: Union[str, int, None] = None,
+    page: Optional[int] = None,
+    page_size: Optional[int] = None,
+) -> str:
+    """
+    URL of a category page in a given state: sort (dropdown text or orderby value), page number, page size.
+    Same query parameters the site's own sort dropdown and pager links use; page 1 has no pagenumber, like the pager.
+    """
+    params = {}
+    if sort is not None:
+        if isinstance(sort, str):
+            if sort not in SORT_ORDERBY:
+                raise ValueError(f"Unknown sort option {sort!r}; expected one of {list(SORT_ORDERBY)}")
+            sort = SORT_ORDERBY[sort]
+        params["orderby"] = sort
+    if page_size is not None:
+        params["pagesize"] = page_size
+    if page is not None and page > 1:
+        params["pagenumber"] = page
+    url = f"{BASE_URL.rstrip('/')}/{category.strip('/')}"
+    return f"{url}?{urlencode(params)}" if params else url
 
 
 def _full_url(href: str) -> str:
@@ -27,26 +79,43 @@ class CategoryPage(BasePage):
 
     def __init__(self, driver: WebDriver) -> None:
         super().__init__(driver, "")
+        # (field, descending, validator) of the sort order being verified page by page; reset on a new listing
+        self._sort_check: Optional[Tuple[str, bool, SortValidator]] = None
 
     def open_apparel_shoes(self) -> None:
-        """Navigate to Apparel & Shoes using link href (same tab)."""
+        """Navigate to Apparel & Shoes using link href (same tab). Needs the home page (or any page with the menu) open."""
         href = self.actions.get_attribute("category", "apparel_shoes_link", "href")
-        self.driver.get(_full_url(href))
+        self.navigate(_full_url(href))
+
+    def open_category(
+        self,
+        category: str = APPAREL_SHOES,
+        sort: Union[str, int, None] = None,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+    ) -> None:
+        """Open a category directly in the wanted sort/page state: one page load, no home page or menu/dropdown/pager clicks."""
+        self._sort_check = None
+        self.navigate(category_url(category, sort, page, page_size))
+
+    def get_grid(self) -> List[GridItem]:
+        """Snapshot of all item-boxes on the current page (one page_source call, parsed offline)."""
+        return snapshot_grid(self.actions, "category", "item_boxes")
 
     def verify_products_displayed(self) -> Optional[str]:
         """Verify product grid and that each item-box has .product-item with .picture and .details. Returns None if ok."""
         try:
-            self.actions.find_element("category", "product_grid")
-            boxes = self.actions.find_elements("category", "item_boxes")
-            if not boxes:
-                return "No product item-boxes found in product-grid."
-            for i, box in enumerate(boxes):
-                try:
-                    box.find_element(By.CSS_SELECTOR, ".product-item .picture")
-                    box.find_element(By.CSS_SELECTOR, ".product-item .details")
-                except Exception as e:
-                    return f"Item-box[{i}]: missing .product-item .picture or .details: {e}"
-            return None
+            return check_products_displayed(self.get_grid())
+        except Exception as e:
+            return str(e)
+
+    def verify_products_match_details(self) -> Optional[str]:
+        """
+        For each item-box on the current page: name and price equal the title and price on its details page (fetched
+        concurrently over HTTP and cached by URL, see pages.product_consistency). Returns None if all match.
+        """
+        try:
+            return check_grid_against_details(self.get_grid())
         except Exception as e:
             return str(e)
 
@@ -92,103 +161,88 @@ class CategoryPage(BasePage):
         """Go to next page via href (no click on link to avoid new tab)."""
         el = self.actions.find_element("category", "next_page_link")
         href = el.get_attribute("href")
-        self.driver.get(_full_url(href))
+        self.navigate(_full_url(href))
 
     def go_to_previous_page(self) -> None:
         """Go to previous page via href (no click on link)."""
         el = self.actions.find_element("category", "previous_page_link")
         href = el.get_attribute("href")
-        self.driver.get(_full_url(href))
+        self.navigate(_full_url(href))
 
     def go_to_page_2(self) -> None:
         """Go to page 2 via href of '2' link (no click on link)."""
         el = self.actions.find_element("category", "page_2_link")
         href = el.get_attribute("href")
-        self.driver.get(_full_url(href))
+        self.navigate(_full_url(href))
 
     def go_to_page_1(self) -> None:
         """Go to page 1 via href of '1' link (no click on link)."""
         el = self.actions.find_element("category", "page_1_link")
         href = el.get_attribute("href")
-        self.driver.get(_full_url(href))
+        self.navigate(_full_url(href))
 
     def select_sort_by(self, option_visible_text: str) -> None:
         """Select sort option from dropdown (id=products-orderby). Waits for page to reload after selection."""
         el = self.actions.find_element("category", "sort_dropdown")
         select = Select(el)
         select.select_by_visible_text(option_visible_text)
-        WebDriverWait(self.driver, IMPLICIT_WAIT).until(EC.url_contains("orderby"))
-        WebDriverWait(self.driver, IMPLICIT_WAIT).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div.product-grid div.item-box"))
-        )
+        self._sort_check = None
+        wait_until(self.driver, EC.url_contains("orderby"), IMPLICIT_WAIT)
+        wait_until(self.driver, EC.presence_of_element_located((By.CSS_SELECTOR, "div.product-grid div.item-box")), IMPLICIT_WAIT)
 
     def get_product_names_on_page(self) -> List[str]:
         """Get product names (h2 a text) from all item-boxes on the current page."""
-        boxes = self.actions.find_elements("category", "item_boxes")
-        names = []
-        for box in boxes:
-            try:
-                el = box.find_element(By.CSS_SELECTOR, ".product-item .details h2 a")
-                t = (el.text or "").strip()
-                if t:
-                    names.append(t)
-            except Exception:
-                pass
-        return names
-
-    def get_product_prices_on_page(self) -> List[float]:
-        """Get product prices from all item-boxes on the current page. Parses numeric span in div.add-info."""
-        boxes = self.actions.find_elements("category", "item_boxes")
-        prices = []
-        for box in boxes:
-            try:
-                add_info = box.find_element(By.CSS_SELECTOR, ".product-item .details div.add-info")
-                for span in add_info.find_elements(By.CSS_SELECTOR, "span"):
-                    t = (span.text or "").strip()
-                    if t and all(c in "0123456789." for c in t) and any(c.isdigit() for c in t):
-                        prices.append(float(t.replace(",", ".")))
-                        break
-            except Exception:
-                pass
-        return prices
+        return product_names(self.get_grid())
+
+    def get_product_prices_on_page(self) -> List[Decimal]:
+        """
+        Get product prices from all item-boxes on the current page (first parsable span in div.add-info, core.prices).
+        Raises PriceError if an item-box has no parsable price.
+        """
+        return product_prices(self.get_grid())
+
+    def _current_page_number(self) -> int:
+        """pagenumber of the current URL (page 1 has none)."""
+        number = parse_qs(urlparse(self.driver.current_url).query).get("pagenumber", ["1"])[0]
+        return int(number) if number.isdigit() else 1
+
+    def _sort_validator(self, field: str, descending: bool, page: int) -> SortValidator:
+        """
+        Validator carried over from the previous page of the same listing, so its last product is compared with this
+        page's first one. A new one starts for another sort order or when the page is not after the last one checked.
+        """
+        check = self._sort_check
+        if check is None or check[:2] != (field, descending) or page <= check[2].last_page:
+            make = name_sort_validator if field == "name" else price_sort_validator
+            check = self._sort_check = (field, descending, make(descending))
+        return check[2]
+
+    def _verify_sorted(self, field: str, descending: bool) -> Optional[str]:
+        page = self._current_page_number()
+        check = check_sorted_names if field == "name" else check_sorted_prices
+        return check(self.get_grid(), descending, self._sort_validator(field, descending, page), page)
 
     def verify_sorted_name_a_to_z(self) -> Optional[str]:
-        """Verify product names on current page are sorted A to Z (case-insensitive). Returns None if ok."""
-        names = self.get_product_names_on_page()
-        if len(names) < 2:
-            return None
-        expected = sorted(names, key=str.lower)
-        if names != expected:
-            return f"Names not A–Z sorted: got {names[:5]}... expected {expected[:5]}..."
-        return None
+        """
+        Verify product names on current page are sorted A to Z (case- and accent-insensitive), continuing from the
+        previous page checked in this listing. Returns None if ok.
+        """
+        return self._verify_sorted("name", False)
 
     def verify_sorted_name_z_to_a(self) -> Optional[str]:
-        """Verify product names on current page are sorted Z to A (case-insensitive). Returns None if ok."""
-        names = self.get_product_names_on_page()
-        if len(names) < 2:
-            return None
-        expected = sorted(names, key=str.lower, reverse=True)
-        if names != expected:
-            return f"Names not Z–A sorted: got {names[:5]}... expected {expected[:5]}..."
-        return None
+        """Same as verify_sorted_name_a_to_z, Z to A."""
+        return self._verify_sorted("name", True)
 
     def verify_sorted_price_low_to_high(self) -> Optional[str]:
-        """Verify product prices on current page are sorted low to high. Returns None if ok."""
-        prices = self.get_product_prices_on_page()
-        if len(prices) < 2:
-            return None
-        if prices != sorted(prices):
-            return f"Prices not low-to-high: got {prices[:5]}..."
-        return None
+        """
+        Verify product prices on current page are sorted low to high, continuing from the previous page checked in
+        this listing. Returns None if ok.
+        """
+        return self._verify_sorted("price", False)
 
     def verify_sorted_price_high_to_low(self) -> Optional[str]:
-        """Verify product prices on current page are sorted high to low. Returns None if ok."""
-        prices = self.get_product_prices_on_page()
-        if len(prices) < 2:
-            return None
-        if prices != sorted(prices, reverse=True):
-            return f"Prices not high-to-low: got {prices[:5]}..."
-        return None
+        """Same as verify_sorted_price_low_to_high, high to low."""
+        return self._verify_sorted("price", True)
 
     def verify_sort_created_on_applied(self) -> Optional[str]:
         """Verify 'Created on' sort is applied: URL contains orderby=15 and products are displayed."""
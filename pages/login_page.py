@@ -18,7 +18,7 @@ class LoginPage(BasePage):
 
     def open_login_page(self) -> None:
         """Navigate directly to login page."""
-        self.driver.get(f"{BASE_URL.rstrip('/')}/login")
+        self.navigate(f"{BASE_URL.rstrip('/')}/login")
 
     def fill_email(self, text: str) -> None:
         self.actions.send_keys("login", "email", text or "")
@@ -44,7 +44,11 @@ class LoginPage(BasePage):
 
     def is_logout_link_absent(self) -> bool:
         """Return True if 'Log out' link is not visible within SHORT_WAIT (use when expecting user not logged in)."""
-        return not self.actions.is_displayed("login", "logout_link", timeout=SHORT_WAIT)
+        return self.actions.is_not_displayed_within("login", "logout_link", timeout=SHORT_WAIT)
+
+    def is_logout_link_gone(self) -> bool:
+        """Return True once 'Log out' link is gone or hidden; waits up to SHORT_WAIT for it to disappear (after logout)."""
+        return self.actions.is_absent("login", "logout_link", timeout=SHORT_WAIT)
 
     def get_header_account_text(self) -> str:
         """Return text of the account link in header (usually the email when logged in)."""
@@ -0,0 +1,114 @@
+"""
+Grid vs product details consistency: for every item-box of a search or category grid, the details page behind its
+link must show the same name (h1) and price. Details pages are fetched concurrently over plain HTTP and read with
+the ProductDetailsPage locators (details_from_html), not opened one by one in the browser. Fetched pages are cached
+by URL for the whole process (details_cache), so later tests and other grids listing the same product reuse them.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from config.settings import DETAILS_FETCH_WORKERS
+from core.html_snapshot import fetch_page
+from core.prices import PriceError, price_parser
+from pages.product_details_page import DetailsSnapshot, details_from_html
+from pages.product_grid import GridItem, grid_prices
+
+logger = logging.getLogger(__name__)
+
+MAX_REPORTED = 5
+
+
+class DetailsCache:
+    """Details page snapshots by product URL, fetched at most once per process. Thread-safe."""
+
+    def __init__(self, workers: int = DETAILS_FETCH_WORKERS) -> None:
+        self.workers = workers
+        self._by_url: Dict[str, DetailsSnapshot] = {}
+        self._errors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.fetched = 0
+
+    def _fetch(self, url: str) -> None:
+        try:
+            snapshot = details_from_html(fetch_page(url), url)
+        except Exception as e:
+            logger.warning("Could not fetch product details %s: %s", url, e)
+            with self._lock:
+                self._errors[url] = str(e)
+            return
+        with self._lock:
+            self._by_url[url] = snapshot
+            self.fetched += 1
+
+    def get_many(self, urls: Iterable[str]) -> Dict[str, DetailsSnapshot]:
+        """Snapshots for all urls; the ones not cached yet are fetched concurrently. Failed URLs are left out."""
+        wanted = list(dict.fromkeys(urls))
+        with self._lock:
+            missing = [url for url in wanted if url not in self._by_url]
+            self.hits += len(wanted) - len(missing)
+            for url in missing:
+                self._errors.pop(url, None)
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(missing)), thread_name_prefix="details") as pool:
+                list(pool.map(self._fetch, missing))
+        with self._lock:
+            return {url: self._by_url[url] for url in wanted if url in self._by_url}
+
+    def error(self, url: str) -> Optional[str]:
+        """Why the last fetch of url failed, or None."""
+        return self._errors.get(url)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_url.clear()
+            self._errors.clear()
+
+
+details_cache = DetailsCache()
+
+
+def _same_name(grid_name: str, title: str) -> bool:
+    return " ".join(grid_name.split()).casefold() == " ".join(title.split()).casefold()
+
+
+def check_grid_against_details(grid: Sequence[GridItem], cache: DetailsCache = details_cache) -> Optional[str]:
+    """
+    Every item-box's name and price equal the title and price on its details page.
+    Returns None if all match, else the mismatches (up to MAX_REPORTED, with the total).
+    """
+    if not grid:
+        return "No div.item-box elements found in product-grid"
+    prices = grid_prices(grid)
+    details = cache.get_many(item.href for item in grid if item.href)
+    parser = price_parser()
+    problems: List[str] = []
+    for item, grid_price in zip(grid, prices.values):
+        where = f"item-box[{item.index}] {item.name!r}"
+        if not item.href:
+            problems.append(f"{where}: no product link")
+            continue
+        page = details.get(item.href)
+        if page is None:
+            problems.append(f"{where}: details page {item.href} could not be loaded ({cache.error(item.href)})")
+            continue
+        if page.title is None or not _same_name(item.name or "", page.title):
+            problems.append(f"{where}: details title is {page.title!r} ({item.href})")
+        try:
+            details_price = parser.parse(page.price_text or "")
+        except PriceError as e:
+            problems.append(f"{where}: details price not valid: {e} ({item.href})")
+            continue
+        # A discounted item-box shows old and actual price; the details price must be one of the grid's prices
+        shown_prices = {parser.try_parse(t) for t in item.price_texts or ()} - {None}
+        if grid_price is not None and details_price not in shown_prices:
+            problems.append(f"{where}: grid price {grid_price} but details price {details_price} ({item.href})")
+    for idx, reason in prices.errors:
+        problems.append(f"item-box[{idx}]: {reason}")
+    if not problems:
+        return None
+    shown = "; ".join(problems[:MAX_REPORTED])
+    more = f" (+{len(problems) - MAX_REPORTED} more)" if len(problems) > MAX_REPORTED else ""
+    return f"{len(problems)} grid/details mismatch(es): {shown}{more}"
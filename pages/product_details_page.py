@@ -1,11 +1,37 @@
 """Product details page. Uses BaseActions + locators from JSON."""
-from typing import Optional
+from decimal import Decimal
+from typing import NamedTuple, Optional
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from core.html_snapshot import parse_html
+from core.locators import LOCATORS
+from core.prices import PriceError, parse_price
 from pages.base_page import BasePage
 
 
+class DetailsSnapshot(NamedTuple):
+    """Title and price text of a product details page, read from its HTML (same locators as ProductDetailsPage)."""
+
+    url: str
+    title: Optional[str]
+    price_text: Optional[str]
+
+
+def details_from_html(html: str, url: str = "") -> DetailsSnapshot:
+    """
+    Read product_details.product_title / product_price (css locators) from a details page's HTML, no browser.
+    Text is what get_product_title / get_product_price would return; None where the element is missing.
+    """
+    root = parse_html(html)
+    found = []
+    for key in ("product_title", "product_price"):
+        _, css = LOCATORS[("product_details", key)]
+        node = root.select_one(css)
+        found.append(node.text if node is not None else None)
+    return DetailsSnapshot(url, *found)
+
+
 class ProductDetailsPage(BasePage):
     """Product details. All interactions via self.actions and locators.json."""
 
@@ -38,15 +64,19 @@ class ProductDetailsPage(BasePage):
         except Exception as e:
             return f"Product title check failed: {e}"
 
+    def get_product_price_value(self) -> Decimal:
+        """Product price as Decimal (core.prices). Raises PriceError if the text is not a price."""
+        return parse_price(self.get_product_price())
+
     def verify_price_valid(self) -> Optional[str]:
-        """Verify product price is non-empty and numeric (digits and dot). Returns None if ok, else error message."""
+        """Verify product price is non-empty and parses as a price (core.prices). Returns None if ok, else error message."""
         try:
             price = self.get_product_price()
-            s = (price or "").strip()
-            if not s:
+            if not (price or "").strip():
                 return "Product price is empty."
-            if not all(c.isdigit() or c == "." for c in s):
-                return f"Product price is not numeric: {price!r}"
+            parse_price(price)
             return None
+        except PriceError as e:
+            return f"Product price is not valid: {e}"
         except Exception as e:
             return f"Product price check failed: {e}"
@@ -0,0 +1,207 @@
+"""
+Product grid snapshot and rules (category and search results pages).
+The page is captured once (page_source) and every div.item-box is read from the parsed HTML
+(core.html_snapshot), so verifiers make no further WebDriver calls. The check_* rules take plain
+GridItem lists: the same rules run on a live page and on stored snapshots with no browser
+(grid_from_html on a saved .html file).
+"""
+from decimal import Decimal
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import urljoin
+
+from selenium.webdriver.common.by import By
+
+from config.settings import BASE_URL
+from core.base_actions import BaseActions
+from core.html_snapshot import Node, parse_html
+from core.prices import PriceError, PriceParser, price_parser
+from core.sort_order import SortValidator, name_collation_key
+
+
+class GridItem(NamedTuple):
+    """One div.item-box of a product grid."""
+
+    index: int
+    has_product_item: bool
+    has_picture: bool
+    has_details: bool
+    name: Optional[str]  # text of .details h2 a; None if the link is missing
+    href: str
+    price_texts: Optional[Tuple[str, ...]]  # texts of spans in div.add-info; None if add-info is missing
+    has_add_to_cart: bool
+
+
+def _grid_item(index: int, box: Node, base_url: str) -> GridItem:
+    item = box.select_one(".product-item")
+    details = item.select_one(".details") if item else None
+    link = details.select_one("h2 a") if details else None
+    add_info = details.select_one("div.add-info") if details else None
+    cart = box.select_one("input[value='Add to cart']")
+    return GridItem(
+        index=index,
+        has_product_item=item is not None,
+        has_picture=bool(item and item.select_one(".picture")),
+        has_details=details is not None,
+        name=link.text if link else None,
+        href=urljoin(base_url, link.get("href")) if link and link.get("href") else "",
+        price_texts=tuple(span.text for span in add_info.select("span")) if add_info else None,
+        has_add_to_cart=bool(cart and cart.is_visible),
+    )
+
+
+def grid_from_html(html: str, css: str = "div.product-grid div.item-box", base_url: str = BASE_URL) -> List[GridItem]:
+    """All item-boxes of a page snapshot (live page_source or a stored file). No browser needed."""
+    return [_grid_item(i, box, base_url) for i, box in enumerate(parse_html(html).select(css))]
+
+
+def snapshot_grid(actions: BaseActions, section: str, key: str) -> List[GridItem]:
+    """
+    Wait for the first item-box (section.key must be a css locator), then capture the page once and read all
+    item-boxes from it. Raises TimeoutException if no item-box appears.
+    """
+    by, value = actions.locator(section, key)
+    if by != By.CSS_SELECTOR:
+        raise ValueError(f"Grid snapshot needs a css locator, got {by!r} for {section}.{key}")
+    actions.find_element(section, key)
+    return grid_from_html(actions.page_source(), value)
+
+
+# --- rules (pure functions of a grid; None = ok, else error message) ------------------------------------------------
+
+def name_is_valid(text: str) -> bool:
+    """
+    Name must contain at least one letter; not empty/whitespace; not only digits/special chars.
+    """
+    s = (text or "").strip()
+    return len(s) > 0 and any(c.isalpha() for c in s)
+
+
+def product_names(grid: Sequence[GridItem]) -> List[str]:
+    """Product names (h2 a text) of all item-boxes that have one."""
+    return [item.name for item in grid if item.name]
+
+
+class GridPrices(NamedTuple):
+    """Price per item-box (None where there is none) and (item-box index, reason) for each of those."""
+
+    values: List[Optional[Decimal]]
+    errors: List[Tuple[int, str]]
+
+
+def grid_prices(grid: Sequence[GridItem], parser: Optional[PriceParser] = None) -> GridPrices:
+    """
+    Price of every item-box: the first span in div.add-info that parses (core.prices, PRICE_LOCALE format).
+    All span texts of the grid go through one parse_many call; item-boxes without a parsable price are reported.
+    """
+    parser = parser or price_parser()
+    owners = [i for i, item in enumerate(grid) for t in item.price_texts or () if t.strip()]
+    texts = [t for item in grid for t in item.price_texts or () if t.strip()]
+    batch = parser.parse_many(texts)
+    values: List[Optional[Decimal]] = [None] * len(grid)
+    for owner, value in zip(owners, batch.values):
+        if values[owner] is None:
+            values[owner] = value
+    reasons = {}
+    for n, _, reason in batch.errors:
+        reasons.setdefault(owners[n], reason)
+    errors = []
+    for i, item in enumerate(grid):
+        if values[i] is None:
+            if item.price_texts is None:
+                reason = "no div.add-info in .details"
+            else:
+                reason = f"no valid price in div.add-info spans ({reasons.get(i, 'no price text')}; spans: {list(item.price_texts)})"
+            errors.append((item.index, reason))
+    return GridPrices(values, errors)
+
+
+def product_prices(grid: Sequence[GridItem]) -> List[Decimal]:
+    """Price of each item-box in grid order. Raises PriceError naming every item-box without a parsable price."""
+    prices = grid_prices(grid)
+    if prices.errors:
+        raise PriceError("; ".join(f"item-box[{idx}]: {reason}" for idx, reason in prices.errors))
+    return [value for value in prices.values if value is not None]
+
+
+def check_products_displayed(grid: Sequence[GridItem]) -> Optional[str]:
+    """Grid is not empty and each item-box has .product-item with .picture and .details."""
+    if not grid:
+        return "No product item-boxes found in product-grid."
+    for item in grid:
+        if not (item.has_product_item and item.has_picture and item.has_details):
+            return f"Item-box[{item.index}]: missing .product-item .picture or .details"
+    return None
+
+
+def check_all_contain_keyword(grid: Sequence[GridItem], keyword: str) -> Optional[str]:
+    """Every item-box has .product-item, .details and an h2 > a whose text contains keyword (case-insensitive)."""
+    if len(grid) == 0:
+        return "No div.item-box elements found in product-grid"
+    for item in grid:
+        idx = item.index
+        if not item.has_product_item:
+            return f"item-box[{idx}] has no child with class 'product-item'"
+        if not item.has_details:
+            return f"item-box[{idx}] has no child with class 'details'"
+        if item.name is None:
+            return f"item-box[{idx}] has no h2 > a inside .details"
+        if keyword.lower() not in item.name.lower():
+            return f"Keyword '{keyword}' not found in product (item-box[{idx}]): '{item.name}'"
+    return None
+
+
+def check_names_and_prices(grid: Sequence[GridItem]) -> Optional[str]:
+    """Every item-box has a name with letters and a price that parses (core.prices)."""
+    if len(grid) == 0:
+        return "No div.item-box elements found in product-grid"
+    price_errors = dict(grid_prices(grid).errors)
+    for item in grid:
+        idx = item.index
+        if item.name is None:
+            return f"item-box[{idx}]: no h2 a (product name) in .details"
+        if not name_is_valid(item.name):
+            return f"item-box[{idx}]: product name must contain letters (got: {item.name!r})"
+        if idx in price_errors:
+            return f"item-box[{idx}]: {price_errors[idx]}"
+    return None
+
+
+def name_sort_validator(descending: bool = False) -> SortValidator:
+    """Streaming check of product names, A to Z (or Z to A), case- and accent-insensitive."""
+    return SortValidator(name_collation_key, descending, "Z–A sorted" if descending else "A–Z sorted")
+
+
+def price_sort_validator(descending: bool = False) -> SortValidator:
+    """Streaming check of product prices, low to high (or high to low)."""
+    return SortValidator(None, descending, "high-to-low" if descending else "low-to-high")
+
+
+def check_sorted_names(
+    grid: Sequence[GridItem], descending: bool = False, validator: Optional[SortValidator] = None, page: int = 1
+) -> Optional[str]:
+    """
+    Names are sorted A to Z (or Z to A). Pass the validator of the previous page to also check the page boundary.
+    An item-box without a name is an error, not skipped.
+    """
+    unnamed = next((item.index for item in grid if not (item.name or "").strip()), None)
+    if unnamed is not None:
+        return f"Cannot check name order on page {page}: item-box[{unnamed}]: no product name (h2 a in .details)"
+    validator = validator or name_sort_validator(descending)
+    validator.feed(page, (item.name for item in grid))
+    return validator.error()
+
+
+def check_sorted_prices(
+    grid: Sequence[GridItem], descending: bool = False, validator: Optional[SortValidator] = None, page: int = 1
+) -> Optional[str]:
+    """
+    Prices are sorted low to high (or high to low). Pass the validator of the previous page to also check the page
+    boundary. An item-box without a parsable price is an error, not skipped.
+    """
+    prices = grid_prices(grid)
+    if prices.errors:
+        idx, reason = prices.errors[0]
+        return f"Cannot check price order on page {page}: item-box[{idx}]: {reason}"
+    validator = validator or price_sort_validator(descending)
+    validator.feed(page, prices.values)
+    return validator.error()
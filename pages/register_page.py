@@ -1,14 +1,26 @@
 """Register page. Form fill and validation message helpers."""
-import json
-from pathlib import Path
+from typing import Optional
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 
-from config.settings import BASE_URL
+from config.data_loader import REGISTER_FIELDS, RegisterCase, RegisterData, get_register_data
+from config.settings import BASE_URL, IMPLICIT_WAIT, SHORT_WAIT
+from core.waits import wait_until
 from pages.base_page import BasePage
 
-_REGISTER_DATA_PATH = Path(__file__).resolve().parent.parent / "config" / "register_data.json"
+# Clears values and validation messages of the register form without reloading. False if the form is not on the page.
+_RESET_FORM_JS = """
+var button = document.getElementById('register-button');
+if (!button || !button.form) { return false; }
+var form = button.form;
+form.reset();
+if (window.jQuery && jQuery(form).data('validator')) { jQuery(form).validate().resetForm(); }
+form.querySelectorAll('span[data-valmsg-for]').forEach(function (s) { s.textContent = ''; s.className = 'field-validation-valid'; });
+form.querySelectorAll('.input-validation-error').forEach(function (el) { el.classList.remove('input-validation-error'); });
+form.querySelectorAll('.validation-summary-errors').forEach(function (el) { el.innerHTML = ''; });
+return true;
+"""
 _VALIDATION_KEYS = {
     "first_name": "validation_first_name",
     "last_name": "validation_last_name",
@@ -18,10 +30,9 @@ _VALIDATION_KEYS = {
 }
 
 
-def load_register_data() -> dict:
-    """Load register_data.json."""
-    with open(_REGISTER_DATA_PATH, encoding="utf-8") as f:
-        return json.load(f)
+def load_register_data() -> RegisterData:
+    """register_data.json, validated and loaded once per run (config.data_loader)."""
+    return get_register_data()
 
 
 class RegisterPage(BasePage):
@@ -32,7 +43,7 @@ class RegisterPage(BasePage):
 
     def open_register(self) -> None:
         """Navigate to register page."""
-        self.driver.get(f"{BASE_URL.rstrip('/')}/register")
+        self.navigate(f"{BASE_URL.rstrip('/')}/register")
 
     def fill_first_name(self, text: str) -> None:
         self.actions.send_keys("register", "first_name", text or "")
@@ -58,26 +69,55 @@ class RegisterPage(BasePage):
     def click_register(self) -> None:
         self.actions.click("register", "register_button")
 
+    def reset_form(self) -> None:
+        """Empty the form and clear validation messages in place; reopens the page only if the form is gone."""
+        if not self.actions.execute_script(_RESET_FORM_JS):
+            self.open_register()
+
+    def run_validation_case(self, case: RegisterCase) -> Optional[str]:
+        """
+        Reset the form, fill it as the case says (gender if given, valid user or empty form + overrides), submit and
+        check every expected message. Returns None if ok, else what did not match.
+        """
+        self.reset_form()
+        values = dict.fromkeys(REGISTER_FIELDS, "")
+        if case.base == "valid":
+            valid = get_register_data().valid
+            values.update(first_name=valid.first_name, last_name=valid.last_name, email=valid.email,
+                          password=valid.password, confirm_password=valid.password)
+        values.update(case.fields)
+        if case.gender:  # reset left no gender selected
+            self.actions.click("register", f"gender_{case.gender}")
+        for field, value in values.items():
+            if value:  # reset already left the field empty
+                self.actions.send_keys("register", field, value, clear_first=False)
+        self.click_register()
+        errors = []
+        for field, expected in case.expected.items():
+            message = self.get_validation_message(field)
+            if expected not in message:
+                errors.append(f"{field}: expected {expected!r}, got {message!r}")
+        return f"Case {case.id}: " + "; ".join(errors) if errors else None
+
     def get_validation_message(self, field: str) -> str:
-        """Get visible validation error text for field (first_name, last_name, email, password, confirm_password)."""
+        """Get visible validation error text for field (first_name, last_name, email, password, confirm_password).
+        Messages appear right after submit, so waits only SHORT_WAIT; returns '' if none is shown."""
         key = _VALIDATION_KEYS.get(field)
         if not key:
             return ""
         try:
-            return (self.actions.get_text("register", key) or "").strip()
+            return (self.actions.get_text("register", key, timeout=SHORT_WAIT) or "").strip()
         except Exception:
             return ""
 
     def is_registration_success(self) -> bool:
         """Return True if 'Your registration completed' message is visible (successful registration)."""
         from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.support.ui import WebDriverWait
-        from config.settings import IMPLICIT_WAIT
         try:
-            el = WebDriverWait(self.driver, IMPLICIT_WAIT).until(
-                EC.visibility_of_element_located(
-                    (By.XPATH, "//*[contains(text(), 'Your registration completed')]")
-                )
+            el = wait_until(
+                self.driver,
+                EC.visibility_of_element_located((By.XPATH, "//*[contains(text(), 'Your registration completed')]")),
+                IMPLICIT_WAIT,
             )
             return el.is_displayed()
         except Exception:
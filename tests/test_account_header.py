@@ -0,0 +1,27 @@
+"""
+Start logged in (auth cookies from the logged_in_user fixture); assert the header shows the user's email.
+Runs before test_logout in the same worker, so one of the two logs in through the UI and the other reuses the cookies.
+"""
+import pytest
+
+from pages.login_page import LoginPage
+
+
+pytestmark = [
+    pytest.mark.pa, pytest.mark.ui, pytest.mark.login, pytest.mark.order(2), pytest.mark.xdist_group("logged_in_user"),
+]
+
+
+def test_account_header_shows_email(driver, logged_in_user):
+    """Steps:
+    1. Start logged in (cached auth cookies injected; UI login only when none are cached).
+    2. Assert Log out link is visible and the header account link shows the user's email.
+    """
+    assert driver is not None, "Driver fixture should be available."
+    email = logged_in_user["email"]
+    page = LoginPage(driver)
+
+    assert page.is_logout_link_visible(), "Logged-in user should see 'Log out' in header."
+    assert email.lower() in page.get_header_account_text().lower(), (
+        f"Header account link should show the logged-in user's email ({email})."
+    )
@@ -0,0 +1,57 @@
+"""
+Full-catalog crawl (pytest --crawl): every top-menu category, every page, every sort order, fetched over HTTP.
+Extends test_pagination_flow and the test_sort_* tests (pages 1 and 2 in the browser) to whole listings.
+"""
+import pytest
+
+pytestmark = [pytest.mark.crawl]
+
+
+@pytest.mark.pagination
+def test_catalog_crawl_completes(catalog_crawl, record_property):
+    """Steps:
+    1. Crawl all categories and pages under each sort order (bounded number of concurrent requests).
+    2. Assert every page was fetched and products were found; record pages/second, pages skipped by the
+       CRAWL_MAX_PAGES limit and incomplete listings (not checked by the tests below) in the report.
+    """
+    index, stats = catalog_crawl
+    record_property("crawl_pages", stats.pages)
+    record_property("crawl_pages_per_second", round(stats.pages_per_second, 2))
+    record_property("crawl_pages_skipped", len(stats.skipped))
+    incomplete = [f"{category} orderby={orderby}: {why}" for (category, orderby), why in sorted(index.incomplete.items())]
+    record_property("crawl_incomplete_listings", incomplete)
+    assert not stats.errors, f"Crawl errors ({len(stats.errors)}): {list(stats.errors)[:5]}"
+    assert len(index) > 0, "Crawl found no products."
+
+
+@pytest.mark.sorting
+def test_catalog_sort_order_across_pages(catalog_crawl):
+    """Steps:
+    1. Take each name/price sort listing of the crawl, all pages in order.
+    2. Assert the whole listing is sorted, including across page boundaries.
+    """
+    index, _ = catalog_crawl
+    err = index.check_sort_order()
+    assert err is None, err
+
+
+@pytest.mark.pagination
+def test_catalog_no_duplicates_between_pages(catalog_crawl):
+    """Steps:
+    1. Take each listing of the crawl, all pages in order.
+    2. Assert no product appears twice (on one page or on two pages).
+    """
+    index, _ = catalog_crawl
+    err = index.check_duplicates()
+    assert err is None, err
+
+
+@pytest.mark.pagination
+def test_catalog_no_missing_items_between_sorts(catalog_crawl):
+    """Steps:
+    1. Per category, collect the products of each sort order's listing.
+    2. Assert every sort order lists the same products (none lost between pages).
+    """
+    index, _ = catalog_crawl
+    err = index.check_missing()
+    assert err is None, err
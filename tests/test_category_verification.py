@@ -5,7 +5,7 @@ import pytest
 
 from pages.category_page import CategoryPage
 
-pytestmark = [pytest.mark.order(3)]
+pytestmark = [pytest.mark.order(3), pytest.mark.start_on_home]
 
 
 @pytest.mark.pa
@@ -0,0 +1,48 @@
+"""
+Test: every product in a grid matches its details page (name and price).
+test_open_product_details_from_search opens only the first result in the browser; here all details pages are fetched
+concurrently over HTTP and cached by URL for the session, so the check takes one page load plus a few requests.
+"""
+import pytest
+
+from pages.category_page import CategoryPage
+from pages.home_page import HomePage
+from pages.search_results_page import SearchResultsPage
+
+pytestmark = [pytest.mark.order(3)]
+
+
+@pytest.mark.pa
+@pytest.mark.ui
+@pytest.mark.search
+@pytest.mark.product_validation
+@pytest.mark.start_on_home
+def test_search_results_match_details(driver):
+    """Steps:
+    1. Search for Build.
+    2. For each result, fetch its details page; assert the title and price equal the result's name and price.
+    """
+    assert driver is not None, "Driver fixture should be available."
+    home = HomePage(driver)
+    home.search_build()
+
+    results = SearchResultsPage(driver)
+    err = results.verify_results_match_details()
+    assert err is None, err or "Each search result should match its product details page."
+
+
+@pytest.mark.pa
+@pytest.mark.ui
+@pytest.mark.category_verification
+@pytest.mark.product_validation
+def test_category_products_match_details(driver):
+    """Steps:
+    1. Open Apparel & Shoes (direct URL), sorted by name.
+    2. For each product on page 1, fetch its details page; assert the title and price equal the grid's name and price.
+    """
+    assert driver is not None, "Driver fixture should be available."
+    category = CategoryPage(driver)
+    category.open_category(sort="Name: A to Z")
+
+    err = category.verify_products_match_details()
+    assert err is None, err or "Each product in the category grid should match its product details page."
@@ -0,0 +1,116 @@
+"""
+Grid rules on stored page snapshots (tests/snapshots/, written by `python -m local_shop.snapshots`).
+No browser: each stored page is parsed and checked with the same rules the live sort/search tests use.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from pages.product_grid import (
+    check_all_contain_keyword,
+    check_names_and_prices,
+    check_products_displayed,
+    check_sorted_names,
+    check_sorted_prices,
+    grid_from_html,
+    name_sort_validator,
+    price_sort_validator,
+)
+
+pytestmark = [pytest.mark.offline]
+
+SNAPSHOT_DIR = Path(__file__).resolve().parent / "snapshots"
+MANIFEST = json.loads((SNAPSHOT_DIR / "manifest.json").read_text(encoding="utf-8"))
+
+CHECKS = {
+    "products_displayed": check_products_displayed,
+    "names_and_prices": check_names_and_prices,
+    "sorted_names_asc": check_sorted_names,
+    "sorted_names_desc": lambda grid: check_sorted_names(grid, descending=True),
+    "sorted_prices_asc": check_sorted_prices,
+    "sorted_prices_desc": lambda grid: check_sorted_prices(grid, descending=True),
+}
+
+
+def _run_check(name, grid):
+    """'keyword:<word>' or a CHECKS name."""
+    if name.startswith("keyword:"):
+        return check_all_contain_keyword(grid, name.split(":", 1)[1])
+    return CHECKS[name](grid)
+
+
+def _grid(filename):
+    return grid_from_html((SNAPSHOT_DIR / filename).read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("entry", MANIFEST, ids=[e["file"] for e in MANIFEST])
+def test_grid_snapshot(entry):
+    """Steps:
+    1. Parse the stored page and read its product grid.
+    2. Assert every rule listed for the page in manifest.json passes.
+    """
+    grid = _grid(entry["file"])
+    for name in entry["checks"]:
+        err = _run_check(name, grid)
+        assert err is None, f"{entry['file']} ({entry['path']}): {err}"
+
+
+@pytest.mark.parametrize("filename, rule", [
+    ("apparel-shoes_orderby-5_page-1.html", "sorted_names_desc"),
+    ("apparel-shoes_orderby-6_page-1.html", "sorted_names_asc"),
+    ("apparel-shoes_orderby-10_page-1.html", "sorted_prices_desc"),
+    ("apparel-shoes_orderby-11_page-1.html", "sorted_prices_asc"),
+])
+def test_grid_snapshot_wrong_order_is_reported(filename, rule):
+    """Steps:
+    1. Parse a stored page sorted one way.
+    2. Assert the rule for the opposite order reports an error (the rules can fail).
+    """
+    assert CHECKS[rule](_grid(filename)) is not None, f"{rule} should fail on {filename}"
+
+
+SORTED_PAGES = [
+    (5, check_sorted_names, name_sort_validator, False),
+    (6, check_sorted_names, name_sort_validator, True),
+    (10, check_sorted_prices, price_sort_validator, False),
+    (11, check_sorted_prices, price_sort_validator, True),
+]
+
+
+@pytest.mark.parametrize("orderby, check, make_validator, descending", SORTED_PAGES, ids=[str(o) for o, *_ in SORTED_PAGES])
+def test_grid_snapshot_sort_continues_across_pages(orderby, check, make_validator, descending):
+    """Steps:
+    1. Check page 1 of a stored sorted listing, then page 2 with the same validator.
+    2. Assert both pass: page 2 starts where page 1 ended (the boundary pair is checked).
+    3. Feed the pages the other way round (page 2 as first page); assert the boundary violation is reported.
+    """
+    page_1 = _grid(f"apparel-shoes_orderby-{orderby}_page-1.html")
+    page_2 = _grid(f"apparel-shoes_orderby-{orderby}_page-2.html")
+    validator = make_validator(descending)
+    assert check(page_1, descending, validator, 1) is None
+    assert check(page_2, descending, validator, 2) is None
+
+    swapped = make_validator(descending)
+    assert check(page_2, descending, swapped, 1) is None
+    err = check(page_1, descending, swapped, 2)
+    assert err is not None and "page 2 position 1" in err, err
+
+
+def test_grid_snapshot_missing_keyword_is_reported():
+    """Steps:
+    1. Parse the stored 'Build' search results.
+    2. Assert the keyword rule reports an error for a word not in the product names.
+    """
+    err = check_all_contain_keyword(_grid("search_build.html"), "Sneaker")
+    assert err is not None and "Sneaker" in err
+
+
+def test_grid_snapshot_unnamed_item_is_reported():
+    """Steps:
+    1. Parse a stored name-sorted page and remove the name of the third item-box.
+    2. Assert the name order rule reports that item-box instead of skipping it.
+    """
+    broken = [item._replace(name=None) if item.index == 2 else item for item in _grid("apparel-shoes_orderby-5_page-1.html")]
+    err = check_sorted_names(broken)
+    assert err is not None and "item-box[2]" in err, err
@@ -0,0 +1,33 @@
+"""
+Snapshot parser (core.html_snapshot) on markup with end tags left out and on selector lists. No browser.
+"""
+import pytest
+
+from core.html_snapshot import parse_html
+
+pytestmark = [pytest.mark.offline]
+
+
+@pytest.mark.parametrize("html, selector, expected", [
+    ('<div class="a"><p>x<p>y</div>', "div.a > p", ["x", "y"]),
+    ("<p>x<div>y</div>", "p", ["x"]),
+    ("<ul><li>1<li>2<ul><li>2a<li>2b</ul><li>3</ul>", "ul > li", ["1", "2 2a 2b", "2a", "2b", "3"]),
+    ("<table><tr><td>a<td>b<tr><td>c</table>", "tr", ["a b", "c"]),
+    ("<select><option>o1<option>o2</select>", "option", ["o1", "o2"]),
+    ("<dl><dt>t<dd>d<dt>u</dl>", "dl > *", ["t", "d", "u"]),
+])
+def test_implied_end_tags(html, selector, expected):
+    """Steps:
+    1. Parse markup that leaves out end tags the way HTML allows (p, li, td/tr, option, dt/dd).
+    2. Assert the selector finds sibling elements, not each one nested in the previous.
+    """
+    assert [node.text for node in parse_html(html).select(selector)] == expected
+
+
+def test_selector_list_keeps_commas_in_attribute_values():
+    """Steps:
+    1. Parse two links and select with a list whose first selector has a comma inside a quoted value.
+    2. Assert both selectors of the list match (the comma in quotes does not split the list).
+    """
+    root = parse_html('<a title="Sort by: name, price">x</a><b>y</b>')
+    assert [node.text for node in root.select('a[title="Sort by: name, price"], b')] == ["x", "y"]
@@ -1,28 +1,23 @@
 """
-Login with credentials from last successful registration; assert user is on home with email and Log out visible.
+Login with an account provisioned over HTTP (user_pool); assert user is on home with email and Log out visible.
 """
 import pytest
 
-from core.registered_user import load_registered_user
 from pages.login_page import LoginPage
 
 
 pytestmark = [pytest.mark.pa, pytest.mark.ui, pytest.mark.login, pytest.mark.order(2)]
 
 
-def test_login_success(driver):
+def test_login_success(driver, provisioned_user):
     """Steps:
-    1. Load saved credentials from last successful registration.
+    1. Check out an existing account from the user pool.
     2. Open login and submit email and password.
     3. Assert Log out link is visible and header shows user email (user is on home).
     """
     assert driver is not None, "Driver fixture should be available."
-    try:
-        creds = load_registered_user()
-    except FileNotFoundError:
-        pytest.skip("No saved registered user. Run test_register_success first (registration tests must run before login).")
-    email = creds["email"]
-    password = creds["password"]
+    email = provisioned_user["email"]
+    password = provisioned_user["password"]
 
     page = LoginPage(driver)
     page.login_with(email, password)
@@ -1,34 +1,30 @@
 """
-Login with saved registered user, then click Log out; assert user is logged out (Log in link visible again).
+Start logged in (auth cookies from the logged_in_user fixture), then click Log out; assert user is logged out (Log in link visible again).
 """
 import pytest
 
-from core.registered_user import load_registered_user
 from pages.login_page import LoginPage
 
 
-pytestmark = [pytest.mark.pa, pytest.mark.ui, pytest.mark.login, pytest.mark.order(2)]
+pytestmark = [
+    pytest.mark.pa, pytest.mark.ui, pytest.mark.login, pytest.mark.order(2), pytest.mark.xdist_group("logged_in_user"),
+]
 
 
-def test_logout(driver):
+def test_logout(driver, logged_in_user):
     """Steps:
-    1. Load saved credentials; login.
+    1. Start logged in (cached auth cookies injected; UI login only when none are cached).
     2. Assert Log out link is visible (user is logged in).
     3. Click Log out.
     4. Assert Log out is not visible and Log in link is visible again.
     """
     assert driver is not None, "Driver fixture should be available."
-    try:
-        creds = load_registered_user()
-    except FileNotFoundError:
-        pytest.skip("No saved registered user. Run test_register_success first.")
     page = LoginPage(driver)
-    page.login_with(creds["email"], creds["password"])
     assert page.is_logout_link_visible(), "Precondition: user must be logged in before logout."
 
     page.actions.click("login", "logout_link")
 
-    assert page.is_logout_link_absent(), "After logout, 'Log out' link should not be visible."
+    assert page.is_logout_link_gone(), "After logout, 'Log out' link should not be visible."
     assert page.actions.is_displayed("login", "login_link"), (
         "After logout, 'Log in' link should be visible again in header."
     )
@@ -8,7 +8,7 @@ from pages.home_page import HomePage
 from pages.product_details_page import ProductDetailsPage
 from pages.search_results_page import SearchResultsPage
 
-pytestmark = [pytest.mark.order(3)]
+pytestmark = [pytest.mark.order(3), pytest.mark.start_on_home]
 
 
 @pytest.mark.pa
@@ -13,7 +13,7 @@ pytestmark = [pytest.mark.order(3)]
 @pytest.mark.pagination
 def test_pagination_flow(driver):
     """Steps:
-    1. Open Apparel & Shoes; assert page 1, products, pager, Next visible.
+    1. Open Apparel & Shoes (direct URL); assert page 1, products, pager, Next visible.
     2. Click Next; assert page 2, Previous visible, products displayed.
     3. Click Previous; assert page 1, products displayed.
     4. Go to page 2 via page number link; assert page 2.
@@ -21,7 +21,7 @@ def test_pagination_flow(driver):
     """
     assert driver is not None, "Driver fixture should be available."
     category = CategoryPage(driver)
-    category.open_apparel_shoes()
+    category.open_category()
 
     err = category.verify_products_displayed()
     assert err is None, err or "Products should be displayed on page 1."
@@ -0,0 +1,54 @@
+"""
+Price parsing (core.prices) on storefront formats, and grid price reporting on a stored snapshot. No browser.
+"""
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from core.prices import PriceError, parse_price
+from pages.product_grid import check_names_and_prices, grid_from_html, grid_prices
+
+pytestmark = [pytest.mark.offline]
+
+SNAPSHOT = Path(__file__).resolve().parent / "snapshots" / "search_build.html"
+
+
+@pytest.mark.parametrize("text, locale, expected", [
+    ("800.00", "en-US", Decimal("800.00")),
+    ("$1,299.00", "en-US", Decimal("1299.00")),
+    ("USD 25", "en-US", Decimal("25")),
+    ("1.299,00 €", "de-DE", Decimal("1299.00")),
+    ("1 299,50 kr", "sv-SE", Decimal("1299.50")),
+    ("CHF 1'299.00", "de-CH", Decimal("1299.00")),
+])
+def test_parse_price_formats(text, locale, expected):
+    """Steps:
+    1. Parse a price as the storefront of the locale prints it.
+    2. Assert the Decimal value (currency and thousands separators removed).
+    """
+    assert parse_price(text, locale) == expected
+
+
+@pytest.mark.parametrize("text, locale", [("", "en-US"), ("Call us", "en-US"), ("1,29", "en-US"), ("$5 USD", "en-US"), ("1.29", "de-DE")])
+def test_parse_price_rejects(text, locale):
+    """Steps:
+    1. Parse text that is not a price in the locale's format.
+    2. Assert PriceError is raised.
+    """
+    with pytest.raises(PriceError):
+        parse_price(text, locale)
+
+
+def test_grid_prices_reports_unparsable_item():
+    """Steps:
+    1. Parse the stored search results and break the price of the second item-box.
+    2. Assert the batch returns the other prices and names that item-box with the reason; the grid rule fails on it.
+    """
+    grid = grid_from_html(SNAPSHOT.read_text(encoding="utf-8"))
+    broken = [item._replace(price_texts=("Call for price",)) if item.index == 1 else item for item in grid]
+    prices = grid_prices(broken)
+    assert prices.values[1] is None and all(v is not None for i, v in enumerate(prices.values) if i != 1)
+    assert [idx for idx, _ in prices.errors] == [1]
+    err = check_names_and_prices(broken)
+    assert err is not None and err.startswith("item-box[1]"), err
@@ -22,16 +22,16 @@ def test_register_forbidden_characters(driver):
     """
     assert driver is not None, "Driver fixture should be available."
     data = load_register_data()
-    valid = data["valid"]
-    forbidden = data.get("forbidden_chars_name", "<script>alert(1)</script>")
+    valid = data.valid
+    forbidden = data.forbidden_chars_name
 
     page = RegisterPage(driver)
     page.open_register()
     page.fill_first_name(forbidden)
-    page.fill_last_name(valid["last_name"])
-    page.fill_email(valid["email"])
-    page.fill_password(valid["password"])
-    page.fill_confirm_password(valid["password"])
+    page.fill_last_name(valid.last_name)
+    page.fill_email(valid.email)
+    page.fill_password(valid.password)
+    page.fill_confirm_password(valid.password)
     page.click_register()
 
     if page.is_internal_error_page():
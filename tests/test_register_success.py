@@ -1,13 +1,12 @@
 """
 Register: fill all fields with valid data from register_data.json; assert registration completed.
-Saves email and password to output/last_registered_user.json for login tests.
+Only UI coverage of the register form; login tests use accounts created over HTTP (core.provisioning).
 Uses a unique email per run (timestamp) so we never hit 'already registered' when re-running tests.
 """
 import time
 
 import pytest
 
-from core.registered_user import save_registered_user
 from pages.register_page import RegisterPage, load_register_data
 
 pytestmark = [pytest.mark.order(1)]
@@ -21,25 +20,23 @@ def test_register_success(driver):
     1. Open register page; select gender; fill all fields with valid data (unique email per run).
     2. Click Register.
     3. Assert 'Your registration completed' message is displayed.
-    4. Save email and password to output for login tests.
     """
     assert driver is not None, "Driver fixture should be available."
     data = load_register_data()
-    valid = data["valid"]
+    valid = data.valid
     # Unique email every run so we avoid "already registered" when tests are run multiple times
     unique_email = f"test.{time.time_ns()}@example.com"
 
     page = RegisterPage(driver)
     page.open_register()
     page.select_gender_female()
-    page.fill_first_name(valid["first_name"])
-    page.fill_last_name(valid["last_name"])
+    page.fill_first_name(valid.first_name)
+    page.fill_last_name(valid.last_name)
     page.fill_email(unique_email)
-    page.fill_password(valid["password"])
-    page.fill_confirm_password(valid["password"])
+    page.fill_password(valid.password)
+    page.fill_confirm_password(valid.password)
     page.click_register()
 
     assert page.is_registration_success(), (
         "Expected 'Your registration completed' message after valid registration."
     )
-    save_registered_user(unique_email, valid["password"])
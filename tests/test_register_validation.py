@@ -0,0 +1,25 @@
+"""
+Register form validation cases from register_data.json (validation_cases), one test item per case.
+All cases run back-to-back on one register page; the form is reset in place between them, not reloaded.
+"""
+import pytest
+
+from pages.register_page import load_register_data
+
+pytestmark = [pytest.mark.order(1), pytest.mark.xdist_group("register_validation")]
+
+CASES = load_register_data().validation_cases
+
+
+@pytest.mark.pa
+@pytest.mark.ui
+@pytest.mark.register
+@pytest.mark.parametrize("case", CASES, ids=[case.id for case in CASES])
+def test_register_validation(register_form, case):
+    """Steps:
+    1. Reset the register form (reopen only if it is gone).
+    2. Fill fields for the case (valid user or empty form, with the case's overrides); click Register.
+    3. Assert each expected validation message is shown.
+    """
+    err = register_form.run_validation_case(case)
+    assert err is None, err
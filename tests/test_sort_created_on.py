@@ -13,13 +13,13 @@ pytestmark = [pytest.mark.order(3)]
 @pytest.mark.sorting
 def test_sort_created_on(driver):
     """Steps:
-    1. Open Apparel & Shoes; select sort 'Created on'.
+    1. Open Apparel & Shoes (direct URL); select sort 'Created on'.
     2. Assert sort is applied (URL/product list) and products displayed on page 1.
     3. Go to page 2; assert products displayed and sort applied on page 2.
     """
     assert driver is not None, "Driver fixture should be available."
     category = CategoryPage(driver)
-    category.open_apparel_shoes()
+    category.open_category()
     category.select_sort_by("Created on")
 
     err = category.verify_sort_created_on_applied()
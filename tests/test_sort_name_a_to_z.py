@@ -1,5 +1,5 @@
 """
-Sort products by Name: A to Z. Verify order on page 1 and page 2.
+Sort products by Name: A to Z. Verify order on page 1 and page 2, across the page boundary too.
 """
 import pytest
 
@@ -13,13 +13,14 @@ pytestmark = [pytest.mark.order(3)]
 @pytest.mark.sorting
 def test_sort_name_a_to_z(driver):
     """Steps:
-    1. Open Apparel & Shoes; select sort 'Name: A to Z'.
+    1. Open Apparel & Shoes (direct URL); select sort 'Name: A to Z'.
     2. Assert products on page 1 are sorted A to Z.
-    3. Go to page 2; assert products on page 2 are sorted A to Z.
+    3. Go to page 2; assert products on page 2 are sorted A to Z,
+       continuing from the last product of page 1 (the page boundary is checked too).
     """
     assert driver is not None, "Driver fixture should be available."
     category = CategoryPage(driver)
-    category.open_apparel_shoes()
+    category.open_category()
     category.select_sort_by("Name: A to Z")
 
     err = category.verify_sorted_name_a_to_z()
@@ -1,5 +1,5 @@
 """
-Sort products by Name: Z to A. Verify order on page 1 and page 2.
+Sort products by Name: Z to A. Verify order on page 1 and page 2, across the page boundary too.
 """
 import pytest
 
@@ -13,13 +13,14 @@ pytestmark = [pytest.mark.order(3)]
 @pytest.mark.sorting
 def test_sort_name_z_to_a(driver):
     """Steps:
-    1. Open Apparel & Shoes; select sort 'Name: Z to A'.
+    1. Open Apparel & Shoes (direct URL); select sort 'Name: Z to A'.
     2. Assert products on page 1 are sorted Z to A.
-    3. Go to page 2; assert products on page 2 are sorted Z to A.
+    3. Go to page 2; assert products on page 2 are sorted Z to A,
+       continuing from the last product of page 1 (the page boundary is checked too).
     """
     assert driver is not None, "Driver fixture should be available."
     category = CategoryPage(driver)
-    category.open_apparel_shoes()
+    category.open_category()
     category.select_sort_by("Name: Z to A")
 
     err = category.verify_sorted_name_z_to_a()
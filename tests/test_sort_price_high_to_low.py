@@ -1,5 +1,5 @@
 """
-Sort products by Price: High to Low. Verify order on page 1 and page 2.
+Sort products by Price: High to Low. Verify order on page 1 and page 2, across the page boundary too.
 """
 import pytest
 
@@ -13,13 +13,14 @@ pytestmark = [pytest.mark.order(3)]
 @pytest.mark.sorting
 def test_sort_price_high_to_low(driver):
     """Steps:
-    1. Open Apparel & Shoes; select sort 'Price: High to Low'.
+    1. Open Apparel & Shoes (direct URL); select sort 'Price: High to Low'.
     2. Assert products on page 1 are sorted by price descending.
-    3. Go to page 2; assert products on page 2 are sorted by price descending.
+    3. Go to page 2; assert products on page 2 are sorted by price descending,
+       continuing from the last product of page 1 (the page boundary is checked too).
     """
     assert driver is not None, "Driver fixture should be available."
     category = CategoryPage(driver)
-    category.open_apparel_shoes()
+    category.open_category()
     category.select_sort_by("Price: High to Low")
 
     err = category.verify_sorted_price_high_to_low()
@@ -1,5 +1,5 @@
 """
-Sort products by Price: Low to High. Verify order on page 1 and page 2.
+Sort products by Price: Low to High. Verify order on page 1 and page 2, across the page boundary too.
 """
 import pytest
 
@@ -13,13 +13,14 @@ pytestmark = [pytest.mark.order(3)]
 @pytest.mark.sorting
 def test_sort_price_low_to_high(driver):
     """Steps:
-    1. Open Apparel & Shoes; select sort 'Price: Low to High'.
+    1. Open Apparel & Shoes (direct URL); select sort 'Price: Low to High'.
     2. Assert products on page 1 are sorted by price ascending.
-    3. Go to page 2; assert products on page 2 are sorted by price ascending.
+    3. Go to page 2; assert products on page 2 are sorted by price ascending,
+       continuing from the last product of page 1 (the page boundary is checked too).
     """
     assert driver is not None, "Driver fixture should be available."
     category = CategoryPage(driver)
-    category.open_apparel_shoes()
+    category.open_category()
     category.select_sort_by("Price: Low to High")
 
     err = category.verify_sorted_price_low_to_high()
@@ -7,7 +7,7 @@ import pytest
 from pages.home_page import HomePage
 from pages.search_results_page import SearchResultsPage
 
-pytestmark = [pytest.mark.order(3)]
+pytestmark = [pytest.mark.order(3), pytest.mark.start_on_home]
 
 
 @pytest.mark.pa